@@ -0,0 +1,31 @@
+from .carga import ResultadoCarga, executar_carga
+from .catalogo import Cenario, carregar_catalogo
+from .configuracao import CONFIG, url_endpoint
+from .histograma import Histograma
+from .historico import Historico
+from .malha_aberta import ResultadoTaxaConstante, executar_taxa_constante
+from .motor import Amostra, ResultadoCenario, executar_cenario
+from .prometheus import AmostraMetrica, LeitorExposicao, texto_exposicao
+from .registro import RegistroCSV
+from .regressao import LIMIAR_REGRESSAO_RAPIDO
+
+__all__ = [
+    "Amostra",
+    "ResultadoCenario",
+    "executar_cenario",
+    "RegistroCSV",
+    "CONFIG",
+    "url_endpoint",
+    "Cenario",
+    "carregar_catalogo",
+    "ResultadoCarga",
+    "executar_carga",
+    "Histograma",
+    "Historico",
+    "LIMIAR_REGRESSAO_RAPIDO",
+    "ResultadoTaxaConstante",
+    "executar_taxa_constante",
+    "AmostraMetrica",
+    "LeitorExposicao",
+    "texto_exposicao",
+]
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+
+from .configuracao import CONFIG
+from .historico import registrar_resultado
+from .motor import TIMEOUT_PADRAO, executar_cenario, formatar_aquecimento, nova_sessao
+
+
+# ===============================================================
+# RESULTADO
+# ===============================================================
+@dataclass
+class ComparacaoCache:
+    """Um cenário medido duas vezes: parâmetros fixos (cache aquecendo) e perturbados (sempre frio)."""
+    cenario: object  # Cenario do catálogo
+    com_cache: object  # ResultadoCenario
+    sem_cache: object  # ResultadoCenario
+
+    @property
+    def dependencia(self):
+        """Regime sem cache sobre regime com cache (1.0 = o cache não ajuda)."""
+        if not self.com_cache.regime or not self.sem_cache.regime:
+            return None
+        return self.sem_cache.regime / self.com_cache.regime
+
+
+@dataclass
+class ResultadoAquecimento:
+    repeticoes: int
+    comparacoes: list = field(default_factory=list)
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def executar_aquecimento(cenarios, repeticoes=None, timeout=TIMEOUT_PADRAO):
+    """Mede cada cenário com os parâmetros do catálogo e depois com quebra de cache.
+
+    A primeira rodada mostra a primeira requisição (fria), o regime e a curva
+    de aquecimento como o usuário os vê; a segunda repete o cenário com
+    ``perturbar_parametros`` a cada tentativa, de modo que o regime dela é a
+    latência sem ajuda do cache. A razão entre os dois regimes diz quanto do
+    desempenho do endpoint depende do cache do servidor. As duas rodadas vão
+    para o histórico (modo "aquecimento").
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado")
+    repeticoes = repeticoes or CONFIG.repeticoes
+    if repeticoes < 2:
+        raise ValueError("São necessárias ao menos 2 repetições para separar frio e regime")
+
+    resultado = ResultadoAquecimento(repeticoes)
+    sessao = nova_sessao()
+    try:
+        for c in cenarios:
+            medicoes = [
+                executar_cenario(sessao, c.url, c.params, c.descricao, c.status_esperado, validar=c.validar,
+                                 repeticoes=repeticoes, timeout=timeout, validar_item=c.validar_item,
+                                 quebrar_cache=quebrar)
+                for quebrar in (False, True)
+            ]
+            for r in medicoes:
+                registrar_resultado(r, "aquecimento")
+            resultado.comparacoes.append(ComparacaoCache(c, *medicoes))
+    finally:
+        sessao.close()
+
+    _imprimir(resultado)
+    return resultado
+
+
+def _imprimir(resultado):
+    print(f"\n📈 Cache frio x aquecido ({resultado.repeticoes} tentativa(s) por rodada)")
+    for comp in resultado.comparacoes:
+        print(f"➡️ {comp.cenario.chave}")
+        for rotulo, r in (("com cache", comp.com_cache), ("sem cache", comp.sem_cache)):
+            print(f"   {rotulo}: {formatar_aquecimento(r) if r.regime else 'sem amostras suficientes'}")
+        if comp.dependencia is not None:
+            print(f"   regime sem cache / com cache: {comp.dependencia:.2f}×")
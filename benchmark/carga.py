@@ -0,0 +1,120 @@
+import contextlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .metricas import anexar_ao_resultado, coletor_para
+from .motor import TIMEOUT_PADRAO, Amostra, ResultadoCenario, formatar_percentis, medir_requisicao, nova_sessao
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+USUARIOS_PADRAO = 4
+RODADAS_PADRAO = 5
+
+
+# ===============================================================
+# RESULTADO DE UMA EXECUÇÃO DE CARGA
+# ===============================================================
+@dataclass
+class ResultadoCarga:
+    usuarios: int
+    duracao: float
+    cenarios: dict = field(default_factory=dict)
+    servidor: dict = field(default_factory=dict)  # endpoint -> MetricasServidor da execução inteira
+    serie_servidor: dict = field(default_factory=dict)  # endpoint -> [(instante, MetricasServidor do intervalo)]
+
+    @property
+    def total_requisicoes(self):
+        return sum(len(r.amostras) for r in self.cenarios.values())
+
+    @property
+    def total_erros(self):
+        return sum(
+            1 for r in self.cenarios.values() for a in r.amostras if a.status != r.status_esperado
+        )
+
+    @property
+    def vazao(self):
+        return self.total_requisicoes / self.duracao if self.duracao > 0 else 0.0
+
+    def vazao_cenario(self, chave):
+        return len(self.cenarios[chave].amostras) / self.duracao if self.duracao > 0 else 0.0
+
+
+# ===============================================================
+# USUÁRIO VIRTUAL
+# ===============================================================
+def _usuario_virtual(indice, cenarios, rodadas, fim, timeout):
+    """Percorre a lista de cenários em laço fechado com uma sessão própria.
+
+    Cada usuário começa em um cenário diferente para que a contenção não fique
+    concentrada num único endpoint no início da execução.
+    """
+    sessao = nova_sessao()
+    amostras = []
+    passo = 0
+    try:
+        while True:
+            if fim is not None:
+                if time.perf_counter() >= fim:
+                    break
+            elif passo >= rodadas * len(cenarios):
+                break
+
+            cenario = cenarios[(indice + passo) % len(cenarios)]
+            passo += 1
+            resp, duracao = medir_requisicao(sessao, cenario.url, cenario.params, timeout, tolerar_falhas=True)
+            status = resp.status_code if resp is not None else None
+            amostras.append((cenario, Amostra(passo, status, duracao)))
+    finally:
+        sessao.close()
+    return amostras
+
+
+# ===============================================================
+# EXECUÇÃO DA CARGA
+# ===============================================================
+def executar_carga(cenarios, usuarios=USUARIOS_PADRAO, rodadas=RODADAS_PADRAO, duracao=None,
+                   timeout=TIMEOUT_PADRAO, intervalo_metricas=None):
+    """Repete os cenários com ``usuarios`` usuários virtuais simultâneos.
+
+    Sem ``duracao`` cada usuário percorre a lista ``rodadas`` vezes; com
+    ``duracao`` (segundos) os usuários repetem a lista até o prazo acabar. Com
+    ``intervalo_metricas`` o /metricas é lido a cada tantos segundos durante a
+    carga (ver ``ResultadoCarga.servidor`` e ``serie_servidor``).
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+
+    print(f"\n=== Carga: {len(cenarios)} cenário(s), {usuarios} usuário(s) virtuais ===")
+
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    inicio = time.perf_counter()
+    fim = inicio + duracao if duracao else None
+    with coletor or contextlib.nullcontext(), ThreadPoolExecutor(max_workers=usuarios) as executor:
+        futuros = [
+            executor.submit(_usuario_virtual, i, cenarios, rodadas, fim, timeout)
+            for i in range(usuarios)
+        ]
+        coletado = [f.result() for f in futuros]
+    resultado = ResultadoCarga(usuarios, time.perf_counter() - inicio)
+
+    for amostras in coletado:
+        for cenario, amostra in amostras:
+            if cenario.chave not in resultado.cenarios:
+                resultado.cenarios[cenario.chave] = ResultadoCenario(
+                    cenario.descricao, cenario.params, cenario.status_esperado, url=cenario.url
+                )
+            resultado.cenarios[cenario.chave].amostras.append(amostra)
+
+    for chave, r in resultado.cenarios.items():
+        print(f"➡️ {chave}: {len(r.amostras)} req | {resultado.vazao_cenario(chave):.2f} req/s | "
+              f"Média: {r.media:.3f}s | Mínimo: {r.minimo:.3f}s | Máximo: {r.maximo:.3f}s")
+        print(f"   {formatar_percentis(r.percentis())}")
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s), {resultado.total_erros} erro(s)")
+
+    return resultado
@@ -0,0 +1,164 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .configuracao import CONFIG, url_endpoint
+from .historico import registrar_resultado
+from .motor import TIMEOUT_PADRAO, Amostra, ResultadoCenario, formatar_percentis, medir_requisicao, nova_sessao
+
+# ===============================================================
+# PÁGINAS DECLARADAS
+# ===============================================================
+# Um carregamento de página dispara todas as chamadas ao mesmo tempo, como o
+# front-end ao abrir a tela; o usuário espera até a mais lenta voltar.
+@dataclass
+class Chamada:
+    nome: str
+    caminho: str  # endpoint (ex.: /analise_energia/dashboard-operacional)
+    params: dict = field(default_factory=dict)
+    status_esperado: int = 200
+
+
+@dataclass
+class Pagina:
+    nome: str
+    chamadas: list
+
+
+PAGINAS = {
+    "operacoes": Pagina("Página de operações", [
+        Chamada("Painel de energia", "/analise_energia/dashboard-operacional"),
+        Chamada("Painel de temperatura e umidade", "/analise_medidores_temp_hum/dashboard-operacional"),
+        Chamada("Status dos medidores", "/analise_medidores_temp_hum/status-medidores"),
+        Chamada("Top consumidores", "/analise_energia/top-consumidores", {"top_n": 10}),
+        Chamada("Anomalias detectadas", "/analise_energia/anomalias-detectadas"),
+    ]),
+}
+
+
+# ===============================================================
+# RESULTADO
+# ===============================================================
+@dataclass
+class Carregamento:
+    """Uma abertura da página: para cada chamada, ``(início relativo, duração, status)``."""
+    chamadas: list
+
+    @property
+    def fins(self):
+        return [inicio + duracao for inicio, duracao, _ in self.chamadas]
+
+    @property
+    def composto(self):
+        """Do disparo da página até a última resposta."""
+        return max(self.fins)
+
+    @property
+    def critica(self):
+        """Índice da chamada que terminou por último (o caminho crítico)."""
+        fins = self.fins
+        return fins.index(max(fins))
+
+    def sem(self, i):
+        """Tempo composto se a chamada ``i`` fosse instantânea (ainda limitado pelo disparo dela)."""
+        outros = [fim for j, fim in enumerate(self.fins) if j != i]
+        return max(outros + [self.chamadas[i][0]])
+
+
+@dataclass
+class ResultadoCarregamento:
+    pagina: Pagina
+    carregamentos: list = field(default_factory=list)
+
+    @property
+    def compostos(self):
+        return [c.composto for c in self.carregamentos]
+
+    def fracao_critica(self, i):
+        """Fração dos carregamentos em que a chamada ``i`` foi a última a voltar."""
+        return sum(1 for c in self.carregamentos if c.critica == i) / len(self.carregamentos)
+
+    def ganho_potencial(self, i):
+        """Mediana do que o carregamento encurtaria se a chamada ``i`` fosse instantânea."""
+        return statistics.median(c.composto - c.sem(i) for c in self.carregamentos)
+
+    def folga(self, i):
+        """Mediana de quanto a chamada ``i`` termina antes da página (0 quando é a crítica)."""
+        return statistics.median(c.composto - c.fins[i] for c in self.carregamentos)
+
+    def paralelismo(self):
+        """Soma das durações sobre o tempo composto, na mediana (1 = chamadas em série)."""
+        return statistics.median(sum(d for _, d, _ in c.chamadas) / c.composto for c in self.carregamentos)
+
+    def cenario_composto(self):
+        r = ResultadoCenario(f"{self.pagina.nome} (composto)", {}, 200, url=CONFIG.url_base)
+        for n, c in enumerate(self.carregamentos, 1):
+            # o status do composto é o da primeira chamada que falhou, ou 200
+            falhas = (s for (_, _, s), ch in zip(c.chamadas, self.pagina.chamadas) if s != ch.status_esperado)
+            r.amostras.append(Amostra(n, next(falhas, 200), c.composto))
+        return r
+
+    def cenario_chamada(self, i):
+        ch = self.pagina.chamadas[i]
+        r = ResultadoCenario(f"{self.pagina.nome}: {ch.nome}", ch.params, ch.status_esperado,
+                             url=url_endpoint(ch.caminho))
+        r.amostras = [Amostra(n, c.chamadas[i][2], c.chamadas[i][1]) for n, c in enumerate(self.carregamentos, 1)]
+        return r
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def executar_carregamento(pagina, repeticoes=None, timeout=TIMEOUT_PADRAO):
+    """Abre a página ``repeticoes`` vezes, em sequência, disparando as chamadas em paralelo.
+
+    Cada chamada tem sua própria sessão, mantida entre as repetições, como as
+    conexões persistentes de um navegador. O composto e cada chamada vão para
+    o histórico (modo "pagina").
+    """
+    repeticoes = repeticoes or CONFIG.repeticoes
+    urls = [url_endpoint(ch.caminho) for ch in pagina.chamadas]
+    sessoes = [nova_sessao() for _ in pagina.chamadas]
+    resultado = ResultadoCarregamento(pagina)
+
+    def disparar(i, inicio_pagina):
+        inicio = time.perf_counter() - inicio_pagina
+        resp, duracao = medir_requisicao(sessoes[i], urls[i], pagina.chamadas[i].params, timeout,
+                                         tolerar_falhas=True)
+        return inicio, duracao, resp.status_code if resp is not None else None
+
+    print(f"\n=== Carregamento: {pagina.nome} | {len(pagina.chamadas)} chamada(s) em paralelo | "
+          f"{repeticoes} repetição(ões) ===")
+    try:
+        with ThreadPoolExecutor(max_workers=len(pagina.chamadas)) as executor:
+            for _ in range(repeticoes):
+                inicio_pagina = time.perf_counter()
+                futuros = [executor.submit(disparar, i, inicio_pagina) for i in range(len(pagina.chamadas))]
+                resultado.carregamentos.append(Carregamento([f.result() for f in futuros]))
+    finally:
+        for s in sessoes:
+            s.close()
+
+    _imprimir(resultado)
+    registrar_resultado(resultado.cenario_composto(), "pagina")
+    for i in range(len(pagina.chamadas)):
+        registrar_resultado(resultado.cenario_chamada(i), "pagina")
+    return resultado
+
+
+def _imprimir(resultado):
+    composto = resultado.cenario_composto()
+    print(f"⏱️ Composto: mediana {statistics.median(resultado.compostos):.3f}s | "
+          f"{formatar_percentis(composto.percentis())}")
+    ordem = sorted(range(len(resultado.pagina.chamadas)), key=resultado.fracao_critica, reverse=True)
+    for i in ordem:
+        ch = resultado.pagina.chamadas[i]
+        r = resultado.cenario_chamada(i)
+        icone = "✅" if r.sucesso else "❌"
+        print(f"{icone} {ch.nome}: mediana {statistics.median(r.tempos):.3f}s | "
+              f"crítica em {resultado.fracao_critica(i):.0%} | folga {resultado.folga(i):.3f}s | "
+              f"ganho se instantânea {resultado.ganho_potencial(i):.3f}s")
+    dominante = resultado.pagina.chamadas[ordem[0]]
+    print(f"\n📈 Caminho crítico dominado por {dominante.nome} ({resultado.fracao_critica(ordem[0]):.0%}); "
+          f"paralelismo efetivo {resultado.paralelismo():.1f}×")
@@ -0,0 +1,86 @@
+import importlib.util
+import os
+from dataclasses import dataclass
+
+from .historico import endpoint_da_url
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRETORIOS_TESTE = ["default", "energia", "temperatura_e_humidade"]
+
+
+# ===============================================================
+# ESTRUTURAS DO CATÁLOGO
+# ===============================================================
+@dataclass
+class Cenario:
+    modulo: str
+    url: str
+    params: dict
+    descricao: str
+    status_esperado: int
+    validar: object = None
+    validar_item: object = None
+    arquivo_csv: str = None
+    limite_tempo_medio: float = None
+    indice: int = None  # posição na lista ``cenarios`` do módulo
+
+    @property
+    def chave(self):
+        return f"{self.modulo}::{self.descricao}"
+
+
+def _importar(caminho):
+    nome = "catalogo_" + os.path.relpath(caminho, RAIZ).replace(os.sep, "_")[:-3]
+    spec = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def listar_modulos():
+    """Caminhos relativos (ex.: ``energia/test_consumo_temporal.py``) de todos os módulos de teste."""
+    modulos = []
+    for diretorio in DIRETORIOS_TESTE:
+        for arquivo in sorted(os.listdir(os.path.join(RAIZ, diretorio))):
+            if arquivo.startswith("test_") and arquivo.endswith(".py"):
+                modulos.append(f"{diretorio}/{arquivo}")
+    return modulos
+
+
+def carregar_cenarios(modulo):
+    """Lê a lista ``cenarios`` de um módulo de teste sem executar o pytest."""
+    mod = _importar(os.path.join(RAIZ, modulo))
+    return [
+        Cenario(
+            modulo, mod.BASE_URL, params, descricao, status_esperado,
+            validar=getattr(mod, "validar_resposta", None),
+            validar_item=getattr(mod, "validar_item", None),
+            arquivo_csv=getattr(mod, "ARQUIVO_CSV", None),
+            limite_tempo_medio=getattr(mod, "LIMITE_TEMPO_MEDIO", None),
+            indice=indice,
+        )
+        for indice, (params, descricao, status_esperado) in enumerate(mod.cenarios)
+    ]
+
+
+def carregar_catalogo(modulos=None, descricoes=None):
+    """Cenários de todos os módulos (ou só dos informados), opcionalmente filtrados por descrição."""
+    cenarios = []
+    for modulo in modulos or listar_modulos():
+        cenarios.extend(carregar_cenarios(modulo))
+    if descricoes:
+        cenarios = [c for c in cenarios if c.descricao in descricoes]
+    return cenarios
+
+
+def carregar_limiares(modulos=None):
+    """Razão de medianas tolerada por endpoint, dos módulos que definem ``LIMIAR_REGRESSAO``."""
+    limiares = {}
+    for modulo in modulos or listar_modulos():
+        mod = _importar(os.path.join(RAIZ, modulo))
+        if hasattr(mod, "LIMIAR_REGRESSAO"):
+            limiares[endpoint_da_url(mod.BASE_URL)] = mod.LIMIAR_REGRESSAO
+    return limiares
@@ -0,0 +1,657 @@
+import argparse
+import os
+import threading
+
+from .aquecimento import executar_aquecimento
+from .carga import RODADAS_PADRAO, USUARIOS_PADRAO
+from .carregamento import PAGINAS, executar_carregamento
+from .catalogo import carregar_catalogo, carregar_limiares
+from .cliente_async import CARGA_POR_CLIENTE, CLIENTES, TAXA_POR_CLIENTE
+from .configuracao import AMBIENTES, CONFIG
+from .distribuido import PORTA_GERADOR, PROCESSOS_PADRAO, executar_distribuido, servir
+from .historico import Historico
+from .malha_aberta import MAX_EM_VOO_PADRAO, ResultadoTaxaConstante
+from .histograma import Histograma
+from .mistura import MODELO_PADRAO, carregar_modelo, executar_mistura
+from .motor import TIMEOUT_PADRAO, formatar_percentis
+from .paginacao import ENDPOINT_PAGINADO, TAMANHO_PAGINA_PADRAO, paginar
+from .paralelo import TRABALHADORES_PADRAO, executar_paralelo
+from .regressao import ALFA_PADRAO, comparar_com_referencia, relatorio
+from .registro import (
+    gravar_aquecimento, gravar_carga, gravar_carregamento, gravar_distribuido, gravar_paginacao, gravar_resistencia,
+    gravar_saturacao, gravar_taxa_constante, gravar_varredura,
+)
+from .resistencia import INTERVALO_AMOSTRAGEM_PADRAO, INTERVALO_BALDE_PADRAO, executar_resistencia
+from .saturacao import DURACAO_DEGRAU_PADRAO, NIVEIS_PADRAO, executar_saturacao
+from .servidor_local import ConfiguracaoDados, DadosSinteticos, ServidorLocal
+from .varredura import (
+    ENDPOINTS_LIMIT, ENDPOINTS_MEDIDORES, ENDPOINTS_PERIODO, JANELAS_DIAS, LIMITES, TAMANHOS_MEDIDORES,
+    executar_varredura_limit, executar_varredura_medidores, executar_varredura_periodo,
+)
+
+
+def _nome_execucao(modulos):
+    if not modulos:
+        return "suite"
+    if len(modulos) == 1:
+        diretorio, arquivo = os.path.split(modulos[0])
+        return f"{os.path.basename(diretorio)}_{arquivo[len('test_'):-len('.py')]}"
+    return "multiplos"
+
+
+def _selecionar_ambiente(args):
+    """Aplica --ambiente/--base-url/--servidor-local antes de carregar o catálogo.
+
+    Devolve o servidor local iniciado (ou None); quem chama deve pará-lo.
+    """
+    CONFIG.selecionar_ambiente(args.ambiente, args.base_url)
+    if args.historico is not None:
+        CONFIG.historico = args.historico
+    if args.metricas_servidor:
+        CONFIG.metricas_servidor = True
+    if not args.servidor_local:
+        return None
+    servidor = ServidorLocal().iniciar()
+    CONFIG.selecionar_ambiente("local", servidor.url)
+    return servidor
+
+
+def _intervalo_metricas(args):
+    return args.intervalo_metricas if args.metricas_servidor else None
+
+
+# ===============================================================
+# SUBCOMANDO: carga
+# ===============================================================
+def _comando_carga(args):
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = CARGA_POR_CLIENTE[args.cliente](
+        cenarios, usuarios=args.usuarios, rodadas=args.rodadas, duracao=args.duracao, timeout=args.timeout,
+        intervalo_metricas=_intervalo_metricas(args),
+    )
+    caminho = args.csv or f"csv/carga/{_nome_execucao(args.modulos)}_carga_resultados.csv"
+    gravar_carga(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if resultado.total_erros == 0 else 1
+
+
+# ===============================================================
+# SUBCOMANDO: taxa
+# ===============================================================
+def _comando_taxa(args):
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = TAXA_POR_CLIENTE[args.cliente](
+        cenarios, args.taxa, args.duracao, max_em_voo=args.max_em_voo, timeout=args.timeout,
+        intervalo_metricas=_intervalo_metricas(args),
+    )
+    caminho = args.csv or f"csv/carga/{_nome_execucao(args.modulos)}_taxa_constante_resultados.csv"
+    gravar_taxa_constante(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if resultado.total_erros == 0 else 1
+
+
+# ===============================================================
+# SUBCOMANDO: saturacao
+# ===============================================================
+def _comando_saturacao(args):
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = executar_saturacao(cenarios, args.niveis, args.duracao_degrau, cliente=args.cliente,
+                                   timeout=args.timeout, intervalo_metricas=_intervalo_metricas(args))
+    caminho = args.csv or f"csv/carga/{_nome_execucao(args.modulos)}_saturacao_resultados.csv"
+    gravar_saturacao(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0
+
+
+# ===============================================================
+# SUBCOMANDO: resistencia
+# ===============================================================
+def _segundos(texto):
+    """Duração em segundos; aceita os sufixos s, m e h (ex.: 90s, 30m, 6h)."""
+    fatores = {"s": 1, "m": 60, "h": 3600}
+    try:
+        if texto[-1:].lower() in fatores:
+            return float(texto[:-1]) * fatores[texto[-1].lower()]
+        return float(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Duração inválida: {texto!r} (ex.: 90, 30m, 6h)") from None
+
+
+def _par(texto, formato):
+    """``(CHAVE, valor)`` de um argumento ``CHAVE=NÚMERO``."""
+    chave, separador, valor = texto.rpartition("=")
+    try:
+        if not separador:
+            raise ValueError
+        return chave, float(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Esperado {formato}: {texto!r}") from None
+
+
+def _peso(texto):
+    trecho, peso = _par(texto, "TRECHO=PESO")
+    if peso < 0:
+        raise argparse.ArgumentTypeError(f"Peso negativo: {texto!r}")
+    return trecho, peso
+
+
+def _pesos(cenarios, regras):
+    """Peso de cada cenário: o da última regra ``(trecho, peso)`` cujo trecho aparece na chave, ou 1."""
+    regras = list(regras or [])
+    return [next((peso for trecho, peso in reversed(regras) if trecho in c.chave), 1.0) for c in cenarios]
+
+
+def _comando_resistencia(args):
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = executar_resistencia(
+        cenarios, args.duracao, _pesos(cenarios, args.peso), usuarios=args.usuarios,
+        intervalo_balde=args.intervalo_balde, intervalo_amostragem=args.intervalo_amostragem, timeout=args.timeout,
+        semente=args.semente,
+    )
+    caminho = args.csv or f"csv/carga/{_nome_execucao(args.modulos)}_resistencia_resultados.csv"
+    gravar_resistencia(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    derivas = [d for d in resultado.derivas() if d.sinalizada]
+    return 0 if resultado.total_erros == 0 and not derivas else 1
+
+
+# ===============================================================
+# SUBCOMANDO: mistura
+# ===============================================================
+def _comando_mistura(args):
+    modelo = carregar_modelo(args.modelo) if args.modelo else MODELO_PADRAO
+    resultado = executar_mistura(
+        modelo, args.duracao, usuarios=args.usuarios, escala=args.escala, max_em_voo=args.max_em_voo,
+        timeout=args.timeout, semente=args.semente, intervalo_metricas=_intervalo_metricas(args),
+    )
+    caminho = args.csv or "csv/carga/mistura_resultados.csv"
+    if isinstance(resultado, ResultadoTaxaConstante):
+        gravar_taxa_constante(caminho, resultado)
+    else:
+        gravar_carga(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if resultado.total_erros == 0 else 1
+
+
+# ===============================================================
+# SUBCOMANDO: carregamento
+# ===============================================================
+def _comando_carregamento(args):
+    resultado = executar_carregamento(PAGINAS[args.pagina], args.repeticoes, args.timeout)
+    caminho = args.csv or f"csv/carregamento/{args.pagina}_resultados.csv"
+    gravar_carregamento(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if resultado.cenario_composto().sucesso else 1
+
+
+# ===============================================================
+# SUBCOMANDOS: distribuido e gerador
+# ===============================================================
+def _comando_distribuido(args):
+    resultado = executar_distribuido(
+        args.modulos, args.cenario, processos=args.processos, remotos=args.remoto or (), usuarios=args.usuarios,
+        rodadas=args.rodadas, duracao=args.duracao, taxa=args.taxa, max_em_voo=args.max_em_voo,
+        cliente=args.cliente, timeout=args.timeout, intervalo_metricas=_intervalo_metricas(args),
+    )
+    caminho = args.csv or f"csv/carga/{_nome_execucao(args.modulos)}_distribuido_resultados.csv"
+    gravar_distribuido(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if resultado.total_erros == 0 else 1
+
+
+def _comando_gerador(args):
+    CONFIG.selecionar_ambiente(args.ambiente, args.base_url)
+    try:
+        servir(args.host, args.porta, expor=args.expor)
+    except ValueError as erro:
+        print(f"❌ {erro}")
+        return 1
+    return 0
+
+
+# ===============================================================
+# SUBCOMANDO: paralelo
+# ===============================================================
+def _comando_paralelo(args):
+    if args.quebrar_cache:
+        CONFIG.quebrar_cache = True
+    for opcao in ("precisao", "orcamento", "percentil_alvo"):
+        if getattr(args, opcao) is not None:
+            setattr(CONFIG, opcao, getattr(args, opcao))
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = executar_paralelo(cenarios, args.trabalhadores, args.repeticoes, args.timeout)
+    for cenario, _, erro in resultado.falhas:
+        print(f"❌ {cenario.chave}" + (f"\n{erro}" if erro else ""))
+    return 0 if not resultado.falhas else 1
+
+
+# ===============================================================
+# SUBCOMANDO: aquecimento
+# ===============================================================
+def _comando_aquecimento(args):
+    cenarios = carregar_catalogo(args.modulos, args.cenario)
+    resultado = executar_aquecimento(cenarios, args.repeticoes, args.timeout)
+    caminho = args.csv or f"csv/aquecimento/{_nome_execucao(args.modulos)}_aquecimento_resultados.csv"
+    gravar_aquecimento(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if all(c.com_cache.sucesso and c.sem_cache.sucesso for c in resultado.comparacoes) else 1
+
+
+# ===============================================================
+# SUBCOMANDO: varredura
+# ===============================================================
+ENDPOINTS_POR_DIMENSAO = {"periodo": ENDPOINTS_PERIODO, "medidores": ENDPOINTS_MEDIDORES, "limit": ENDPOINTS_LIMIT}
+
+
+def _comando_varredura(args):
+    if args.dimensao == "medidores":
+        resultado = executar_varredura_medidores(args.endpoint, args.valores or TAMANHOS_MEDIDORES,
+                                                 args.repeticoes, args.timeout)
+    elif args.dimensao == "limit":
+        resultado = executar_varredura_limit(args.endpoint, args.valores or LIMITES, args.repeticoes, args.timeout)
+    else:
+        resultado = executar_varredura_periodo(args.endpoint, args.valores or JANELAS_DIAS,
+                                               args.repeticoes, args.timeout)
+    caminho = args.csv or f"csv/varredura/{args.dimensao}_resultados.csv"
+    gravar_varredura(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if all(p.resultado.sucesso for p in resultado.pontos) else 1
+
+
+# ===============================================================
+# SUBCOMANDO: paginar
+# ===============================================================
+def _parametros(pares):
+    """``chave=valor`` repetidos; a mesma chave mais de uma vez vira lista (ex.: medidor_ids)."""
+    params = {}
+    for par in pares or []:
+        chave, _, valor = par.partition("=")
+        if chave in params:
+            anterior = params[chave]
+            params[chave] = (anterior if isinstance(anterior, list) else [anterior]) + [valor]
+        else:
+            params[chave] = valor
+    return params
+
+
+def _comando_paginar(args):
+    resultado = paginar(args.endpoint, _parametros(args.param), args.limit, args.paralelo, args.max_paginas,
+                        args.timeout)
+    caminho = args.csv or f"csv/paginacao/{args.endpoint.strip('/').replace('/', '_')}_paginas.csv"
+    gravar_paginacao(caminho, resultado)
+    print(f"Resultados gravados em {caminho}")
+    return 0 if not resultado.erros else 1
+
+
+# ===============================================================
+# SUBCOMANDO: servidor
+# ===============================================================
+def _comando_servidor(args):
+    config = ConfiguracaoDados(
+        medidores_energia=args.medidores_energia,
+        medidores_temperatura=args.medidores_temperatura,
+        dias=args.dias,
+        leituras_por_hora=args.leituras_por_hora,
+        semente=args.semente,
+    )
+    print(f"Gerando base sintética: {config}")
+    dados = DadosSinteticos(config)
+    print(f"  {dados.total_leituras_energia:,} leituras de energia | "
+          f"{dados.total_leituras_temperatura:,} leituras de temperatura")
+    if args.aquecer:
+        threading.Thread(target=dados.aquecer, daemon=True).start()
+    servidor = ServidorLocal(dados, args.host, args.porta)
+    print(f"Servidor local em {servidor.url} (Ctrl+C para encerrar)")
+    try:
+        servidor.servir_para_sempre()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+# ===============================================================
+# SUBCOMANDO: historico
+# ===============================================================
+def _abrir_historico(caminho):
+    if not os.path.exists(caminho):
+        print(f"Histórico não encontrado: {caminho}")
+        return None
+    return Historico(caminho)
+
+
+def _comando_historico(args):
+    historico = _abrir_historico(args.banco)
+    if historico is None:
+        return 1
+    try:
+        if args.marcar_base:
+            id_execucao = args.marcar_base
+            if id_execucao == "ultima":
+                execucoes = historico.execucoes(args.ambiente, 1)
+                id_execucao = execucoes[0][0].id if execucoes else None
+            try:
+                execucao = historico.marcar_base(id_execucao)
+            except ValueError as erro:
+                print(f"❌ {erro}")
+                return 1
+            print(f"Linha de base do ambiente {execucao.ambiente}: {execucao.id} ({execucao.git_commit})")
+        elif args.endpoint:
+            serie = historico.tendencia(args.endpoint, args.cenario, args.ambiente, args.limite)
+            print(f"Tendência — {args.endpoint} :: {args.cenario}")
+            for (id_execucao, inicio, commit, ambiente), duracoes in serie:
+                h = Histograma()
+                for d in duracoes:
+                    h.registrar(d)
+                print(f"  {inicio} {id_execucao} {commit} [{ambiente}] n={h.total} "
+                      f"média {h.media:.3f}s | {formatar_percentis(h.percentis_confiaveis())}")
+        else:
+            for execucao, amostras in historico.execucoes(args.ambiente, args.limite):
+                print(f"  {execucao.inicio} {execucao.id} {execucao.git_commit} "
+                      f"[{execucao.ambiente}] {execucao.modo} — {amostras} amostra(s)")
+    finally:
+        historico.fechar()
+    return 0
+
+
+# ===============================================================
+# SUBCOMANDO: comparar
+# ===============================================================
+def _limiar(texto):
+    endpoint, razao = _par(texto, "ENDPOINT=RAZAO")
+    if razao <= 0:
+        raise argparse.ArgumentTypeError(f"Razão deve ser positiva: {texto!r}")
+    return endpoint, razao
+
+
+def _limiares(regras):
+    return {**carregar_limiares(), **dict(regras or [])}
+
+
+def _comando_comparar(args):
+    historico = _abrir_historico(args.banco)
+    if historico is None:
+        return 1
+    try:
+        id_atual = args.atual
+        if id_atual is None:
+            execucoes = historico.execucoes(args.ambiente, 1, args.modo)
+            if not execucoes:
+                print("Nenhuma execução no histórico")
+                return 1
+            id_atual = execucoes[0][0].id
+        try:
+            id_base, comparacoes = comparar_com_referencia(
+                historico, id_atual, args.base, _limiares(args.limiar), args.alfa
+            )
+        except ValueError as erro:
+            print(f"❌ {erro}")
+            atual = historico.execucao(id_atual)
+            if args.base == "base" and atual is not None and historico.base(atual.ambiente) is None:
+                print("   Marque uma com: python -m benchmark historico --marcar-base <ID|ultima>")
+            return 1
+        print(f"Comparando {id_atual} com {id_base}")
+        for linha in relatorio(comparacoes, args.todos):
+            print(linha)
+    finally:
+        historico.fechar()
+    return 1 if any(c.regressao for c in comparacoes) else 0
+
+
+def _argumentos_comuns(parser):
+    parser.add_argument("modulos", nargs="*",
+                        help="Módulos de teste (ex.: energia/test_consumo_temporal.py). Padrão: todos")
+    parser.add_argument("--cenario", action="append",
+                        help="Descrição do cenário a executar (pode repetir). Padrão: todos")
+    _argumentos_ambiente(parser)
+
+
+def _argumentos_ambiente(parser):
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_PADRAO, help="Timeout por requisição (s)")
+    parser.add_argument("--ambiente", choices=list(AMBIENTES),
+                        help="Perfil de ambiente da API (padrão: BENCH_AMBIENTE ou dev)")
+    parser.add_argument("--base-url", help="URL base da API; tem precedência sobre o perfil")
+    parser.add_argument("--servidor-local", action="store_true",
+                        help="Sobe o servidor sintético em processo e executa contra ele")
+    parser.add_argument("--historico", help="Banco SQLite do histórico ('' desliga). Padrão: BENCH_HISTORICO")
+    parser.add_argument("--metricas-servidor", action="store_true",
+                        help="Lê /metricas da API e anexa o tempo medido no servidor aos resultados")
+
+
+def _argumento_cliente(parser):
+    parser.add_argument("--cliente", choices=CLIENTES, default="requests",
+                        help="Backend HTTP: 'requests' (uma thread por usuário/requisição em voo) ou "
+                             "'async' (asyncio, milhares de requisições em voo num só processo)")
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark dos endpoints da API")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    carga = sub.add_parser("carga", help="Repete os cenários com usuários virtuais simultâneos")
+    _argumentos_comuns(carga)
+    carga.add_argument("-u", "--usuarios", type=int, default=USUARIOS_PADRAO, help="Usuários virtuais simultâneos")
+    carga.add_argument("--rodadas", type=int, default=RODADAS_PADRAO,
+                       help="Vezes que cada usuário percorre a lista de cenários")
+    carga.add_argument("--duracao", type=float, help="Duração da carga em segundos (substitui --rodadas)")
+    carga.add_argument("--csv", help="Arquivo CSV de saída")
+    carga.add_argument("--intervalo-metricas", type=float, default=1.0,
+                      help="Segundos entre leituras do /metricas durante a carga (com --metricas-servidor)")
+    _argumento_cliente(carga)
+    carga.set_defaults(func=_comando_carga)
+
+    taxa = sub.add_parser("taxa", help="Malha aberta: dispara requisições a uma taxa constante")
+    _argumentos_comuns(taxa)
+    taxa.add_argument("--taxa", type=float, required=True, help="Taxa alvo de chegada (req/s)")
+    taxa.add_argument("--duracao", type=float, default=60, help="Duração em segundos")
+    taxa.add_argument("--max-em-voo", type=int, default=MAX_EM_VOO_PADRAO,
+                      help="Máximo de requisições simultâneas do cliente")
+    taxa.add_argument("--csv", help="Arquivo CSV de saída")
+    taxa.add_argument("--intervalo-metricas", type=float, default=1.0,
+                      help="Segundos entre leituras do /metricas durante a carga (com --metricas-servidor)")
+    _argumento_cliente(taxa)
+    taxa.set_defaults(func=_comando_taxa)
+
+    saturacao = sub.add_parser("saturacao", help="Sobe a concorrência em degraus e encontra o ponto de saturação")
+    _argumentos_comuns(saturacao)
+    saturacao.add_argument("--niveis", type=int, nargs="+", default=list(NIVEIS_PADRAO),
+                           help=f"Usuários virtuais de cada degrau (padrão: {' '.join(map(str, NIVEIS_PADRAO))})")
+    saturacao.add_argument("--duracao-degrau", type=float, default=DURACAO_DEGRAU_PADRAO,
+                           help="Segundos em cada degrau")
+    saturacao.add_argument("--csv", help="Arquivo CSV de saída (uma linha por degrau)")
+    saturacao.add_argument("--intervalo-metricas", type=float, default=1.0,
+                           help="Segundos entre leituras do /metricas em cada degrau (com --metricas-servidor)")
+    _argumento_cliente(saturacao)
+    saturacao.set_defaults(func=_comando_saturacao)
+
+    resistencia = sub.add_parser("resistencia",
+                                 help="Mistura ponderada de cenários por horas, com detecção de deriva")
+    _argumentos_comuns(resistencia)
+    resistencia.add_argument("--duracao", type=_segundos, required=True, help="Duração (ex.: 3600, 30m, 6h)")
+    resistencia.add_argument("-u", "--usuarios", type=int, default=USUARIOS_PADRAO,
+                             help="Usuários virtuais simultâneos")
+    resistencia.add_argument("--peso", action="append", type=_peso, metavar="TRECHO=PESO",
+                             help="Peso dos cenários cuja chave (módulo::descrição) contém TRECHO; padrão 1 "
+                                  "(pode repetir; a última regra que casar vale)")
+    resistencia.add_argument("--intervalo-balde", type=float, default=INTERVALO_BALDE_PADRAO,
+                             help="Segundos por balde de latência no relatório")
+    resistencia.add_argument("--intervalo-amostragem", type=float, default=INTERVALO_AMOSTRAGEM_PADRAO,
+                             help="Segundos entre leituras de /metricas e /health/detailed")
+    resistencia.add_argument("--semente", type=int, help="Semente do sorteio dos cenários (reprodutível)")
+    resistencia.add_argument("--csv", help="Arquivo CSV de saída (mais <arquivo>_deriva.csv e <arquivo>_saude.csv)")
+    resistencia.set_defaults(func=_comando_resistencia)
+
+    mistura = sub.add_parser("mistura", help="Tráfego segundo um modelo ponderado de fluxos do catálogo")
+    _argumentos_ambiente(mistura)
+    mistura.add_argument("--modelo", metavar="ARQUIVO.py",
+                         help="Arquivo Python que define MODELO (um ModeloTrafego). Padrão: benchmark.mistura")
+    mistura.add_argument("--duracao", type=_segundos, default=60.0, help="Duração (ex.: 120, 10m)")
+    mistura.add_argument("-u", "--usuarios", type=int,
+                         help="Laço fechado com tantos usuários e tempo de pensar (padrão: malha aberta)")
+    mistura.add_argument("--escala", type=float, default=1.0,
+                         help="Multiplica as taxas do modelo (malha aberta)")
+    mistura.add_argument("--max-em-voo", type=int, default=MAX_EM_VOO_PADRAO,
+                         help="Máximo de requisições simultâneas do cliente (malha aberta)")
+    mistura.add_argument("--semente", type=int, help="Semente dos sorteios (reprodutível)")
+    mistura.add_argument("--csv", help="Arquivo CSV de saída")
+    mistura.add_argument("--intervalo-metricas", type=float, default=1.0,
+                         help="Segundos entre leituras do /metricas durante a carga (com --metricas-servidor)")
+    mistura.set_defaults(func=_comando_mistura)
+
+    carregamento = sub.add_parser("carregamento",
+                                  help="Abre uma página: dispara suas chamadas em paralelo e mede o tempo composto")
+    _argumentos_ambiente(carregamento)
+    carregamento.add_argument("--pagina", choices=list(PAGINAS), default="operacoes", help="Página declarada")
+    carregamento.add_argument("--repeticoes", type=int, help="Aberturas da página (padrão: BENCH_REPETICOES ou 20)")
+    carregamento.add_argument("--csv", help="Arquivo CSV de saída")
+    carregamento.set_defaults(func=_comando_carregamento)
+
+    distribuido = sub.add_parser("distribuido", help="Divide a carga entre vários processos e hosts geradores")
+    _argumentos_comuns(distribuido)
+    distribuido.add_argument("-n", "--processos", type=int, default=PROCESSOS_PADRAO,
+                             help="Processos geradores locais (0 para usar só os remotos)")
+    distribuido.add_argument("--remoto", action="append", metavar="HOST:PORTA",
+                             help="Gerador remoto iniciado com 'python -m benchmark gerador' (pode repetir)")
+    distribuido.add_argument("-u", "--usuarios", type=int, default=USUARIOS_PADRAO,
+                             help="Usuários virtuais por gerador (laço fechado)")
+    distribuido.add_argument("--rodadas", type=int, default=RODADAS_PADRAO,
+                             help="Vezes que cada usuário percorre a lista de cenários")
+    distribuido.add_argument("--duracao", type=float, help="Duração em segundos (substitui --rodadas)")
+    distribuido.add_argument("--taxa", type=float,
+                             help="Malha aberta: taxa total (req/s), dividida entre os geradores; exige --duracao")
+    distribuido.add_argument("--max-em-voo", type=int, default=MAX_EM_VOO_PADRAO,
+                             help="Máximo de requisições simultâneas por gerador (com --taxa)")
+    distribuido.add_argument("--csv", help="Arquivo CSV de saída")
+    distribuido.add_argument("--intervalo-metricas", type=float, default=1.0,
+                             help="Segundos entre leituras do /metricas durante a carga (com --metricas-servidor)")
+    _argumento_cliente(distribuido)
+    distribuido.set_defaults(func=_comando_distribuido)
+
+    gerador = sub.add_parser("gerador", help="Aguarda tarefas de carga de um coordenador 'distribuido' remoto")
+    gerador.add_argument("--host", default="127.0.0.1",
+                         help="Endereço de escuta (fora do loopback exige --expor)")
+    gerador.add_argument("--porta", type=int, default=PORTA_GERADOR)
+    gerador.add_argument("--expor", action="store_true",
+                         help="Permite escutar em outras interfaces; o gerador não tem autenticação, "
+                              "use só em rede de confiança")
+    gerador.add_argument("--ambiente", choices=list(AMBIENTES),
+                         help="Perfil de ambiente alvo da carga (padrão: BENCH_AMBIENTE ou dev)")
+    gerador.add_argument("--base-url", help="URL base alvo da carga; tem precedência sobre o perfil")
+    gerador.set_defaults(func=_comando_gerador)
+
+    historico = sub.add_parser("historico", help="Lista execuções gravadas ou a tendência de um cenário")
+    historico.add_argument("--banco", default=CONFIG.historico or "resultados/historico.sqlite",
+                           help="Banco SQLite do histórico")
+    historico.add_argument("--ambiente", choices=list(AMBIENTES), help="Filtra por ambiente")
+    historico.add_argument("--endpoint", help="Caminho do endpoint (ex.: /analise_energia/consumo-temporal)")
+    historico.add_argument("--cenario", help="Descrição do cenário (com --endpoint)")
+    historico.add_argument("--limite", type=int, default=20, help="Quantidade de execuções")
+    historico.add_argument("--marcar-base", metavar="ID",
+                           help="Marca a execução (ou 'ultima') como linha de base do seu ambiente")
+    historico.set_defaults(func=_comando_historico)
+
+    comparar = sub.add_parser("comparar", help="Detecta regressões de latência contra uma execução de referência")
+    comparar.add_argument("--banco", default=CONFIG.historico or "resultados/historico.sqlite",
+                          help="Banco SQLite do histórico")
+    comparar.add_argument("--atual", metavar="ID", help="Execução avaliada (padrão: a mais recente)")
+    comparar.add_argument("--base", default="base",
+                          help="'base' (linha de base marcada), 'anterior' ou o id de uma execução")
+    comparar.add_argument("--ambiente", choices=list(AMBIENTES), help="Ambiente da execução mais recente")
+    comparar.add_argument("--modo", help="Modo da execução mais recente (ex.: pytest, carga). Padrão: qualquer")
+    comparar.add_argument("--alfa", type=float, default=ALFA_PADRAO, help="Significância do teste")
+    comparar.add_argument("--limiar", action="append", type=_limiar, metavar="ENDPOINT=RAZAO",
+                          help="Razão de medianas tolerada para um endpoint (pode repetir)")
+    comparar.add_argument("--todos", action="store_true", help="Lista também os cenários estáveis")
+    comparar.set_defaults(func=_comando_comparar)
+
+    paralelo = sub.add_parser("paralelo", help="Executa os cenários da suíte em processos trabalhadores")
+    _argumentos_comuns(paralelo)
+    paralelo.add_argument("-w", "--trabalhadores", type=int, default=TRABALHADORES_PADRAO,
+                          help="Processos trabalhadores")
+    paralelo.add_argument("--repeticoes", type=int, help="Amostras por cenário (padrão: BENCH_REPETICOES ou 20)")
+    paralelo.add_argument("--quebrar-cache", action="store_true",
+                          help="Desloca as datas e acrescenta um parâmetro único a cada tentativa (cache frio)")
+    paralelo.add_argument("--precisao", type=float,
+                          help="Repetições adaptativas: amostra até o IC 95%% do percentil alvo ficar em "
+                               "±PRECISAO (ex.: 0.05); vale sem --repeticoes (padrão: BENCH_PRECISAO, 0 desliga)")
+    paralelo.add_argument("--orcamento", type=float,
+                          help="Tempo máximo (s) por cenário nas repetições adaptativas "
+                               "(padrão: BENCH_ORCAMENTO ou 60)")
+    paralelo.add_argument("--percentil-alvo", type=float,
+                          help="Percentil cujo IC controla as repetições adaptativas, ex.: 50 ou 95 (padrão: 50)")
+    paralelo.set_defaults(func=_comando_paralelo)
+
+    aquecimento = sub.add_parser("aquecimento",
+                                 help="Primeira requisição, regime e curva de aquecimento, com e sem cache")
+    _argumentos_comuns(aquecimento)
+    aquecimento.add_argument("--repeticoes", type=int,
+                             help="Tentativas por rodada (padrão: BENCH_REPETICOES ou 20)")
+    aquecimento.add_argument("--csv", help="Arquivo CSV de saída")
+    aquecimento.set_defaults(func=_comando_aquecimento)
+
+    varredura = sub.add_parser("varredura", help="Mede a latência ao longo de uma variável e ajusta a curva")
+    varredura.add_argument("dimensao", choices=["periodo", "medidores", "limit"],
+                           help="periodo: janelas data_inicio/data_fim de 1 a 365 dias; "
+                                "medidores: tamanho da lista medidor_ids (1 a 1000 e todos); "
+                                "limit: tamanho de página, com linhas/s e MB/s")
+    _argumentos_ambiente(varredura)
+    varredura.add_argument("--endpoint", action="append", choices=list({**ENDPOINTS_MEDIDORES, **ENDPOINTS_LIMIT}),
+                           help="Endpoint a varrer (pode repetir). Padrão: todos os que aceitam a variável")
+    varredura.add_argument("--valores", type=int, nargs="+",
+                           help=f"Pontos da varredura (padrão: {' '.join(map(str, JANELAS_DIAS))} dias; "
+                                f"{' '.join(map(str, TAMANHOS_MEDIDORES))} medidores; "
+                                f"{' '.join(map(str, LIMITES))} no limit)")
+    varredura.add_argument("--repeticoes", type=int,
+                           help="Amostras por ponto (padrão: BENCH_REPETICOES ou 20; adaptativo com BENCH_PRECISAO)")
+    varredura.add_argument("--csv", help="Arquivo CSV de saída (o ajuste vai para <arquivo>_ajuste.csv)")
+    varredura.set_defaults(func=_comando_varredura)
+
+    paginacao = sub.add_parser("paginar", help="Percorre o conjunto inteiro por offset/limit e mede cada página")
+    _argumentos_ambiente(paginacao)
+    paginacao.add_argument("--endpoint", default=ENDPOINT_PAGINADO, help="Endpoint paginado por offset/limit")
+    paginacao.add_argument("--limit", type=int, default=TAMANHO_PAGINA_PADRAO, help="Linhas por página")
+    paginacao.add_argument("-p", "--paralelo", type=int, default=1, help="Páginas buscadas ao mesmo tempo")
+    paginacao.add_argument("--max-paginas", type=int, help="Interrompe depois de tantas páginas")
+    paginacao.add_argument("--param", action="append", metavar="CHAVE=VALOR",
+                           help="Filtro repassado a todas as páginas (pode repetir; ex.: tipo_sensor=temperatura)")
+    paginacao.add_argument("--csv", help="Arquivo CSV de saída (uma linha por página)")
+    paginacao.set_defaults(func=_comando_paginar)
+
+    padrao = ConfiguracaoDados()
+    servidor = sub.add_parser("servidor", help="Sobe o servidor local com base sintética")
+    servidor.add_argument("--host", default="127.0.0.1")
+    servidor.add_argument("--porta", type=int, default=8025)
+    servidor.add_argument("--medidores-energia", type=int, default=padrao.medidores_energia)
+    servidor.add_argument("--medidores-temperatura", type=int, default=padrao.medidores_temperatura)
+    servidor.add_argument("--dias", type=int, default=padrao.dias, help="Dias de histórico até hoje")
+    servidor.add_argument("--leituras-por-hora", type=int, default=padrao.leituras_por_hora)
+    servidor.add_argument("--semente", type=int, default=padrao.semente)
+    servidor.add_argument("--aquecer", action="store_true",
+                          help="Pré-calcula em segundo plano os agregados montados sob demanda")
+    servidor.set_defaults(func=_comando_servidor)
+
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    if args.comando == "historico" and args.endpoint and not args.cenario:
+        criar_parser().error("--endpoint exige --cenario")
+    if args.comando == "distribuido" and args.taxa and not args.duracao:
+        criar_parser().error("--taxa exige --duracao")
+    if args.comando == "varredura":
+        aceitos = ENDPOINTS_POR_DIMENSAO[args.dimensao]
+        recusados = [e for e in args.endpoint or [] if e not in aceitos]
+        if recusados:
+            criar_parser().error(f"--endpoint {', '.join(recusados)} não aceita a dimensão {args.dimensao} "
+                                 f"(opções: {', '.join(aceitos)})")
+    if args.comando == "taxa" and int(args.taxa * args.duracao) < 1:
+        criar_parser().error("--taxa × --duracao precisa agendar ao menos uma requisição")
+    if not hasattr(args, "servidor_local"):
+        return args.func(args)
+    servidor = _selecionar_ambiente(args)
+    try:
+        print(f"Ambiente: {CONFIG.ambiente} ({CONFIG.url_base})")
+        return args.func(args)
+    finally:
+        if servidor is not None:
+            servidor.parar()
@@ -0,0 +1,315 @@
+import asyncio
+import contextlib
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass
+from urllib.parse import urlencode, urlsplit
+
+from .carga import RODADAS_PADRAO, USUARIOS_PADRAO, ResultadoCarga, executar_carga
+from .malha_aberta import MAX_EM_VOO_PADRAO, ResultadoTaxaConstante, executar_taxa_constante
+from .metricas import anexar_ao_resultado, coletor_para
+from .motor import HEADERS, TIMEOUT_PADRAO, Amostra, ResultadoCenario, formatar_percentis
+
+# ===============================================================
+# CLIENTE HTTP/1.1 SOBRE ASYNCIO
+# ===============================================================
+# Backend alternativo ao requests para os modos de carga: um único processo e
+# uma única thread mantêm milhares de requisições em voo, cada uma custando uma
+# corrotina em vez de uma thread. Só o necessário para a API: GET, keep-alive,
+# corpo por Content-Length, chunked ou até o fechamento, e TLS pelo módulo ssl.
+# (aiohttp não é dependência do projeto; a biblioteca padrão basta.)
+CLIENTES = ("requests", "async")
+TAMANHO_LEITURA = 64 * 1024
+
+
+class ErroHTTP(Exception):
+    """Resposta malformada ou conexão encerrada no meio da resposta."""
+
+
+@dataclass(frozen=True)
+class Requisicao:
+    """GET pré-serializado: montado uma vez por cenário e reenviado a cada repetição."""
+    destino: tuple  # (esquema, host, porta), chave do pool de conexões
+    dados: bytes
+
+
+def preparar(url, params=None):
+    partes = urlsplit(url)
+    porta = partes.port or (443 if partes.scheme == "https" else 80)
+    alvo = partes.path or "/"
+    consulta = "&".join(q for q in (partes.query, urlencode(params or {}, doseq=True)) if q)
+    if consulta:
+        alvo += "?" + consulta
+    cabecalhos = {"Host": partes.netloc, **HEADERS, "Connection": "keep-alive"}
+    linhas = [f"GET {alvo} HTTP/1.1"] + [f"{k}: {v}" for k, v in cabecalhos.items()]
+    return Requisicao((partes.scheme, partes.hostname, porta), ("\r\n".join(linhas) + "\r\n\r\n").encode("latin-1"))
+
+
+class ClienteAsync:
+    """Pool de conexões keep-alive por destino.
+
+    Uso::
+
+        cliente = ClienteAsync()
+        status, tamanho = await cliente.get(preparar(url, params))
+        await cliente.fechar()
+
+    Cada requisição usa uma conexão ociosa do destino ou abre uma nova; não há
+    limite de conexões (quem chama controla a concorrência).
+    """
+
+    def __init__(self, timeout=TIMEOUT_PADRAO):
+        self.timeout = timeout
+        self._ociosas = {}
+        self._abertas = set()
+        self._tls = None
+
+    async def _conectar(self, destino):
+        esquema, host, porta = destino
+        if esquema == "https" and self._tls is None:
+            self._tls = ssl.create_default_context()
+        leitor, escritor = await asyncio.open_connection(host, porta, ssl=self._tls if esquema == "https" else None)
+        self._abertas.add(escritor)
+        return leitor, escritor
+
+    def _descartar(self, escritor):
+        self._abertas.discard(escritor)
+        escritor.close()
+
+    async def get(self, requisicao):
+        """Envia a requisição e lê a resposta inteira; devolve ``(status, bytes do corpo)``."""
+        async with asyncio.timeout(self.timeout):
+            fila = self._ociosas.setdefault(requisicao.destino, deque())
+            reaproveitada = bool(fila)
+            leitor, escritor = fila.pop() if fila else await self._conectar(requisicao.destino)
+            try:
+                escritor.write(requisicao.dados)
+                status, tamanho, manter = await _ler_resposta(leitor)
+            except (ErroHTTP, ConnectionError) as erro:
+                self._descartar(escritor)
+                if not reaproveitada:
+                    raise
+                # O servidor pode fechar uma conexão ociosa a qualquer momento: tenta uma nova.
+                leitor, escritor = await self._conectar(requisicao.destino)
+                try:
+                    escritor.write(requisicao.dados)
+                    status, tamanho, manter = await _ler_resposta(leitor)
+                except BaseException:
+                    self._descartar(escritor)
+                    raise erro from None
+            except BaseException:
+                self._descartar(escritor)
+                raise
+        if manter:
+            fila.append((leitor, escritor))
+        else:
+            self._descartar(escritor)
+        return status, tamanho
+
+    async def fechar(self):
+        for escritor in list(self._abertas):
+            self._descartar(escritor)
+        for escritor in list(self._abertas):
+            with contextlib.suppress(Exception):
+                await escritor.wait_closed()
+        self._ociosas.clear()
+
+
+async def _ler_resposta(leitor):
+    linha = await leitor.readline()
+    if not linha:
+        raise ErroHTTP("Conexão encerrada antes da resposta")
+    try:
+        versao, status = linha.split(None, 2)[:2]
+        status = int(status)
+    except ValueError:
+        raise ErroHTTP(f"Linha de status inválida: {linha!r}") from None
+
+    cabecalhos = {}
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b"\n"):
+            break
+        if not linha:
+            raise ErroHTTP("Conexão encerrada nos cabeçalhos")
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+
+    conexao = cabecalhos.get("connection", "").lower()
+    manter = conexao != "close" and (versao == b"HTTP/1.1" or conexao == "keep-alive")
+    if status in (204, 304) or 100 <= status < 200:
+        return status, 0, manter
+    if "chunked" in cabecalhos.get("transfer-encoding", "").lower():
+        return status, await _ler_chunked(leitor), manter
+    if "content-length" in cabecalhos:
+        tamanho = int(cabecalhos["content-length"])
+        try:
+            await leitor.readexactly(tamanho)
+        except asyncio.IncompleteReadError:
+            raise ErroHTTP("Corpo incompleto") from None
+        return status, tamanho, manter
+    tamanho = 0
+    while bloco := await leitor.read(TAMANHO_LEITURA):
+        tamanho += len(bloco)
+    return status, tamanho, False
+
+
+async def _ler_chunked(leitor):
+    tamanho = 0
+    try:
+        while True:
+            linha = await leitor.readline()
+            pedaco = int(linha.split(b";", 1)[0].strip() or b"0", 16)
+            if pedaco == 0:
+                while (await leitor.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # trailers
+                return tamanho
+            await leitor.readexactly(pedaco + 2)
+            tamanho += pedaco
+    except (asyncio.IncompleteReadError, ValueError):
+        raise ErroHTTP("Corpo chunked malformado") from None
+
+
+async def medir(cliente, requisicao):
+    """``(status, duracao)``; falhas de conexão e timeouts voltam com status ``None``."""
+    inicio = time.perf_counter()
+    try:
+        status, _ = await cliente.get(requisicao)
+    except (OSError, ErroHTTP, TimeoutError):
+        status = None
+    return status, time.perf_counter() - inicio
+
+
+# ===============================================================
+# MODOS DE CARGA
+# ===============================================================
+def _agrupar(resultado, coletado, destino=None):
+    destino = resultado.cenarios if destino is None else destino
+    for cenario, amostra in coletado:
+        if cenario.chave not in destino:
+            destino[cenario.chave] = ResultadoCenario(
+                cenario.descricao, cenario.params, cenario.status_esperado, url=cenario.url
+            )
+        destino[cenario.chave].amostras.append(amostra)
+
+
+async def _carga(cenarios, usuarios, rodadas, duracao, timeout):
+    cliente = ClienteAsync(timeout)
+    requisicoes = [preparar(c.url, c.params) for c in cenarios]
+    fim = time.perf_counter() + duracao if duracao else None
+
+    async def usuario(indice):
+        amostras = []
+        passo = 0
+        while (time.perf_counter() < fim) if fim is not None else passo < rodadas * len(cenarios):
+            i = (indice + passo) % len(cenarios)
+            passo += 1
+            status, tempo = await medir(cliente, requisicoes[i])
+            amostras.append((cenarios[i], Amostra(passo, status, tempo)))
+        return amostras
+
+    try:
+        return await asyncio.gather(*(usuario(i) for i in range(usuarios)))
+    finally:
+        await cliente.fechar()
+
+
+def executar_carga_async(cenarios, usuarios=USUARIOS_PADRAO, rodadas=RODADAS_PADRAO, duracao=None,
+                         timeout=TIMEOUT_PADRAO, intervalo_metricas=None):
+    """Mesma carga em laço fechado de ``executar_carga``, com usuários virtuais em corrotinas.
+
+    Cada usuário mantém no máximo uma requisição em voo; o pool de conexões é
+    compartilhado, então ``usuarios`` na casa dos milhares custa só sockets.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+
+    print(f"\n=== Carga (asyncio): {len(cenarios)} cenário(s), {usuarios} usuário(s) virtuais ===")
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    inicio = time.perf_counter()
+    with coletor or contextlib.nullcontext():
+        coletado = asyncio.run(_carga(cenarios, usuarios, rodadas, duracao, timeout))
+    resultado = ResultadoCarga(usuarios, time.perf_counter() - inicio)
+    for amostras in coletado:
+        _agrupar(resultado, amostras)
+
+    for chave, r in resultado.cenarios.items():
+        print(f"➡️ {chave}: {len(r.amostras)} req | {resultado.vazao_cenario(chave):.2f} req/s | "
+              f"Média: {r.media:.3f}s | Mínimo: {r.minimo:.3f}s | Máximo: {r.maximo:.3f}s")
+        print(f"   {formatar_percentis(r.percentis())}")
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s), {resultado.total_erros} erro(s)")
+    return resultado
+
+
+async def _taxa_constante(cenarios, taxa, total, max_em_voo, timeout):
+    cliente = ClienteAsync(timeout)
+    requisicoes = [preparar(c.url, c.params) for c in cenarios]
+    vagas = asyncio.Semaphore(max_em_voo)
+
+    async def disparar(k, i, previsto):
+        async with vagas:
+            inicio_real = time.perf_counter()
+            status, servico = await medir(cliente, requisicoes[i])
+        return cenarios[i], k, status, inicio_real - previsto, servico
+
+    inicio = time.perf_counter()
+    tarefas = []
+    try:
+        for k in range(total):
+            previsto = inicio + k / taxa
+            # Atrasos do laço em relação à agenda entram em ``inicio_real - previsto`` (atraso_maximo).
+            espera = previsto - time.perf_counter()
+            if espera > 0:
+                await asyncio.sleep(espera)
+            tarefas.append(asyncio.create_task(disparar(k + 1, k % len(cenarios), previsto)))
+        return await asyncio.gather(*tarefas)
+    finally:
+        await cliente.fechar()
+
+
+def executar_taxa_constante_async(cenarios, taxa, duracao, max_em_voo=MAX_EM_VOO_PADRAO, timeout=TIMEOUT_PADRAO,
+                                  intervalo_metricas=None):
+    """Malha aberta de ``executar_taxa_constante`` com o laço de eventos no lugar das threads.
+
+    A agenda é a mesma (``inicio + k / taxa``); ``max_em_voo`` vira um semáforo,
+    e a espera por ele entra na latência corrigida.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+    if taxa <= 0:
+        raise ValueError("A taxa alvo deve ser positiva")
+    total = int(taxa * duracao)
+    if total < 1:
+        raise ValueError(f"{taxa:g} req/s por {duracao:g}s não agenda nenhuma requisição")
+
+    print(f"\n=== Malha aberta (asyncio): {len(cenarios)} cenário(s), {taxa:g} req/s por {duracao:g}s "
+          f"({total} req) ===")
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    inicio = time.perf_counter()
+    with coletor or contextlib.nullcontext():
+        coletado = asyncio.run(_taxa_constante(cenarios, taxa, total, max_em_voo, timeout))
+    resultado = ResultadoTaxaConstante(max_em_voo, time.perf_counter() - inicio, taxa_alvo=taxa)
+    for cenario, k, status, atraso, servico in coletado:
+        _agrupar(resultado, [(cenario, Amostra(k, status, atraso + servico))])
+        _agrupar(resultado, [(cenario, Amostra(k, status, servico))], resultado.servico)
+        resultado.atraso_maximo = max(resultado.atraso_maximo, atraso)
+
+    for chave, r in resultado.cenarios.items():
+        print(f"➡️ {chave}: {len(r.amostras)} req | {resultado.vazao_cenario(chave):.2f} req/s")
+        print(f"   Corrigido: {formatar_percentis(r.percentis())}")
+        print(f"   Serviço:   {formatar_percentis(resultado.servico[chave].percentis())}")
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s de {taxa:g} alvo), {resultado.total_erros} erro(s), "
+          f"maior atraso de envio {resultado.atraso_maximo:.3f}s")
+    return resultado
+
+
+# Executor de cada modo por backend (--cliente)
+CARGA_POR_CLIENTE = {"requests": executar_carga, "async": executar_carga_async}
+TAXA_POR_CLIENTE = {"requests": executar_taxa_constante, "async": executar_taxa_constante_async}
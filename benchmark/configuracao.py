@@ -0,0 +1,81 @@
+import os
+from dataclasses import dataclass
+
+# ===============================================================
+# CONFIGURAÇÃO DA EXECUÇÃO
+# ===============================================================
+# Os valores padrão podem vir de variáveis de ambiente; o conftest.py (opções
+# do pytest) e a CLI (python -m benchmark) sobrescrevem o objeto CONFIG.
+REPETICOES_PADRAO = int(os.environ.get("BENCH_REPETICOES", 20))
+# Banco SQLite com o histórico de execuções; vazio desliga a gravação.
+HISTORICO_PADRAO = os.environ.get("BENCH_HISTORICO", "resultados/historico.sqlite")
+# Lê /metricas antes e depois de cada cenário para anexar o tempo medido no servidor.
+METRICAS_SERVIDOR_PADRAO = os.environ.get("BENCH_METRICAS_SERVIDOR", "") not in ("", "0")
+# Perturba os parâmetros a cada tentativa para que nenhuma resposta venha do cache do servidor.
+QUEBRAR_CACHE_PADRAO = os.environ.get("BENCH_QUEBRAR_CACHE", "") not in ("", "0")
+# Repetições adaptativas: amostra cada cenário até o IC 95% do percentil alvo ficar
+# dentro de ±PRECISAO (fração da estimativa) ou o orçamento (s) acabar. 0 desliga.
+PRECISAO_PADRAO = float(os.environ.get("BENCH_PRECISAO", 0))
+ORCAMENTO_PADRAO = float(os.environ.get("BENCH_ORCAMENTO", 60))
+PERCENTIL_ALVO_PADRAO = float(os.environ.get("BENCH_PERCENTIL_ALVO", 50))
+
+# ===============================================================
+# PERFIS DE AMBIENTE
+# ===============================================================
+# URL base de cada implantação da API. Qualquer perfil pode ser redefinido por
+# BENCH_URL_<PERFIL> (ex.: BENCH_URL_HOMOLOG=http://10.0.0.5:8025); homolog e
+# prod não têm endereço fixo e precisam dessa variável para serem usados.
+# "local" é o servidor sintético de `python -m benchmark servidor`.
+AMBIENTES = {
+    "dev": "http://172.16.40.100:8025",
+    "homolog": None,
+    "prod": None,
+    "local": "http://127.0.0.1:8025",
+}
+AMBIENTE_PADRAO = os.environ.get("BENCH_AMBIENTE", "dev")
+
+
+def _validar_ambiente(ambiente):
+    if ambiente not in AMBIENTES:
+        raise ValueError(f"Ambiente desconhecido: {ambiente!r} (opções: {', '.join(AMBIENTES)})")
+
+
+def url_do_ambiente(ambiente):
+    _validar_ambiente(ambiente)
+    url = os.environ.get(f"BENCH_URL_{ambiente.upper()}", AMBIENTES[ambiente])
+    if not url:
+        raise ValueError(f"Ambiente {ambiente!r} sem URL configurada: defina BENCH_URL_{ambiente.upper()}")
+    return url
+
+
+@dataclass
+class Configuracao:
+    repeticoes: int = REPETICOES_PADRAO
+    ambiente: str = AMBIENTE_PADRAO
+    # URL explícita (--base-url / BENCH_BASE_URL); tem precedência sobre o perfil
+    base_url: str = os.environ.get("BENCH_BASE_URL")
+    historico: str = HISTORICO_PADRAO
+    metricas_servidor: bool = METRICAS_SERVIDOR_PADRAO
+    quebrar_cache: bool = QUEBRAR_CACHE_PADRAO
+    precisao: float = PRECISAO_PADRAO
+    orcamento: float = ORCAMENTO_PADRAO  # segundos por cenário
+    percentil_alvo: float = PERCENTIL_ALVO_PADRAO
+
+    def selecionar_ambiente(self, ambiente=None, base_url=None):
+        if ambiente:
+            _validar_ambiente(ambiente)
+            self.ambiente = ambiente
+        if base_url:
+            self.base_url = base_url
+
+    @property
+    def url_base(self):
+        return (self.base_url or url_do_ambiente(self.ambiente)).rstrip("/")
+
+
+CONFIG = Configuracao()
+
+
+def url_endpoint(caminho):
+    """URL completa de um endpoint (ex.: "/health") no ambiente selecionado."""
+    return CONFIG.url_base + caminho
@@ -0,0 +1,317 @@
+import contextlib
+import io
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from .carga import RODADAS_PADRAO, USUARIOS_PADRAO
+from .catalogo import carregar_catalogo, listar_modulos
+from .cliente_async import CARGA_POR_CLIENTE, TAXA_POR_CLIENTE
+from .configuracao import CONFIG
+from .histograma import Histograma
+from .malha_aberta import MAX_EM_VOO_PADRAO
+from .metricas import anexar_ao_resultado, coletor_para
+from .motor import TIMEOUT_PADRAO, formatar_percentis
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+PROCESSOS_PADRAO = min(4, os.cpu_count() or 1)
+PORTA_GERADOR = 8765
+# Folga entre o envio das tarefas e o início combinado, para os processos
+# subirem e importarem o catálogo antes de a carga começar.
+ATRASO_INICIO = 2.0
+# Únicos campos de CONFIG que o coordenador pode ajustar num gerador. Alvo
+# (base_url/ambiente) e histórico são do próprio gerador: uma tarefa não pode
+# apontar a carga para outro host nem escrever em outro arquivo.
+CAMPOS_CONFIGURACAO = ("repeticoes", "metricas_servidor", "quebrar_cache", "precisao", "orcamento",
+                       "percentil_alvo")
+
+
+# ===============================================================
+# RESUMO MESCLÁVEL DE UM CENÁRIO
+# ===============================================================
+# Os geradores não devolvem amostras, só o histograma de latência e a contagem
+# por status de cada cenário: o tamanho da resposta independe do número de
+# requisições e somar histogramas dá os mesmos percentis de ter medido tudo
+# num processo só (dentro da precisão do ``Histograma``).
+@dataclass
+class ResumoCenario:
+    descricao: str
+    params: dict
+    status_esperado: int
+    url: str
+    histograma: Histograma = field(default_factory=Histograma)
+    status: dict = field(default_factory=dict)  # str(status) -> contagem; "None" = falha de conexão
+
+    @classmethod
+    def de_resultado(cls, r):
+        resumo = cls(r.descricao, r.params, r.status_esperado, r.url, r.histograma)
+        for a in r.amostras:
+            resumo.status[str(a.status)] = resumo.status.get(str(a.status), 0) + 1
+        return resumo
+
+    @property
+    def requisicoes(self):
+        return self.histograma.total
+
+    @property
+    def erros(self):
+        return sum(n for s, n in self.status.items() if s != str(self.status_esperado))
+
+    def mesclar(self, outro):
+        self.histograma.mesclar(outro.histograma)
+        for s, n in outro.status.items():
+            self.status[s] = self.status.get(s, 0) + n
+        return self
+
+    def para_dict(self):
+        return {**asdict(self), "histograma": self.histograma.para_dict()}
+
+    @classmethod
+    def de_dict(cls, dados):
+        return cls(**{**dados, "histograma": Histograma.de_dict(dados["histograma"])})
+
+
+@dataclass
+class ParcialGerador:
+    """O que um gerador devolve: sua janela de execução (relógio de parede) e os resumos."""
+    gerador: str
+    inicio: float
+    fim: float
+    cenarios: dict = field(default_factory=dict)  # chave -> ResumoCenario
+
+    @property
+    def requisicoes(self):
+        return sum(r.requisicoes for r in self.cenarios.values())
+
+    def para_dict(self):
+        return {"gerador": self.gerador, "inicio": self.inicio, "fim": self.fim,
+                "cenarios": {k: r.para_dict() for k, r in self.cenarios.items()}}
+
+    @classmethod
+    def de_dict(cls, dados):
+        cenarios = {k: ResumoCenario.de_dict(r) for k, r in dados["cenarios"].items()}
+        return cls(dados["gerador"], dados["inicio"], dados["fim"], cenarios)
+
+
+@dataclass
+class ResultadoDistribuido:
+    usuarios: int  # soma dos usuários (ou do máximo em voo) de todos os geradores
+    parciais: list = field(default_factory=list)
+    cenarios: dict = field(default_factory=dict)  # chave -> ResumoCenario mesclado
+    taxa_alvo: float = None
+    servidor: dict = field(default_factory=dict)
+    serie_servidor: dict = field(default_factory=dict)
+
+    def mesclar(self, parcial):
+        self.parciais.append(parcial)
+        for chave, resumo in parcial.cenarios.items():
+            if chave not in self.cenarios:
+                self.cenarios[chave] = ResumoCenario(resumo.descricao, resumo.params, resumo.status_esperado,
+                                                     resumo.url)
+            self.cenarios[chave].mesclar(resumo)
+
+    @property
+    def duracao(self):
+        """Do primeiro gerador a começar ao último a terminar."""
+        if not self.parciais:
+            return 0.0
+        return max(p.fim for p in self.parciais) - min(p.inicio for p in self.parciais)
+
+    @property
+    def total_requisicoes(self):
+        return sum(r.requisicoes for r in self.cenarios.values())
+
+    @property
+    def total_erros(self):
+        return sum(r.erros for r in self.cenarios.values())
+
+    @property
+    def vazao(self):
+        return self.total_requisicoes / self.duracao if self.duracao > 0 else 0.0
+
+    def vazao_cenario(self, chave):
+        return self.cenarios[chave].requisicoes / self.duracao if self.duracao > 0 else 0.0
+
+    def total(self):
+        h = Histograma()
+        for r in self.cenarios.values():
+            h.mesclar(r.histograma)
+        return h
+
+
+# ===============================================================
+# GERADOR DE CARGA
+# ===============================================================
+def executar_tarefa(tarefa):
+    """Roda a carga descrita por ``tarefa`` (dict serializável) e devolve ``ParcialGerador.para_dict()``.
+
+    Executada num processo local ou num host remoto (``servir``): aplica a
+    configuração do coordenador, carrega o catálogo por conta própria, espera o
+    instante combinado e roda a carga sem imprimir nem gravar nada. A tarefa
+    vem da rede, então só são aceitos módulos do catálogo (``listar_modulos``)
+    e os campos de ``CAMPOS_CONFIGURACAO``; qualquer outro é recusado.
+    """
+    recusados = sorted(set(tarefa["configuracao"]) - set(CAMPOS_CONFIGURACAO))
+    if recusados:
+        raise ValueError(f"Campos de configuração não permitidos: {', '.join(recusados)}")
+    catalogo = set(listar_modulos())
+    fora = [m for m in tarefa["modulos"] or () if m not in catalogo]
+    if fora:
+        raise ValueError(f"Módulos fora do catálogo: {', '.join(map(str, fora))}")
+    for nome, valor in tarefa["configuracao"].items():
+        setattr(CONFIG, nome, valor)
+    CONFIG.historico = ""
+    cenarios = carregar_catalogo(tarefa["modulos"], tarefa["descricoes"])
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        time.sleep(max(0.0, tarefa["inicio"] - time.time()))
+        inicio = time.time()
+        if tarefa["taxa"]:
+            executar = TAXA_POR_CLIENTE[tarefa["cliente"]]
+            resultado = executar(cenarios, tarefa["taxa"], tarefa["duracao"], max_em_voo=tarefa["max_em_voo"],
+                                 timeout=tarefa["timeout"])
+        else:
+            executar = CARGA_POR_CLIENTE[tarefa["cliente"]]
+            resultado = executar(cenarios, usuarios=tarefa["usuarios"], rodadas=tarefa["rodadas"],
+                                 duracao=tarefa["duracao"], timeout=tarefa["timeout"])
+        fim = time.time()
+    parcial = ParcialGerador(tarefa["gerador"], inicio, fim,
+                             {k: ResumoCenario.de_resultado(r) for k, r in resultado.cenarios.items()})
+    return parcial.para_dict()
+
+
+# ===============================================================
+# PROTOCOLO DOS GERADORES REMOTOS
+# ===============================================================
+# Uma conexão TCP por tarefa: o coordenador envia a tarefa como uma linha JSON e
+# recebe uma linha JSON com {"ok": true, "parcial": ...} ou {"ok": false,
+# "erro": ...}. Sem autenticação: por padrão o gerador só escuta no loopback e
+# expô-lo em outras interfaces exige ``expor=True`` (opção --expor), em rede de
+# confiança. Mesmo assim a tarefa não escolhe o alvo nem importa arquivos fora
+# do catálogo (ver ``executar_tarefa``).
+class _AtenderTarefa(socketserver.StreamRequestHandler):
+    def handle(self):
+        linha = self.rfile.readline()
+        try:
+            resposta = {"ok": True, "parcial": executar_tarefa(json.loads(linha))}
+        except Exception:  # noqa: BLE001 - o erro volta para o coordenador
+            resposta = {"ok": False, "erro": traceback.format_exc(limit=3)}
+        self.wfile.write(json.dumps(resposta).encode() + b"\n")
+
+
+def _loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def servir(host="127.0.0.1", porta=PORTA_GERADOR, expor=False):
+    """Servidor de um gerador remoto (``python -m benchmark gerador``); atende uma tarefa por vez.
+
+    A carga vai para o alvo configurado neste processo (``CONFIG.url_base``),
+    nunca para um indicado pelo coordenador.
+    """
+    if not expor and not _loopback(host):
+        raise ValueError(f"O gerador não tem autenticação: use expor=True (--expor) para escutar em {host}")
+    with socketserver.TCPServer((host, porta), _AtenderTarefa) as servidor:
+        print(f"🛰️ Gerador de carga aguardando tarefas em {host}:{servidor.server_address[1]} "
+              f"(alvo: {CONFIG.url_base})")
+        servidor.serve_forever()
+
+
+def _executar_remoto(endereco, tarefa):
+    host, _, porta = endereco.rpartition(":")
+    with socket.create_connection((host, int(porta))) as conexao, conexao.makefile("rwb") as canal:
+        canal.write(json.dumps(tarefa).encode() + b"\n")
+        canal.flush()
+        linha = canal.readline()
+    if not linha:
+        raise ConnectionError(f"Gerador {endereco} encerrou a conexão sem resposta")
+    resposta = json.loads(linha)
+    if not resposta["ok"]:
+        raise RuntimeError(f"Gerador {endereco} falhou:\n{resposta['erro']}")
+    return resposta["parcial"]
+
+
+# ===============================================================
+# COORDENADOR
+# ===============================================================
+def _iniciar_processo(configuracao):
+    """Processos locais herdam a configuração inteira do coordenador (inclusive o alvo)."""
+    for nome, valor in configuracao.items():
+        setattr(CONFIG, nome, valor)
+
+
+def executar_distribuido(modulos=None, descricoes=None, processos=PROCESSOS_PADRAO, remotos=(),
+                         usuarios=USUARIOS_PADRAO, rodadas=RODADAS_PADRAO, duracao=None, taxa=None,
+                         max_em_voo=MAX_EM_VOO_PADRAO, cliente="requests", timeout=TIMEOUT_PADRAO,
+                         intervalo_metricas=None):
+    """Divide a carga entre ``processos`` processos locais e os geradores em ``remotos`` ("host:porta").
+
+    Cada gerador roda ``usuarios`` usuários virtuais em laço fechado ou, com
+    ``taxa``, sua fração da taxa total em malha aberta. Todos começam no mesmo
+    instante de relógio de parede (os hosts remotos precisam de relógio
+    sincronizado) e devolvem histogramas, que o coordenador mescla num único
+    relatório. A leitura do /metricas, quando pedida, é feita só aqui.
+    """
+    cenarios = carregar_catalogo(modulos, descricoes)
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+    geradores = [f"local-{i + 1}" for i in range(processos)] + list(remotos)
+    if not geradores:
+        raise ValueError("Informe ao menos um processo local ou gerador remoto")
+
+    modo = f"{taxa:g} req/s no total" if taxa else f"{usuarios} usuário(s) por gerador"
+    print(f"\n=== Carga distribuída: {len(cenarios)} cenário(s), {len(geradores)} gerador(es), {modo} ===")
+    base = {
+        "modulos": modulos, "descricoes": descricoes, "usuarios": usuarios,
+        "configuracao": {nome: getattr(CONFIG, nome) for nome in CAMPOS_CONFIGURACAO},
+        "rodadas": rodadas, "duracao": duracao, "taxa": taxa / len(geradores) if taxa else None,
+        "max_em_voo": max_em_voo, "cliente": cliente, "timeout": timeout, "inicio": time.time() + ATRASO_INICIO,
+    }
+    tarefas = [{**base, "gerador": g} for g in geradores]
+
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    with coletor or contextlib.nullcontext(), ThreadPoolExecutor(max_workers=max(1, len(remotos))) as rede, \
+            ProcessPoolExecutor(max_workers=max(1, processos), initializer=_iniciar_processo,
+                                initargs=(asdict(CONFIG),)) as locais:
+        futuros = [locais.submit(executar_tarefa, t) for t in tarefas[:processos]]
+        futuros += [rede.submit(_executar_remoto, t["gerador"], t) for t in tarefas[processos:]]
+        parciais = [ParcialGerador.de_dict(f.result()) for f in futuros]
+
+    por_gerador = usuarios if not taxa else max_em_voo
+    resultado = ResultadoDistribuido(por_gerador * len(geradores), taxa_alvo=taxa)
+    for parcial in parciais:
+        resultado.mesclar(parcial)
+        print(f"🛰️ {parcial.gerador}: {parcial.requisicoes} req em {parcial.fim - parcial.inicio:.2f}s")
+    _imprimir(resultado)
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    return resultado
+
+
+def _imprimir(resultado):
+    for chave, r in resultado.cenarios.items():
+        h = r.histograma
+        print(f"➡️ {chave}: {r.requisicoes} req | {resultado.vazao_cenario(chave):.2f} req/s | "
+              f"Média: {h.media:.3f}s | Mínimo: {h.minimo:.3f}s | Máximo: {h.maximo:.3f}s | {r.erros} erro(s)")
+        print(f"   {formatar_percentis(h.percentis_confiaveis())}")
+    inicios = [p.inicio for p in resultado.parciais]
+    desvio = max(inicios) - min(inicios) if inicios else 0.0
+    alvo = f" de {resultado.taxa_alvo:g} alvo" if resultado.taxa_alvo else ""
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s{alvo}), {resultado.total_erros} erro(s), "
+          f"geradores começaram com até {desvio * 1000:.0f}ms de diferença")
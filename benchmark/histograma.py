@@ -0,0 +1,122 @@
+import math
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+ALGARISMOS_SIGNIFICATIVOS = 3
+RESOLUCAO = 1_000_000  # registra em microssegundos
+PERCENTIS_PADRAO = [50.0, 90.0, 95.0, 99.0, 99.9]
+
+
+class Histograma:
+    """Histograma de alta faixa dinâmica (layout HdrHistogram) para latências em segundos.
+
+    Os valores são guardados em microssegundos em baldes log-lineares com
+    precisão relativa de ``10 ** -algarismos`` em toda a faixa. Os contadores
+    ficam num dicionário esparso, o que torna a mescla uma simples soma e
+    permite serializar o histograma em JSON.
+    """
+
+    def __init__(self, algarismos=ALGARISMOS_SIGNIFICATIVOS):
+        self.algarismos = algarismos
+        self._sub_baldes = 2 ** math.ceil(math.log2(2 * 10 ** algarismos))
+        self._bits = self._sub_baldes.bit_length() - 1
+        self._meio = self._sub_baldes // 2
+        self.contagens = {}
+        self.total = 0
+        self.soma = 0.0
+        self.minimo = None
+        self.maximo = None
+
+    # ---------------------------------------------------------------
+    # Índices dos baldes
+    # ---------------------------------------------------------------
+    def _indice(self, valor):
+        balde = max(0, valor.bit_length() - self._bits)
+        return balde * self._meio + (valor >> balde)
+
+    def _maior_equivalente(self, indice):
+        if indice < self._sub_baldes:
+            return indice
+        balde = indice // self._meio - 1
+        sub = indice - balde * self._meio
+        return ((sub + 1) << balde) - 1
+
+    # ---------------------------------------------------------------
+    # Registro e mescla
+    # ---------------------------------------------------------------
+    def registrar(self, segundos, vezes=1):
+        valor = max(0, round(segundos * RESOLUCAO))
+        indice = self._indice(valor)
+        self.contagens[indice] = self.contagens.get(indice, 0) + vezes
+        self.total += vezes
+        self.soma += segundos * vezes
+        self.minimo = segundos if self.minimo is None else min(self.minimo, segundos)
+        self.maximo = segundos if self.maximo is None else max(self.maximo, segundos)
+
+    def mesclar(self, outro):
+        if outro.algarismos != self.algarismos:
+            raise ValueError("Histogramas com precisões diferentes não podem ser mesclados")
+        for indice, contagem in outro.contagens.items():
+            self.contagens[indice] = self.contagens.get(indice, 0) + contagem
+        self.total += outro.total
+        self.soma += outro.soma
+        if outro.total:
+            self.minimo = outro.minimo if self.minimo is None else min(self.minimo, outro.minimo)
+            self.maximo = outro.maximo if self.maximo is None else max(self.maximo, outro.maximo)
+        return self
+
+    # ---------------------------------------------------------------
+    # Consultas
+    # ---------------------------------------------------------------
+    @property
+    def media(self):
+        return self.soma / self.total if self.total else None
+
+    def percentil(self, p):
+        """Valor (s) abaixo do qual estão ``p``% das amostras, ou ``None`` se vazio."""
+        if not self.total:
+            return None
+        alvo = max(1, math.ceil(p / 100.0 * self.total))
+        acumulado = 0
+        for indice in sorted(self.contagens):
+            acumulado += self.contagens[indice]
+            if acumulado >= alvo:
+                valor = self._maior_equivalente(indice) / RESOLUCAO
+                return min(max(valor, self.minimo), self.maximo)
+        return self.maximo
+
+    def percentis(self, ps=PERCENTIS_PADRAO):
+        return {p: self.percentil(p) for p in ps}
+
+    def percentis_confiaveis(self, ps=PERCENTIS_PADRAO):
+        """Como ``percentis``, mas ``None`` onde ainda não há amostras suficientes."""
+        return {p: self.percentil(p) if self.total >= amostras_minimas(p) else None for p in ps}
+
+    # ---------------------------------------------------------------
+    # Serialização
+    # ---------------------------------------------------------------
+    def para_dict(self):
+        return {
+            "algarismos": self.algarismos,
+            "contagens": {str(k): v for k, v in self.contagens.items()},
+            "total": self.total,
+            "soma": self.soma,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+        }
+
+    @classmethod
+    def de_dict(cls, dados):
+        h = cls(dados["algarismos"])
+        h.contagens = {int(k): v for k, v in dados["contagens"].items()}
+        h.total = dados["total"]
+        h.soma = dados["soma"]
+        h.minimo = dados["minimo"]
+        h.maximo = dados["maximo"]
+        return h
+
+
+def amostras_minimas(p):
+    """Número de amostras a partir do qual o percentil ``p`` deixa de ser apenas o máximo."""
+    return math.ceil(round(100.0 / (100.0 - p), 6)) if p < 100 else math.inf
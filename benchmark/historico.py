@@ -0,0 +1,272 @@
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from .configuracao import CONFIG
+
+# ===============================================================
+# HISTÓRICO DE EXECUÇÕES
+# ===============================================================
+# Os CSVs em csv/ guardam só a última execução de cada módulo. O histórico é
+# um banco SQLite (sqlite3 da biblioteca padrão) onde cada execução só acrescenta
+# linhas: uma em ``execucoes`` e as amostras brutas em ``amostras``, chaveadas por
+# execução, commit, ambiente, endpoint e cenário. ``metricas_servidor`` guarda a
+# variação do histograma do /metricas em cada cenário, quando coletada. A tabela
+# ``bases`` registra qual execução serve de linha de base por ambiente (vale a
+# marcação mais recente).
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id TEXT PRIMARY KEY,
+    inicio TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    ambiente TEXT NOT NULL,
+    url_base TEXT NOT NULL,
+    modo TEXT NOT NULL,
+    host TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS amostras (
+    execucao TEXT NOT NULL REFERENCES execucoes(id),
+    endpoint TEXT NOT NULL,
+    cenario TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status_esperado INTEGER NOT NULL,
+    tentativa INTEGER NOT NULL,
+    status INTEGER,
+    duracao REAL NOT NULL,
+    conexao REAL NOT NULL,
+    ttfb REAL NOT NULL,
+    transferencia REAL NOT NULL,
+    decodificacao REAL NOT NULL,
+    bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metricas_servidor (
+    execucao TEXT NOT NULL REFERENCES execucoes(id),
+    endpoint TEXT NOT NULL,
+    cenario TEXT NOT NULL,
+    requisicoes INTEGER NOT NULL,
+    soma REAL NOT NULL,
+    contagem REAL NOT NULL,
+    baldes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bases (
+    ambiente TEXT NOT NULL,
+    execucao TEXT NOT NULL REFERENCES execucoes(id),
+    marcada_em TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS amostras_execucao ON amostras (execucao);
+CREATE INDEX IF NOT EXISTS amostras_endpoint_cenario ON amostras (endpoint, cenario);
+CREATE INDEX IF NOT EXISTS execucoes_ambiente_inicio ON execucoes (ambiente, inicio);
+"""
+
+
+@dataclass
+class Execucao:
+    id: str
+    inicio: str
+    git_commit: str
+    ambiente: str
+    url_base: str
+    modo: str
+    host: str
+
+
+def _commit_git():
+    if os.environ.get("BENCH_COMMIT"):
+        return os.environ["BENCH_COMMIT"]
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        saida = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            cwd=raiz, capture_output=True, text=True, timeout=10, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "desconhecido"
+    return saida.stdout.strip()
+
+
+def nova_execucao(modo):
+    agora = datetime.now()
+    return Execucao(
+        id=f"{agora:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}",
+        inicio=agora.isoformat(timespec="seconds"),
+        git_commit=_commit_git(),
+        ambiente=CONFIG.ambiente,
+        url_base=CONFIG.url_base,
+        modo=modo,
+        host=socket.gethostname(),
+    )
+
+
+def endpoint_da_url(url):
+    return urlsplit(url).path or "/"
+
+
+class Historico:
+    """Banco de resultados com uma linha por amostra de cada execução."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        diretorio = os.path.dirname(caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        # WAL + timeout permitem vários processos gravando no mesmo arquivo.
+        self._conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.executescript(ESQUEMA)
+
+    def fechar(self):
+        self._conexao.close()
+
+    def registrar_execucao(self, execucao):
+        with self._conexao:
+            self._conexao.execute(
+                "INSERT OR IGNORE INTO execucoes VALUES (:id, :inicio, :git_commit, :ambiente, :url_base, :modo, :host)",
+                asdict(execucao),
+            )
+
+    def gravar(self, execucao, resultado):
+        """Acrescenta as amostras de um ``ResultadoCenario`` à execução."""
+        endpoint = endpoint_da_url(resultado.url)
+        params = json.dumps(resultado.params, ensure_ascii=False, sort_keys=True, default=str)
+        with self._conexao:
+            self._conexao.executemany(
+                "INSERT INTO amostras VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (execucao.id, endpoint, resultado.descricao, params, resultado.status_esperado,
+                     a.tentativa, a.status, a.duracao, a.conexao, a.ttfb, a.transferencia,
+                     a.decodificacao, a.bytes)
+                    for a in resultado.amostras
+                ],
+            )
+            m = getattr(resultado, "servidor", None)
+            if m is not None:
+                self._conexao.execute(
+                    "INSERT INTO metricas_servidor VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (execucao.id, endpoint, resultado.descricao, m.requisicoes, m.soma, m.contagem,
+                     json.dumps({str(le): v for le, v in sorted(m.baldes.items())})),
+                )
+
+    # -----------------------------------------------------------
+    # Consultas
+    # -----------------------------------------------------------
+    def execucoes(self, ambiente=None, limite=None, modo=None):
+        """Execuções da mais recente para a mais antiga (ordem de gravação), com o total de amostras."""
+        sql = ("SELECT e.*, (SELECT COUNT(*) FROM amostras a WHERE a.execucao = e.id) "
+               "FROM execucoes e")
+        filtros = []
+        args = []
+        if ambiente:
+            filtros.append("e.ambiente = ?")
+            args.append(ambiente)
+        if modo:
+            filtros.append("e.modo = ?")
+            args.append(modo)
+        if filtros:
+            sql += " WHERE " + " AND ".join(filtros)
+        sql += " ORDER BY e.rowid DESC"
+        if limite:
+            sql += " LIMIT ?"
+            args.append(limite)
+        return [(Execucao(*linha[:7]), linha[7]) for linha in self._conexao.execute(sql, args)]
+
+    def execucao(self, id_execucao):
+        linha = self._conexao.execute("SELECT * FROM execucoes WHERE id = ?", (id_execucao,)).fetchone()
+        return Execucao(*linha) if linha else None
+
+    def marcar_base(self, id_execucao):
+        execucao = self.execucao(id_execucao)
+        if execucao is None:
+            raise ValueError(f"Execução não encontrada: {id_execucao}")
+        with self._conexao:
+            self._conexao.execute(
+                "INSERT INTO bases VALUES (?, ?, ?)",
+                (execucao.ambiente, execucao.id, datetime.now().isoformat(timespec="seconds")),
+            )
+        return execucao
+
+    def base(self, ambiente):
+        """Id da execução marcada como linha de base do ambiente (ou ``None``)."""
+        linha = self._conexao.execute(
+            "SELECT execucao FROM bases WHERE ambiente = ? ORDER BY marcada_em DESC, rowid DESC LIMIT 1",
+            (ambiente,),
+        ).fetchone()
+        return linha[0] if linha else None
+
+    def anterior(self, id_execucao):
+        """Id da execução imediatamente anterior no mesmo ambiente e modo (ou ``None``)."""
+        linha = self._conexao.execute(
+            "SELECT e.id FROM execucoes e JOIN execucoes atual ON atual.id = ? "
+            "WHERE e.ambiente = atual.ambiente AND e.modo = atual.modo AND e.rowid < atual.rowid "
+            "ORDER BY e.rowid DESC LIMIT 1",
+            (id_execucao,),
+        ).fetchone()
+        return linha[0] if linha else None
+
+    def resolver(self, referencia, ambiente, atual=None):
+        """Traduz ``"base"``, ``"anterior"`` (relativa a ``atual``) ou um id em id de execução."""
+        if referencia == "base":
+            return self.base(ambiente)
+        if referencia == "anterior":
+            return self.anterior(atual) if atual else None
+        return referencia if self.execucao(referencia) else None
+
+    def duracoes(self, id_execucao):
+        """``{(endpoint, cenario): [duracao, ...]}`` das respostas com o status esperado."""
+        resultado = {}
+        for endpoint, cenario, duracao in self._conexao.execute(
+            "SELECT endpoint, cenario, duracao FROM amostras WHERE execucao = ? AND status = status_esperado",
+            (id_execucao,),
+        ):
+            resultado.setdefault((endpoint, cenario), []).append(duracao)
+        return resultado
+
+    def tendencia(self, endpoint, cenario, ambiente=None, limite=None):
+        """Evolução de um cenário: ``(execucao, amostras)`` da mais antiga para a mais recente."""
+        sql = ("SELECT e.id, e.inicio, e.git_commit, e.ambiente, a.duracao FROM amostras a "
+               "JOIN execucoes e ON e.id = a.execucao "
+               "WHERE a.endpoint = ? AND a.cenario = ? AND a.status = a.status_esperado")
+        args = [endpoint, cenario]
+        if ambiente:
+            sql += " AND e.ambiente = ?"
+            args.append(ambiente)
+        por_execucao = {}
+        for id_execucao, inicio, commit, amb, duracao in self._conexao.execute(sql + " ORDER BY e.rowid", args):
+            por_execucao.setdefault((id_execucao, inicio, commit, amb), []).append(duracao)
+        serie = list(por_execucao.items())
+        return serie[-limite:] if limite else serie
+
+
+# ===============================================================
+# EXECUÇÃO CORRENTE DO PROCESSO
+# ===============================================================
+_historico = None
+_execucao = None
+
+
+def execucao_corrente():
+    """Execução gravada por este processo até agora (ou ``None``)."""
+    return _execucao
+
+
+def registrar_resultado(resultado, modo="pytest"):
+    """Grava o resultado na execução corrente (criada na primeira chamada).
+
+    Não faz nada quando o histórico está desligado (``CONFIG.historico`` vazio).
+    """
+    global _historico, _execucao
+    if not CONFIG.historico:
+        return None
+    if _historico is None or _historico.caminho != CONFIG.historico:
+        _historico = Historico(CONFIG.historico)
+        _execucao = None
+    if _execucao is None:
+        _execucao = nova_execucao(modo)
+        _historico.registrar_execucao(_execucao)
+    _historico.gravar(_execucao, resultado)
+    return _execucao
@@ -0,0 +1,106 @@
+import codecs
+import json
+import re
+
+# ===============================================================
+# LEITURA INCREMENTAL DE LISTAS JSON
+# ===============================================================
+# Respostas como consumo-temporal com limit=100000 chegam a dezenas de MB.
+# Em vez de montar a lista inteira com resp.json(), o corpo é consumido em
+# blocos e cada item é decodificado (json.JSONDecoder.raw_decode, em C) assim
+# que termina de chegar; a memória fica limitada a um bloco mais um item.
+TAMANHO_BLOCO = 64 * 1024  # bytes
+
+_ESPACOS = re.compile(r"[ \t\n\r]*")
+_RESTO_NUMERO = re.compile(r"[0-9.eE+-]*\Z")
+_DECODIFICADOR = json.JSONDecoder()
+
+_INICIO, _PRIMEIRO, _ITEM, _SEPARADOR, _FIM = range(5)
+
+
+class LeitorListaJSON:
+    """Decodifica uma lista JSON de nível superior recebida em blocos de bytes.
+
+    Uso::
+
+        leitor = LeitorListaJSON()
+        for bloco in resp.iter_content(TAMANHO_BLOCO):
+            for item in leitor.alimentar(bloco):
+                ...
+        for item in leitor.finalizar():
+            ...
+    """
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._texto = ""
+        self._pos = 0
+        self._estado = _INICIO
+        self.itens = 0
+        self.bytes = 0
+
+    def alimentar(self, bloco):
+        self.bytes += len(bloco)
+        self._acrescentar(self._utf8.decode(bloco))
+        return self._extrair(final=False)
+
+    def finalizar(self):
+        self._acrescentar(self._utf8.decode(b"", final=True))
+        yield from self._extrair(final=True)
+        if self._estado != _FIM:
+            raise json.JSONDecodeError("Lista JSON incompleta", self._texto, self._pos)
+
+    def _acrescentar(self, texto):
+        # Descarta o que já foi consumido uma vez por bloco, não a cada item.
+        self._texto = self._texto[self._pos:] + texto
+        self._pos = 0
+
+    def _extrair(self, final):
+        texto = self._texto
+        n = len(texto)
+        while True:
+            pos = _ESPACOS.match(texto, self._pos).end()
+            self._pos = pos
+            if pos >= n:
+                return
+            c = texto[pos]
+
+            if self._estado == _INICIO:
+                if c != "[":
+                    raise ValueError("Resposta deve ser uma lista JSON")
+                self._pos, self._estado = pos + 1, _PRIMEIRO
+
+            elif self._estado == _SEPARADOR or (self._estado == _PRIMEIRO and c == "]"):
+                if c == "]":
+                    self._pos, self._estado = pos + 1, _FIM
+                elif c == ",":
+                    self._pos, self._estado = pos + 1, _ITEM
+                else:
+                    raise json.JSONDecodeError("Esperado ',' ou ']'", texto, pos)
+
+            elif self._estado == _FIM:
+                raise json.JSONDecodeError("Conteúdo extra após a lista", texto, pos)
+
+            else:
+                try:
+                    item, fim = _DECODIFICADOR.raw_decode(texto, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    return  # item ainda incompleto: aguarda o próximo bloco
+                if (not final and isinstance(item, (int, float)) and not isinstance(item, bool)
+                        and _RESTO_NUMERO.match(texto, fim)):
+                    # Número no fim do bloco: pode ter mais dígitos, e "1." ou "1e" cortados
+                    # decodificam só o "1", deixando o resto como se fosse lixo.
+                    return
+                self._pos, self._estado = fim, _SEPARADOR
+                self.itens += 1
+                yield item
+
+
+def iterar_lista(resp, tamanho_bloco=TAMANHO_BLOCO):
+    """Itera pelos itens de uma resposta ``requests`` obtida com ``stream=True``."""
+    leitor = LeitorListaJSON()
+    for bloco in resp.iter_content(tamanho_bloco):
+        yield from leitor.alimentar(bloco)
+    yield from leitor.finalizar()
@@ -0,0 +1,109 @@
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .carga import ResultadoCarga
+from .metricas import anexar_ao_resultado, coletor_para
+from .motor import TIMEOUT_PADRAO, Amostra, ResultadoCenario, formatar_percentis, medir_requisicao, nova_sessao
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+MAX_EM_VOO_PADRAO = 256
+
+
+# ===============================================================
+# RESULTADO DE UMA EXECUÇÃO EM MALHA ABERTA
+# ===============================================================
+@dataclass
+class ResultadoTaxaConstante(ResultadoCarga):
+    """Resultado em malha aberta.
+
+    ``cenarios`` guarda a latência corrigida (do instante previsto de envio até
+    a resposta) e ``servico`` o tempo de serviço puro (do envio real até a
+    resposta), que é o que um laço fechado mediria.
+    """
+    taxa_alvo: float = 0.0
+    servico: dict = field(default_factory=dict)
+    atraso_maximo: float = 0.0
+
+
+# ===============================================================
+# EXECUÇÃO À TAXA CONSTANTE
+# ===============================================================
+def executar_taxa_constante(cenarios, taxa, duracao, max_em_voo=MAX_EM_VOO_PADRAO, timeout=TIMEOUT_PADRAO,
+                            intervalo_metricas=None):
+    """Dispara ``taxa`` requisições por segundo durante ``duracao`` segundos.
+
+    A agenda de envio é fixa (``inicio + k / taxa``) e não depende das
+    respostas: se o servidor trava, as requisições seguintes esperam na fila e
+    essa espera entra na latência corrigida, evitando a omissão coordenada do
+    laço fechado. ``max_em_voo`` limita as conexões simultâneas do cliente.
+    ``intervalo_metricas`` liga a leitura periódica do /metricas, como em
+    ``executar_carga``.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+    if taxa <= 0:
+        raise ValueError("A taxa alvo deve ser positiva")
+    total = int(taxa * duracao)
+    if total < 1:
+        raise ValueError(f"{taxa:g} req/s por {duracao:g}s não agenda nenhuma requisição")
+
+    print(f"\n=== Malha aberta: {len(cenarios)} cenário(s), {taxa:g} req/s por {duracao:g}s ({total} req) ===")
+
+    local = threading.local()
+    sessoes = []
+    trava = threading.Lock()
+
+    def _sessao():
+        if not hasattr(local, "sessao"):
+            local.sessao = nova_sessao()
+            with trava:
+                sessoes.append(local.sessao)
+        return local.sessao
+
+    def _disparar(k, cenario, previsto):
+        inicio_real = time.perf_counter()
+        resp, servico = medir_requisicao(_sessao(), cenario.url, cenario.params, timeout, tolerar_falhas=True)
+        status = resp.status_code if resp is not None else None
+        return cenario, k, status, inicio_real - previsto, servico
+
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    inicio = time.perf_counter()
+    futuros = []
+    with coletor or contextlib.nullcontext(), ThreadPoolExecutor(max_workers=max_em_voo) as executor:
+        for k in range(total):
+            previsto = inicio + k / taxa
+            espera = previsto - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            futuros.append(executor.submit(_disparar, k + 1, cenarios[k % len(cenarios)], previsto))
+        coletado = [f.result() for f in futuros]
+    for s in sessoes:
+        s.close()
+
+    resultado = ResultadoTaxaConstante(max_em_voo, time.perf_counter() - inicio, taxa_alvo=taxa)
+    for cenario, k, status, atraso, servico in coletado:
+        for destino in (resultado.cenarios, resultado.servico):
+            if cenario.chave not in destino:
+                destino[cenario.chave] = ResultadoCenario(
+                    cenario.descricao, cenario.params, cenario.status_esperado, url=cenario.url
+                )
+        resultado.cenarios[cenario.chave].amostras.append(Amostra(k, status, atraso + servico))
+        resultado.servico[cenario.chave].amostras.append(Amostra(k, status, servico))
+        resultado.atraso_maximo = max(resultado.atraso_maximo, atraso)
+
+    for chave, r in resultado.cenarios.items():
+        print(f"➡️ {chave}: {len(r.amostras)} req | {resultado.vazao_cenario(chave):.2f} req/s")
+        print(f"   Corrigido: {formatar_percentis(r.percentis())}")
+        print(f"   Serviço:   {formatar_percentis(resultado.servico[chave].percentis())}")
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s de {taxa:g} alvo), {resultado.total_erros} erro(s), "
+          f"maior atraso de envio {resultado.atraso_maximo:.3f}s")
+
+    return resultado
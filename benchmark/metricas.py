@@ -0,0 +1,213 @@
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+
+from .configuracao import CONFIG
+from .prometheus import LeitorExposicao, texto_exposicao
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+CAMINHO_METRICAS = "/metricas"
+METRICA_REQUISICOES = "api_requests_total"
+METRICA_DURACAO = "api_request_duration_seconds"
+ROTULO_ENDPOINT = "endpoint"
+QUANTIS_SERVIDOR = (50.0, 90.0, 99.0)
+TIMEOUT_COLETA = 10  # segundos
+
+
+# ===============================================================
+# ESTADO DOS CONTADORES POR ENDPOINT
+# ===============================================================
+@dataclass
+class EstadoEndpoint:
+    requisicoes: dict = field(default_factory=dict)  # status -> total
+    baldes: dict = field(default_factory=dict)  # limite superior (le) -> contagem acumulada
+    soma: float = 0.0
+    contagem: float = 0.0
+
+
+def instantaneo(texto):
+    """``{endpoint: EstadoEndpoint}`` somando os métodos HTTP."""
+    estados = {}
+    for a in LeitorExposicao().amostras(texto.splitlines()):
+        if a.familia != METRICA_REQUISICOES and a.familia != METRICA_DURACAO:
+            continue
+        endpoint = a.rotulos.get(ROTULO_ENDPOINT)
+        if endpoint is None:
+            continue
+        estado = estados.setdefault(endpoint, EstadoEndpoint())
+        if a.familia == METRICA_REQUISICOES:
+            status = a.rotulos.get("status_code", "")
+            estado.requisicoes[status] = estado.requisicoes.get(status, 0) + a.valor
+        elif a.nome.endswith("_bucket"):
+            le = a.balde
+            estado.baldes[le] = estado.baldes.get(le, 0) + a.valor
+        elif a.nome.endswith("_sum"):
+            estado.soma += a.valor
+        elif a.nome.endswith("_count"):
+            estado.contagem += a.valor
+    return estados
+
+
+def localizar(url):
+    """``(url_base, endpoint)`` de uma URL de cenário, para achar o /metricas e o rótulo."""
+    try:
+        base = CONFIG.url_base
+    except ValueError:
+        base = None
+    if base and url.startswith(base):
+        return base, urlsplit(url[len(base):]).path or "/"
+    partes = urlsplit(url)
+    return f"{partes.scheme}://{partes.netloc}", partes.path or "/"
+
+
+def coletar(session, url_base=None, timeout=TIMEOUT_COLETA):
+    """Lê /metricas do ambiente selecionado; ``None`` se não for possível."""
+    try:
+        resp = session.get((url_base or CONFIG.url_base) + CAMINHO_METRICAS, timeout=timeout)
+        if resp.status_code != 200:
+            return None
+        return instantaneo(texto_exposicao(resp))
+    except (requests.RequestException, ValueError):
+        return None
+
+
+# ===============================================================
+# VARIAÇÃO ENTRE DUAS COLETAS
+# ===============================================================
+@dataclass
+class MetricasServidor:
+    """Variação dos contadores de um endpoint entre duas coletas de /metricas."""
+    endpoint: str
+    por_status: dict = field(default_factory=dict)
+    baldes: dict = field(default_factory=dict)
+    soma: float = 0.0
+    contagem: float = 0.0
+
+    @property
+    def requisicoes(self):
+        return int(sum(self.por_status.values()))
+
+    @property
+    def media(self):
+        return self.soma / self.contagem if self.contagem else None
+
+    def quantil(self, p):
+        """Estimativa por interpolação linear dentro do balde, como ``histogram_quantile``."""
+        if not self.contagem or not self.baldes:
+            return None
+        alvo = p / 100.0 * self.contagem
+        anterior_le, anterior_contagem = 0.0, 0.0
+        for le in sorted(self.baldes):
+            contagem = self.baldes[le]
+            if contagem >= alvo:
+                if math.isinf(le):
+                    return anterior_le
+                if contagem == anterior_contagem:
+                    return le
+                return anterior_le + (le - anterior_le) * (alvo - anterior_contagem) / (contagem - anterior_contagem)
+            anterior_le, anterior_contagem = le, contagem
+        return anterior_le
+
+    def quantis(self, ps=QUANTIS_SERVIDOR):
+        return {p: self.quantil(p) for p in ps}
+
+
+def diferenca(antes, depois, endpoint):
+    """Variação de ``endpoint`` entre duas coletas (``None`` se alguma falhou)."""
+    if antes is None or depois is None:
+        return None
+    a = antes.get(endpoint, EstadoEndpoint())
+    d = depois.get(endpoint, EstadoEndpoint())
+    return MetricasServidor(
+        endpoint,
+        por_status={s: v - a.requisicoes.get(s, 0) for s, v in d.requisicoes.items() if v - a.requisicoes.get(s, 0)},
+        baldes={le: v - a.baldes.get(le, 0) for le, v in d.baldes.items()},
+        soma=d.soma - a.soma,
+        contagem=d.contagem - a.contagem,
+    )
+
+
+def formatar_metricas_servidor(m):
+    if m is None:
+        return "indisponível"
+    if not m.contagem:
+        return f"{m.requisicoes} req, sem duração registrada"
+    quantis = " | ".join(f"p{p:g}: {v:.3f}s" for p, v in m.quantis().items() if v is not None)
+    return f"{m.requisicoes} req | média {m.media:.3f}s | {quantis}"
+
+
+# ===============================================================
+# COLETA PERIÓDICA DURANTE A CARGA
+# ===============================================================
+class ColetorPeriodico:
+    """Lê /metricas a cada ``intervalo`` segundos numa thread própria.
+
+    Uso::
+
+        with ColetorPeriodico(1.0) as coletor:
+            ...  # carga
+        coletor.variacao(endpoint)  # da primeira à última coleta
+    """
+
+    def __init__(self, intervalo, url_base=None):
+        self.intervalo = intervalo
+        self.url_base = url_base or CONFIG.url_base
+        self.coletas = []  # (instante relativo, {endpoint: EstadoEndpoint})
+        self._sessao = requests.Session()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._laco, daemon=True)
+        self._inicio = None
+
+    def _coletar(self):
+        estado = coletar(self._sessao, self.url_base)
+        if estado is not None:
+            self.coletas.append((time.perf_counter() - self._inicio, estado))
+
+    def _laco(self):
+        while not self._parar.wait(self.intervalo):
+            self._coletar()
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        self._coletar()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._parar.set()
+        self._thread.join()
+        self._coletar()
+        self._sessao.close()
+
+    def variacao(self, endpoint):
+        if len(self.coletas) < 2:
+            return None
+        return diferenca(self.coletas[0][1], self.coletas[-1][1], endpoint)
+
+    def serie(self, endpoint):
+        """``[(instante, MetricasServidor do intervalo)]`` entre coletas consecutivas."""
+        return [
+            (t, diferenca(anterior, atual, endpoint))
+            for (_, anterior), (t, atual) in zip(self.coletas, self.coletas[1:])
+        ]
+
+
+def coletor_para(cenarios, intervalo):
+    """``ColetorPeriodico`` no servidor dos cenários, ou ``None`` sem ``intervalo``."""
+    return ColetorPeriodico(intervalo, localizar(cenarios[0].url)[0]) if intervalo else None
+
+
+def anexar_ao_resultado(resultado, coletor, cenarios):
+    """Preenche ``resultado.servidor`` e ``resultado.serie_servidor`` por endpoint e imprime o resumo."""
+    for endpoint in dict.fromkeys(localizar(c.url)[1] for c in cenarios):
+        resultado.servidor[endpoint] = coletor.variacao(endpoint)
+        resultado.serie_servidor[endpoint] = coletor.serie(endpoint)
+        p99s = [m.quantil(99.0) for _, m in resultado.serie_servidor[endpoint] if m is not None and m.contagem]
+        pior = f" | pior p99 em {coletor.intervalo:g}s: {max(p99s):.3f}s" if p99s else ""
+        print(f"🖥️ {endpoint}: {formatar_metricas_servidor(resultado.servidor[endpoint])}{pior}")
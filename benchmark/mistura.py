@@ -0,0 +1,297 @@
+import contextlib
+import importlib.util
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from .carga import ResultadoCarga
+from .catalogo import carregar_cenarios
+from .malha_aberta import MAX_EM_VOO_PADRAO, ResultadoTaxaConstante
+from .metricas import anexar_ao_resultado, coletor_para, localizar
+from .motor import TIMEOUT_PADRAO, Amostra, ResultadoCenario, formatar_percentis, medir_requisicao, nova_sessao
+from .varredura import descobrir_medidores, dominio_medidores
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+PENSAR_PADRAO = 5.0  # segundos médios entre requisições de um usuário (laço fechado)
+MEDIDORES_RESERVA = list(range(1, 51))  # quando não dá para descobrir os ids reais, como nos testes
+
+
+# ===============================================================
+# DISTRIBUIÇÕES DE PARÂMETROS
+# ===============================================================
+# Cada variação sorteia parâmetros que substituem os do cenário do catálogo;
+# ``parametros`` lista os que ela controla, para os relatórios.
+@dataclass
+class JanelaDatas:
+    """``data_inicio``/``data_fim`` de uma janela terminando hoje, com a largura sorteada em dias."""
+    dias: tuple = (1, 7, 30)
+    pesos: tuple = (6, 3, 1)
+    parametros = ("data_inicio", "data_fim")
+
+    def sortear(self, sorteio, medidores):
+        dias = sorteio.choices(self.dias, self.pesos)[0]
+        hoje = date.today()
+        return {"data_inicio": (hoje - timedelta(days=dias - 1)).isoformat(), "data_fim": hoje.isoformat()}
+
+
+@dataclass
+class ListaMedidores:
+    """``medidor_ids`` com ``n`` ids distintos sorteados entre os existentes no domínio."""
+    tamanhos: tuple = (1, 4, 10)
+    pesos: tuple = (5, 3, 1)
+    parametros = ("medidor_ids",)
+
+    def sortear(self, sorteio, medidores):
+        n = sorteio.choices(self.tamanhos, self.pesos)[0]
+        return {"medidor_ids": sorteio.sample(medidores, min(n, len(medidores)))}
+
+
+@dataclass
+class Escolha:
+    """Um valor de ``parametro`` sorteado entre ``valores``."""
+    parametro: str
+    valores: tuple
+    pesos: tuple = None
+
+    @property
+    def parametros(self):
+        return (self.parametro,)
+
+    def sortear(self, sorteio, medidores):
+        return {self.parametro: sorteio.choices(self.valores, self.pesos)[0]}
+
+
+# ===============================================================
+# MODELO DE TRÁFEGO
+# ===============================================================
+@dataclass
+class Fluxo:
+    """Uma classe de requisição: um cenário do catálogo, sua taxa e o que varia entre requisições."""
+    modulo: str  # ex.: energia/test_consumo_temporal.py
+    cenario: str  # descrição do cenário no módulo
+    taxa: float  # req/s com escala 1; em laço fechado vira o peso no sorteio
+    variacoes: tuple = ()
+    nome: str = None  # rótulo nos relatórios (padrão: módulo::cenário)
+
+    @property
+    def rotulo(self):
+        return self.nome or f"{self.modulo}::{self.cenario}"
+
+
+@dataclass
+class ModeloTrafego:
+    fluxos: list
+    pensar: float = PENSAR_PADRAO
+
+    @property
+    def taxa_total(self):
+        return sum(f.taxa for f in self.fluxos)
+
+
+# Proporções assumidas para o uso em produção: os painéis (dashboard-operacional
+# e status-medidores) recarregam o tempo todo; consultas com filtro são
+# ocasionais; comparação e exportações com limit 100000 são raras.
+MODELO_PADRAO = ModeloTrafego([
+    Fluxo("energia/test_dashboard_operacional.py", "Sem parâmetros", 5.0),
+    Fluxo("temperatura_e_humidade/test_dashboard_operacional.py", "Sem parâmetros", 5.0),
+    Fluxo("temperatura_e_humidade/test_status_medidores.py", "Sem parâmetros", 4.0),
+    Fluxo("energia/test_consumo_temporal.py", "Intervalo 3 dias", 2.0,
+          (JanelaDatas((1, 3, 7, 30), (3, 4, 2, 1)), ListaMedidores())),
+    Fluxo("energia/test_estatisticas_gerais.py", "Sem parâmetros", 1.0, (JanelaDatas(),)),
+    Fluxo("energia/test_top_consumidores.py", "Top 10 padrão", 1.0, (JanelaDatas(), Escolha("top_n", (5, 10, 50)))),
+    Fluxo("temperatura_e_humidade/test_series_temporais.py", "Medidor 2, limit 50", 1.0,
+          (ListaMedidores((1, 2, 4), (6, 3, 1)),)),
+    Fluxo("energia/test_comparacao_medidores.py", "Intervalo 3 dias", 0.2, (JanelaDatas((3, 7, 30), (5, 3, 2)),)),
+    Fluxo("energia/test_consumo_temporal.py", "Limit 100000", 0.05, nome="Exportação consumo-temporal"),
+])
+
+
+def carregar_modelo(caminho):
+    """Lê ``MODELO`` (um ``ModeloTrafego``) de um arquivo Python."""
+    spec = importlib.util.spec_from_file_location("modelo_trafego", caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.MODELO
+
+
+# ===============================================================
+# PREPARAÇÃO
+# ===============================================================
+@dataclass
+class _FluxoPronto:
+    fluxo: Fluxo
+    cenario: object  # Cenario do catálogo
+    medidores: list = field(default_factory=list)
+
+    def requisicao(self, sorteio):
+        params = dict(self.cenario.params)
+        for variacao in self.fluxo.variacoes:
+            params.update(variacao.sortear(sorteio, self.medidores))
+        return params
+
+    def novo_resultado(self):
+        sorteados = {p: "sorteado" for v in self.fluxo.variacoes for p in v.parametros}
+        params = {**self.cenario.params, **sorteados}
+        return ResultadoCenario(self.fluxo.rotulo, params, self.cenario.status_esperado, url=self.cenario.url)
+
+
+def _preparar(modelo, timeout):
+    """Resolve os cenários no catálogo e descobre os ids de medidor dos fluxos que os sorteiam."""
+    if not modelo.fluxos or modelo.taxa_total <= 0:
+        raise ValueError("O modelo de tráfego precisa de ao menos um fluxo com taxa positiva")
+    catalogo = {}
+    medidores = {}
+    prontos = []
+    sessao = nova_sessao()
+    try:
+        for fluxo in modelo.fluxos:
+            if fluxo.modulo not in catalogo:
+                catalogo[fluxo.modulo] = {c.descricao: c for c in carregar_cenarios(fluxo.modulo)}
+            cenario = catalogo[fluxo.modulo].get(fluxo.cenario)
+            if cenario is None:
+                raise ValueError(f"Cenário {fluxo.cenario!r} não existe em {fluxo.modulo}")
+            pronto = _FluxoPronto(fluxo, cenario)
+            if any(isinstance(v, ListaMedidores) for v in fluxo.variacoes):
+                dominio = dominio_medidores(localizar(cenario.url)[1])
+                if dominio not in medidores:
+                    descobertos = descobrir_medidores(sessao, dominio, timeout) if dominio else []
+                    medidores[dominio] = descobertos or MEDIDORES_RESERVA
+                pronto.medidores = medidores[dominio]
+            prontos.append(pronto)
+    finally:
+        sessao.close()
+    return prontos
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def executar_mistura(modelo=MODELO_PADRAO, duracao=60.0, usuarios=None, escala=1.0, max_em_voo=MAX_EM_VOO_PADRAO,
+                     timeout=TIMEOUT_PADRAO, semente=None, intervalo_metricas=None):
+    """Gera tráfego segundo ``modelo`` por ``duracao`` segundos.
+
+    Sem ``usuarios`` a carga é em malha aberta: chegadas de Poisson à taxa
+    ``escala × modelo.taxa_total``, cada uma de um fluxo sorteado pela sua
+    taxa, com latência corrigida como em ``executar_taxa_constante``. Com
+    ``usuarios`` é um laço fechado em que cada usuário sorteia o fluxo pelo
+    mesmo peso e espera um tempo de pensar exponencial de média
+    ``modelo.pensar`` entre requisições. Os parâmetros de cada requisição são
+    sorteados das variações do fluxo.
+    """
+    prontos = _preparar(modelo, timeout)
+    pesos = [p.fluxo.taxa for p in prontos]
+    sorteio = random.Random(semente)
+    if usuarios:
+        print(f"\n=== Mistura (laço fechado): {len(prontos)} fluxo(s), {usuarios} usuário(s), "
+              f"pensar {modelo.pensar:g}s, {duracao:g}s ===")
+    else:
+        print(f"\n=== Mistura (malha aberta): {len(prontos)} fluxo(s), {escala * modelo.taxa_total:g} req/s, "
+              f"{duracao:g}s ===")
+
+    cenarios = [p.cenario for p in prontos]
+    coletor = coletor_para(cenarios, intervalo_metricas)
+    inicio = time.perf_counter()
+    with coletor or contextlib.nullcontext():
+        if usuarios:
+            coletado = _laco_fechado(prontos, pesos, usuarios, modelo.pensar, duracao, timeout, sorteio)
+            resultado = ResultadoCarga(usuarios, time.perf_counter() - inicio)
+        else:
+            coletado = _malha_aberta(prontos, pesos, escala * modelo.taxa_total, duracao, max_em_voo, timeout, sorteio)
+            resultado = ResultadoTaxaConstante(max_em_voo, time.perf_counter() - inicio,
+                                               taxa_alvo=escala * modelo.taxa_total)
+
+    for pronto in prontos:
+        resultado.cenarios.setdefault(pronto.fluxo.rotulo, pronto.novo_resultado())
+        if isinstance(resultado, ResultadoTaxaConstante):
+            resultado.servico.setdefault(pronto.fluxo.rotulo, pronto.novo_resultado())
+    for pronto, amostra, servico in coletado:
+        resultado.cenarios[pronto.fluxo.rotulo].amostras.append(amostra)
+        if servico is not None:
+            resultado.servico[pronto.fluxo.rotulo].amostras.append(servico)
+            resultado.atraso_maximo = max(resultado.atraso_maximo, amostra.duracao - servico.duracao)
+    resultado.cenarios = {k: r for k, r in resultado.cenarios.items() if r.amostras}
+
+    _imprimir(resultado, {p.fluxo.rotulo: p.fluxo.taxa for p in prontos})
+    if not resultado.total_requisicoes:
+        print("⚠️ Nenhuma chegada no período: aumente --duracao ou --escala")
+    if coletor is not None:
+        anexar_ao_resultado(resultado, coletor, cenarios)
+    return resultado
+
+
+def _laco_fechado(prontos, pesos, usuarios, pensar, duracao, timeout, sorteio):
+    fim = time.perf_counter() + duracao
+    sementes = [sorteio.random() for _ in range(usuarios)]
+
+    def usuario(semente):
+        local = random.Random(semente)
+        sessao = nova_sessao()
+        coletado = []
+        try:
+            # cada usuário entra num ponto aleatório do ciclo, e não todos juntos; na primeira metade
+            # da execução, para que mesmo uma execução mais curta que ``pensar`` meça todos os usuários
+            time.sleep(local.uniform(0, min(pensar, duracao / 2)))
+            while time.perf_counter() < fim:
+                pronto = local.choices(prontos, pesos)[0]
+                resp, duracao_req = medir_requisicao(sessao, pronto.cenario.url, pronto.requisicao(local), timeout,
+                                                     tolerar_falhas=True)
+                status = resp.status_code if resp is not None else None
+                coletado.append((pronto, Amostra(len(coletado) + 1, status, duracao_req), None))
+                time.sleep(min(local.expovariate(1 / pensar) if pensar > 0 else 0.0,
+                               max(0.0, fim - time.perf_counter())))
+        finally:
+            sessao.close()
+        return coletado
+
+    with ThreadPoolExecutor(max_workers=usuarios) as executor:
+        return [item for parte in executor.map(usuario, sementes) for item in parte]
+
+
+def _malha_aberta(prontos, pesos, taxa, duracao, max_em_voo, timeout, sorteio):
+    local = threading.local()
+    sessoes = []
+    trava = threading.Lock()
+
+    def _disparar(k, pronto, params, previsto):
+        if not hasattr(local, "sessao"):
+            local.sessao = nova_sessao()
+            with trava:
+                sessoes.append(local.sessao)
+        inicio_real = time.perf_counter()
+        resp, servico = medir_requisicao(local.sessao, pronto.cenario.url, params, timeout, tolerar_falhas=True)
+        status = resp.status_code if resp is not None else None
+        atraso = inicio_real - previsto
+        return pronto, Amostra(k, status, atraso + servico), Amostra(k, status, servico)
+
+    inicio = time.perf_counter()
+    futuros = []
+    instante = sorteio.expovariate(taxa)
+    with ThreadPoolExecutor(max_workers=max_em_voo) as executor:
+        while instante < duracao:
+            previsto = inicio + instante
+            espera = previsto - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            pronto = sorteio.choices(prontos, pesos)[0]
+            futuros.append(executor.submit(_disparar, len(futuros) + 1, pronto, pronto.requisicao(sorteio), previsto))
+            instante += sorteio.expovariate(taxa)
+        coletado = [f.result() for f in futuros]
+    for s in sessoes:
+        s.close()
+    return coletado
+
+
+def _imprimir(resultado, taxas):
+    total_taxa = sum(taxas.values())
+    for chave, r in resultado.cenarios.items():
+        fracao = len(r.amostras) / resultado.total_requisicoes if resultado.total_requisicoes else 0.0
+        print(f"➡️ {chave}: {len(r.amostras)} req ({fracao:.1%} do total, alvo {taxas[chave] / total_taxa:.1%}) | "
+              f"{resultado.vazao_cenario(chave):.2f} req/s")
+        print(f"   {formatar_percentis(r.percentis())}")
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.2f}s "
+          f"({resultado.vazao:.2f} req/s), {resultado.total_erros} erro(s)")
@@ -0,0 +1,407 @@
+import math
+import statistics
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .configuracao import CONFIG
+from .histograma import PERCENTIS_PADRAO, Histograma
+from .leitor_json import TAMANHO_BLOCO, LeitorListaJSON
+from .metricas import coletar, diferenca, formatar_metricas_servidor, localizar
+from .regressao import intervalo_quantil
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+HEADERS = {"accept": "application/json"}
+TIMEOUT_PADRAO = 30  # segundos
+FASES = ("conexao", "ttfb", "transferencia", "decodificacao")
+# Uma tentativa está "aquecida" quando fica até TOLERANCIA_REGIME acima da latência de regime.
+TOLERANCIA_REGIME = 0.10
+# Quebra de cache: parâmetro extra com valor único por tentativa e sufixo na descrição do
+# cenário (o histórico e os CSVs não misturam cache frio com a execução normal).
+PARAMETRO_QUEBRA_CACHE = "_nocache"
+SUFIXO_SEM_CACHE = "(sem cache)"
+# Repetições adaptativas (CONFIG.precisao > 0): nunca menos que o mínimo nem mais que o máximo.
+REPETICOES_MINIMAS = 5
+REPETICOES_MAXIMAS = 1000
+CONFIANCA = 0.95
+
+
+# ===============================================================
+# ESTRUTURAS DE RESULTADO
+# ===============================================================
+@dataclass
+class Amostra:
+    tentativa: int
+    status: int
+    duracao: float  # tempo de rede: conexao + ttfb + transferencia
+    decodificacao: float = 0.0  # decodificação + validação, fora de ``duracao``
+    conexao: float = 0.0
+    ttfb: float = 0.0
+    transferencia: float = 0.0
+    bytes: int = 0
+    itens: int = None  # tamanho da lista, só na leitura em fluxo (validar_item)
+
+
+@dataclass
+class ResultadoCenario:
+    descricao: str
+    params: dict
+    status_esperado: int
+    amostras: list = field(default_factory=list)
+    url: str = ""
+    servidor: object = None  # MetricasServidor do endpoint durante o cenário (/metricas)
+
+    @property
+    def tempos(self):
+        return [a.duracao for a in self.amostras]
+
+    @property
+    def status_real(self):
+        return self.amostras[-1].status if self.amostras else None
+
+    @property
+    def sucesso(self):
+        return bool(self.amostras) and all(a.status == self.status_esperado for a in self.amostras)
+
+    @property
+    def media(self):
+        return sum(self.tempos) / len(self.tempos)
+
+    @property
+    def minimo(self):
+        return min(self.tempos)
+
+    @property
+    def maximo(self):
+        return max(self.tempos)
+
+    @property
+    def frio(self):
+        """Duração da primeira tentativa, com o cache do servidor ainda frio."""
+        return self.amostras[0].duracao if self.amostras else None
+
+    @property
+    def regime(self):
+        """Mediana da segunda metade das tentativas: a latência com o cache aquecido."""
+        if len(self.amostras) < 2:
+            return None
+        return statistics.median(self.tempos[len(self.tempos) // 2:])
+
+    @property
+    def aquecimento(self):
+        """Tentativas iniciais acima de ``(1 + TOLERANCIA_REGIME) × regime`` (0 = nenhuma)."""
+        regime = self.regime
+        if regime is None:
+            return None
+        limite = regime * (1 + TOLERANCIA_REGIME)
+        return next((i for i, t in enumerate(self.tempos) if t <= limite), len(self.tempos))
+
+    def curva_aquecimento(self):
+        """Cada tentativa como múltiplo do regime (1.0 = aquecida)."""
+        regime = self.regime
+        return [t / regime for t in self.tempos] if regime else []
+
+    def intervalo(self, p=50.0, confianca=CONFIANCA):
+        """Intervalo de confiança do percentil ``p``; ``None`` com amostras insuficientes."""
+        return intervalo_quantil(self.tempos, p, confianca)
+
+    def precisao(self, p=50.0, confianca=CONFIANCA):
+        """Meia-largura do intervalo de ``p`` como fração do percentil (0.05 = ±5%); ``inf`` sem intervalo."""
+        intervalo = self.intervalo(p, confianca)
+        estimativa = self.histograma.percentil(p) if self.amostras else 0
+        if intervalo is None or not estimativa:
+            return math.inf
+        return (intervalo[1] - intervalo[0]) / 2 / estimativa
+
+    def fases_medias(self):
+        """Média de cada fase (``conexao``, ``ttfb``, ``transferencia``, ``decodificacao``) e de ``bytes``."""
+        return {fase: sum(getattr(a, fase) for a in self.amostras) / len(self.amostras) for fase in FASES + ("bytes",)}
+
+    @property
+    def histograma(self):
+        h = Histograma()
+        for t in self.tempos:
+            h.registrar(t)
+        return h
+
+    def percentis(self, ps=PERCENTIS_PADRAO):
+        """Percentis de latência; ``None`` onde ainda não há amostras suficientes."""
+        return self.histograma.percentis_confiaveis(ps)
+
+
+def formatar_fases(fases):
+    return (f"conexão {fases['conexao']:.3f}s | TTFB {fases['ttfb']:.3f}s | "
+            f"transferência {fases['transferencia']:.3f}s | decodificação {fases['decodificacao']:.3f}s | "
+            f"{fases['bytes'] / 1024:.1f} KiB")
+
+
+def formatar_aquecimento(resultado, maximo=10):
+    curva = resultado.curva_aquecimento()
+    pontos = " → ".join(f"{x:.2f}×" for x in curva[:maximo]) + (" → …" if len(curva) > maximo else "")
+    return (f"frio {resultado.frio:.3f}s | regime {resultado.regime:.3f}s "
+            f"({resultado.frio / resultado.regime - 1:+.0%}) | aquecido após {resultado.aquecimento} tentativa(s) | "
+            f"curva {pontos}")
+
+
+def descrever_repeticoes(repeticoes=None):
+    """Como ``executar_cenario`` vai repetir: número fixo ou critério adaptativo."""
+    if repeticoes is None and CONFIG.precisao > 0:
+        return (f"adaptativo (IC {CONFIANCA:.0%} da p{CONFIG.percentil_alvo:g} em ±{CONFIG.precisao:.0%}, "
+                f"até {CONFIG.orcamento:g}s por cenário)")
+    return f"{repeticoes or CONFIG.repeticoes} repetição(ões)"
+
+
+def formatar_percentis(percentis):
+    return " | ".join(
+        f"p{p:g}: {v:.3f}s" if v is not None else f"p{p:g}: -" for p, v in percentis.items()
+    )
+
+
+# ===============================================================
+# QUEBRA DE CACHE
+# ===============================================================
+_PREFIXO_QUEBRA = uuid.uuid4().hex[:8]  # distinto por processo: execuções seguidas também não se repetem
+
+
+def perturbar_parametros(params, tentativa):
+    """Cópia de ``params`` que o servidor não pode ter em cache.
+
+    Todas as datas ISO em parâmetros ``data_*`` recuam ``tentativa`` dias juntas
+    (o tamanho da janela e a relação entre as datas, válida ou invertida, não
+    mudam) e ``PARAMETRO_QUEBRA_CACHE`` recebe um valor único, o que também
+    contorna caches HTTP chaveados pela URL. Caches de agregados por dia no
+    servidor ainda acertam os dias em comum entre janelas vizinhas.
+    """
+    perturbados = dict(params)
+    for nome, valor in params.items():
+        if nome.startswith("data_") and isinstance(valor, str):
+            try:
+                perturbados[nome] = (date.fromisoformat(valor) - timedelta(days=tentativa)).isoformat()
+            except ValueError:
+                pass
+    perturbados[PARAMETRO_QUEBRA_CACHE] = f"{_PREFIXO_QUEBRA}-{tentativa}"
+    return perturbados
+
+
+# ===============================================================
+# REQUISIÇÃO CRONOMETRADA
+# ===============================================================
+# Tempo gasto abrindo conexões (DNS + TCP + TLS) na thread atual. O urllib3 só
+# chama connect() quando não há conexão reaproveitável no pool, então com
+# keep-alive a fase de conexão é zero na maior parte das amostras.
+_tempo_conexao = threading.local()
+
+
+class _CronometrarConexao:
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _tempo_conexao.valor = getattr(_tempo_conexao, "valor", 0.0) + time.perf_counter() - inicio
+
+
+class _ConexaoHTTP(_CronometrarConexao, HTTPConnection):
+    pass
+
+
+class _ConexaoHTTPS(_CronometrarConexao, HTTPSConnection):
+    pass
+
+
+class _PoolHTTP(HTTPConnectionPool):
+    ConnectionCls = _ConexaoHTTP
+
+
+class _PoolHTTPS(HTTPSConnectionPool):
+    ConnectionCls = _ConexaoHTTPS
+
+
+class AdaptadorCronometrado(HTTPAdapter):
+    """``HTTPAdapter`` cujas conexões registram o tempo de ``connect()``."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _PoolHTTP, "https": _PoolHTTPS}
+
+
+def nova_sessao():
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adaptador = AdaptadorCronometrado()
+    s.mount("http://", adaptador)
+    s.mount("https://", adaptador)
+    return s
+
+
+def medir_requisicao(session, url, params, timeout=TIMEOUT_PADRAO, tolerar_falhas=False):
+    """Executa um GET e devolve ``(resp, duracao)``.
+
+    Com ``tolerar_falhas`` os erros de conexão/timeout não propagam: a resposta
+    volta como ``None`` e a duração é o tempo até a falha.
+    """
+    inicio = time.perf_counter()
+    try:
+        resp = session.get(url, params=params, timeout=timeout)
+    except requests.RequestException:
+        if not tolerar_falhas:
+            raise
+        resp = None
+    return resp, time.perf_counter() - inicio
+
+
+def aceitar_item(item):
+    """``validar_item`` que aceita tudo: lê a lista em fluxo (conta itens, memória constante) sem validar."""
+
+
+def _consumir_lista(resp, validar_item):
+    """Lê o corpo em blocos validando item a item; devolve ``(tempo fora da rede, bytes, itens)``."""
+    leitor = LeitorListaJSON()
+    blocos = resp.iter_content(TAMANHO_BLOCO)
+    gasto = 0.0
+    while True:
+        bloco = next(blocos, None)
+        inicio = time.perf_counter()
+        for item in leitor.alimentar(bloco) if bloco is not None else leitor.finalizar():
+            validar_item(item)
+        gasto += time.perf_counter() - inicio
+        if bloco is None:
+            return gasto, leitor.bytes, leitor.itens
+
+
+def medir_fases(session, url, params, timeout=TIMEOUT_PADRAO, validar=None, validar_item=None):
+    """Executa um GET e devolve ``(resp, fases)`` com o tempo de cada etapa.
+
+    ``fases`` traz ``conexao`` (DNS + TCP + TLS, só com ``AdaptadorCronometrado``,
+    montado por ``nova_sessao``), ``ttfb`` (envio da requisição até o fim dos
+    cabeçalhos, ou seja, o processamento no servidor), ``transferencia`` (download
+    do corpo), ``decodificacao`` (``validar(resp)`` ou, com ``validar_item``, a
+    leitura em fluxo da lista JSON item a item) e ``bytes`` do corpo; na leitura
+    em fluxo vem também ``itens``, o tamanho da lista. A validação
+    só roda para status 200. Na leitura em fluxo a memória não cresce com o
+    tamanho da resposta e ``resp.content`` não fica disponível.
+    """
+    _tempo_conexao.valor = 0.0
+    inicio = time.perf_counter()
+    resp = session.get(url, params=params, timeout=timeout, stream=True)
+    cabecalhos = time.perf_counter()
+    conexao = _tempo_conexao.valor
+    decodificacao = 0.0
+    extras = {}
+    try:
+        if validar_item is not None and resp.status_code == 200:
+            decodificacao, tamanho, extras["itens"] = _consumir_lista(resp, validar_item)
+            fim = time.perf_counter() - decodificacao
+        else:
+            tamanho = len(resp.content)
+            fim = time.perf_counter()
+            if validar is not None and resp.status_code == 200:
+                validar(resp)
+                decodificacao = time.perf_counter() - fim
+    finally:
+        resp.close()
+
+    return resp, {
+        "conexao": conexao,
+        "ttfb": cabecalhos - inicio - conexao,
+        "transferencia": fim - cabecalhos,
+        "decodificacao": decodificacao,
+        "bytes": tamanho,
+        **extras,
+    }
+
+
+# ===============================================================
+# EXECUÇÃO DE UM CENÁRIO
+# ===============================================================
+def executar_cenario(session, url, params, descricao, status_esperado, validar=None,
+                     repeticoes=None, timeout=TIMEOUT_PADRAO, validar_item=None, quebrar_cache=None):
+    """Repete a chamada ao endpoint e devolve as amostras de tempo coletadas.
+
+    Cada amostra é dividida em fases (ver ``medir_fases``); ``duracao`` é o
+    tempo de rede e a validação (``validar(resp)`` ou, para listas grandes lidas
+    em fluxo, ``validar_item(item)``) fica em ``decodificacao``, fora dele. A
+    validação só roda para respostas 200. A primeira resposta com status
+    inesperado encerra as repetições, como nos testes originais. Sem
+    ``repeticoes`` explícito vale ``CONFIG.repeticoes`` (opção ``--repeticoes``
+    do pytest), a não ser que ``CONFIG.precisao`` esteja ligada: aí o cenário é
+    amostrado até o IC 95% de ``CONFIG.percentil_alvo`` ficar dentro de
+    ±``precisao`` (com ao menos ``REPETICOES_MINIMAS`` amostras) ou até
+    ``CONFIG.orcamento`` segundos, no máximo ``REPETICOES_MAXIMAS``. Com
+    ``CONFIG.metricas_servidor`` o /metricas é lido antes e depois das
+    repetições e ``resultado.servidor`` recebe a variação dos contadores do
+    endpoint (tempo do lado do servidor). Com ``quebrar_cache`` (padrão:
+    ``CONFIG.quebrar_cache``) cada tentativa usa ``perturbar_parametros`` e a
+    descrição ganha ``SUFIXO_SEM_CACHE``. A primeira tentativa (frio), o
+    regime e a curva de aquecimento vão para o resumo.
+    """
+    adaptativo = repeticoes is None and CONFIG.precisao > 0
+    repeticoes = repeticoes or (REPETICOES_MAXIMAS if adaptativo else CONFIG.repeticoes)
+    quebrar_cache = CONFIG.quebrar_cache if quebrar_cache is None else quebrar_cache
+    if quebrar_cache:
+        descricao = f"{descricao} {SUFIXO_SEM_CACHE}"
+    resultado = ResultadoCenario(descricao, params, status_esperado, url=url)
+
+    print(f"\n=== Cenário: {descricao} ===")
+    print(f"Parâmetros: {params}" + (" (perturbados a cada tentativa)" if quebrar_cache else ""))
+    url_base, endpoint = localizar(url)
+    antes = coletar(session, url_base) if CONFIG.metricas_servidor else None
+    fim_orcamento = time.perf_counter() + CONFIG.orcamento if adaptativo else math.inf
+    parada = None
+
+    for i in range(repeticoes):
+        enviados = perturbar_parametros(params, i + 1) if quebrar_cache else params
+        # Validação só quando 200 é o esperado; senão a quebra abaixo vem antes.
+        if status_esperado == 200:
+            resp, fases = medir_fases(session, url, enviados, timeout, validar, validar_item)
+        else:
+            resp, fases = medir_fases(session, url, enviados, timeout)
+        duracao = fases["conexao"] + fases["ttfb"] + fases["transferencia"]
+
+        resultado.amostras.append(Amostra(i + 1, resp.status_code, duracao, **fases))
+        print(f"➡️ Tentativa {i+1}: {resp.status_code} em {duracao:.3f}s"
+              + (f" (+{fases['decodificacao']:.3f}s decodificação)" if fases["decodificacao"] else ""))
+
+        if resp.status_code != status_esperado:
+            print(f"❌ Status inesperado: {resp.status_code}, esperado: {status_esperado}")
+            break
+        if adaptativo and i + 1 >= REPETICOES_MINIMAS:
+            if resultado.precisao(CONFIG.percentil_alvo) <= CONFIG.precisao:
+                parada = "precisão atingida"
+                break
+            if time.perf_counter() >= fim_orcamento:
+                parada = "orçamento esgotado"
+                break
+    else:
+        if adaptativo:
+            parada = "máximo de repetições"
+
+    print(f"\n📈 Resultados — {descricao}")
+    print(f"  Status Esperado: {status_esperado}")
+    print(f"  Status Real: {resultado.status_real}")
+    print(f"  Média: {resultado.media:.3f}s | Mínimo: {resultado.minimo:.3f}s | Máximo: {resultado.maximo:.3f}s")
+    print(f"  Percentis: {formatar_percentis(resultado.percentis())}")
+    if parada:
+        p = CONFIG.percentil_alvo
+        precisao = resultado.precisao(p)
+        print(f"  Amostragem adaptativa: {parada} com {len(resultado.amostras)} amostra(s), IC {CONFIANCA:.0%} "
+              f"da p{p:g} " + (f"±{precisao:.1%}" if precisao != math.inf else "indefinido"))
+    print(f"  Fases (média): {formatar_fases(resultado.fases_medias())}")
+    if resultado.regime:
+        print(f"  Aquecimento: {formatar_aquecimento(resultado)}")
+    if CONFIG.metricas_servidor:
+        resultado.servidor = diferenca(antes, coletar(session, url_base), endpoint)
+        print(f"  Servidor (/metricas): {formatar_metricas_servidor(resultado.servidor)}")
+        if resultado.servidor is not None and resultado.servidor.media is not None:
+            print(f"  Rede + cliente (média): {resultado.media - resultado.servidor.media:.3f}s")
+
+    return resultado
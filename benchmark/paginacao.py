@@ -0,0 +1,191 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+
+from .configuracao import url_endpoint
+from .historico import registrar_resultado
+from .motor import (
+    TIMEOUT_PADRAO, Amostra, ResultadoCenario, aceitar_item, formatar_percentis, medir_fases, nova_sessao,
+)
+from .varredura import ajustar
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+ENDPOINT_PAGINADO = "/analise_medidores_temp_hum/medicoes-enriquecidas"
+TAMANHO_PAGINA_PADRAO = 1000  # maior limit aceito pelo endpoint
+FAIXAS_OFFSET = 10  # grupos de páginas no relatório de latência × offset
+
+
+# ===============================================================
+# RESULTADO DE UMA VARREDURA PAGINADA
+# ===============================================================
+@dataclass
+class Pagina:
+    offset: int
+    inicio: float  # segundos desde o começo da varredura
+    amostra: Amostra
+
+    @property
+    def itens(self):
+        return self.amostra.itens or 0
+
+
+@dataclass
+class ResultadoPaginacao:
+    endpoint: str
+    params: dict
+    limit: int
+    paralelismo: int
+    duracao: float = 0.0
+    paginas: list = field(default_factory=list)  # em ordem de offset
+    completa: bool = False  # chegou a uma página curta (fim do conjunto)
+
+    @property
+    def total_linhas(self):
+        return sum(p.itens for p in self.paginas)
+
+    @property
+    def total_bytes(self):
+        return sum(p.amostra.bytes for p in self.paginas)
+
+    @property
+    def erros(self):
+        return [p for p in self.paginas if p.amostra.status != 200]
+
+    @property
+    def linhas_por_segundo(self):
+        return self.total_linhas / self.duracao if self.duracao > 0 else 0.0
+
+    def faixas(self, quantidade=FAIXAS_OFFSET):
+        """``[(offset inicial, offset final, mediana da latência)]`` em grupos de páginas consecutivas."""
+        validas = [p for p in self.paginas if p.amostra.status == 200 and p.itens]
+        if not validas:
+            return []
+        tamanho = max(1, -(-len(validas) // quantidade))
+        return [
+            (grupo[0].offset, grupo[-1].offset, statistics.median(p.amostra.duracao for p in grupo))
+            for grupo in (validas[i:i + tamanho] for i in range(0, len(validas), tamanho))
+        ]
+
+    def degradacao(self):
+        """Mediana da última faixa de offset sobre a da primeira (1.0 = sem piora)."""
+        faixas = self.faixas()
+        if len(faixas) < 2 or faixas[0][2] <= 0:
+            return None
+        return faixas[-1][2] / faixas[0][2]
+
+    def ajuste(self):
+        """Latência por página × offset (``varredura.Ajuste``)."""
+        validas = [p for p in self.paginas if p.amostra.status == 200 and p.itens]
+        return ajustar([p.offset for p in validas], [p.amostra.duracao for p in validas])
+
+    def como_cenario(self):
+        """As páginas como amostras de um ``ResultadoCenario``, para o histórico."""
+        descricao = f"Paginação completa (limit {self.limit}, {self.paralelismo} em paralelo)"
+        resultado = ResultadoCenario(descricao, {**self.params, "limit": self.limit}, 200,
+                                     url=url_endpoint(self.endpoint))
+        resultado.amostras = [p.amostra for p in self.paginas]
+        return resultado
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def paginar(endpoint=ENDPOINT_PAGINADO, params=None, limit=TAMANHO_PAGINA_PADRAO, paralelismo=1,
+            max_paginas=None, timeout=TIMEOUT_PADRAO):
+    """Percorre o conjunto inteiro por ``offset``/``limit`` e mede cada página.
+
+    Com ``paralelismo`` > 1, tantos trabalhadores buscam páginas consecutivas
+    ao mesmo tempo; como o total não é conhecido de antemão, páginas já em voo
+    quando a página curta (a última) chega voltam vazias e também são medidas.
+    Para no fim do conjunto, na primeira resposta com erro ou em ``max_paginas``;
+    uma falha de conexão ou timeout entra como página de status ``None`` e
+    também encerra a varredura, preservando as páginas já medidas.
+    """
+    if paralelismo < 1:
+        raise ValueError("paralelismo deve ser ao menos 1")
+    params = dict(params or {})
+    url = url_endpoint(endpoint)
+    resultado = ResultadoPaginacao(endpoint, params, limit, paralelismo)
+    trava = threading.Lock()
+    estado = {"proximo": 0, "emitidas": 0, "fim": None, "parar": False}
+
+    def trabalhador():
+        sessao = nova_sessao()
+        try:
+            while True:
+                with trava:
+                    if estado["parar"] or (max_paginas and estado["emitidas"] >= max_paginas):
+                        return
+                    offset = estado["proximo"]
+                    if estado["fim"] is not None and offset >= estado["fim"]:
+                        return
+                    estado["proximo"] += limit
+                    estado["emitidas"] += 1
+                instante = time.perf_counter() - inicio
+                try:
+                    resp, fases = medir_fases(sessao, url, {**params, "limit": limit, "offset": offset}, timeout,
+                                              validar_item=aceitar_item)
+                except requests.RequestException:
+                    # como medir_requisicao(..., tolerar_falhas=True): status None e o tempo até a falha
+                    duracao = time.perf_counter() - inicio - instante
+                    pagina = Pagina(offset, instante, Amostra(offset // limit + 1, None, duracao, ttfb=duracao))
+                else:
+                    duracao = fases["conexao"] + fases["ttfb"] + fases["transferencia"]
+                    pagina = Pagina(offset, instante,
+                                    Amostra(offset // limit + 1, resp.status_code, duracao, **fases))
+                with trava:
+                    resultado.paginas.append(pagina)
+                    if pagina.amostra.status != 200:
+                        estado["parar"] = True
+                    elif pagina.itens < limit:
+                        fim = offset + pagina.itens
+                        estado["fim"] = fim if estado["fim"] is None else min(estado["fim"], fim)
+                if len(resultado.paginas) % 50 == 0:
+                    print(f"   … {len(resultado.paginas)} página(s), offset {offset}")
+        finally:
+            sessao.close()
+
+    print(f"\n=== Paginação: {endpoint} | limit {limit} | {paralelismo} em paralelo | parâmetros {params} ===")
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=paralelismo) as executor:
+        for futuro in [executor.submit(trabalhador) for _ in range(paralelismo)]:
+            futuro.result()
+    resultado.duracao = time.perf_counter() - inicio
+    resultado.paginas.sort(key=lambda p: p.offset)
+    resultado.completa = estado["fim"] is not None and not estado["parar"]
+
+    _imprimir(resultado)
+    registrar_resultado(resultado.como_cenario(), "paginacao")
+    return resultado
+
+
+def _imprimir(resultado):
+    cenario = resultado.como_cenario()
+    print(f"\n📈 {len(resultado.paginas)} página(s), {resultado.total_linhas} linha(s), "
+          f"{resultado.total_bytes / 1e6:.1f} MB em {resultado.duracao:.2f}s "
+          f"({resultado.linhas_por_segundo:,.0f} linhas/s, "
+          f"{resultado.total_bytes / 1e6 / resultado.duracao if resultado.duracao > 0 else 0:.1f} MB/s)")
+    if resultado.paginas:
+        print(f"  Latência por página: {formatar_percentis(cenario.percentis())}")
+    print("  Latência × offset (mediana por faixa):")
+    for primeiro, ultimo, mediana in resultado.faixas():
+        print(f"    offset {primeiro:>9} – {ultimo:>9}: {mediana:.3f}s")
+    ajuste = resultado.ajuste()
+    if ajuste is not None:
+        print(f"  Ajuste: {ajuste.intercepto:.3f}s + {ajuste.inclinacao * 100000 * 1000:.1f}ms "
+              f"a cada 100 mil de offset (R² {ajuste.r2:.2f})")
+    degradacao = resultado.degradacao()
+    if degradacao is not None:
+        print(f"  Última faixa / primeira: ×{degradacao:.2f}")
+    if resultado.erros:
+        primeira = resultado.erros[0]
+        motivo = "falha de conexão" if primeira.amostra.status is None else f"status {primeira.amostra.status}"
+        print(f"❌ Interrompida no offset {primeira.offset}: {motivo}")
+    elif not resultado.completa:
+        print("⚠️ Interrompida antes do fim do conjunto (max_paginas)")
@@ -0,0 +1,138 @@
+import contextlib
+import io
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+
+from .catalogo import carregar_cenarios
+from .configuracao import CONFIG
+from .motor import TIMEOUT_PADRAO, descrever_repeticoes, executar_cenario, nova_sessao
+from .registro import RegistroCSV
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+TRABALHADORES_PADRAO = min(8, os.cpu_count() or 1)
+
+
+# ===============================================================
+# RESULTADO DE UMA EXECUÇÃO PARALELA
+# ===============================================================
+@dataclass
+class ResultadoParalelo:
+    trabalhadores: int
+    duracao: float
+    resultados: list = field(default_factory=list)  # (cenario, ResultadoCenario | None, erro | None), em ordem
+
+    @property
+    def falhas(self):
+        return [(c, r, e) for c, r, e in self.resultados if not _aprovado(c, r, e)]
+
+
+def _aprovado(cenario, resultado, erro):
+    """Mesmo critério dos testes: status esperado em todas as amostras e média abaixo do limite."""
+    if erro is not None or resultado is None or not resultado.sucesso:
+        return False
+    if cenario.status_esperado == 200 and cenario.limite_tempo_medio is not None:
+        return resultado.media < cenario.limite_tempo_medio
+    return True
+
+
+# ===============================================================
+# PROCESSO TRABALHADOR
+# ===============================================================
+# Cada trabalhador importa os módulos de teste por conta própria (as funções de
+# validação não atravessam processos) e mantém uma sessão HTTP. Nada é gravado
+# nos trabalhadores: CSVs e histórico ficam com o coordenador.
+_sessao = None
+_cenarios = {}
+
+
+def _iniciar_trabalhador(configuracao):
+    global _sessao
+    for nome, valor in configuracao.items():
+        setattr(CONFIG, nome, valor)
+    CONFIG.historico = ""
+    _sessao = nova_sessao()
+
+
+def _executar_tarefa(modulo, indice, repeticoes, timeout):
+    if modulo not in _cenarios:
+        _cenarios[modulo] = carregar_cenarios(modulo)
+    c = _cenarios[modulo][indice]
+    saida = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(saida):
+            resultado = executar_cenario(
+                _sessao, c.url, c.params, c.descricao, c.status_esperado, validar=c.validar,
+                repeticoes=repeticoes, timeout=timeout, validar_item=c.validar_item,
+            )
+    except Exception:  # noqa: BLE001 - o coordenador registra a falha e segue com os demais
+        return None, traceback.format_exc(limit=3)
+    return resultado, None
+
+
+def _intercalar(cenarios):
+    """Alterna os módulos na fila para que os trabalhadores não martelem o mesmo endpoint."""
+    por_modulo = {}
+    for i, c in enumerate(cenarios):
+        por_modulo.setdefault(c.modulo, []).append(i)
+    filas = list(por_modulo.values())
+    ordem = []
+    while filas:
+        ordem.extend(fila.pop(0) for fila in filas)
+        filas = [fila for fila in filas if fila]
+    return ordem
+
+
+# ===============================================================
+# COORDENADOR
+# ===============================================================
+def executar_paralelo(cenarios, trabalhadores=TRABALHADORES_PADRAO, repeticoes=None, timeout=TIMEOUT_PADRAO):
+    """Distribui os cenários entre processos trabalhadores e reúne os resultados.
+
+    Cada cenário roda inteiro (todas as repetições, em sequência) num único
+    trabalhador, como no pytest. O coordenador recebe os ``ResultadoCenario`` e,
+    ao final, grava os CSVs de cada módulo na ordem do catálogo e as amostras
+    numa única execução do histórico. Com vários trabalhadores a API atende
+    cenários simultâneos, então as latências incluem essa concorrência.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado")
+
+    print(f"\n=== Execução paralela: {len(cenarios)} cenário(s), {trabalhadores} trabalhador(es), "
+          f"{descrever_repeticoes(repeticoes)} ===")
+    coletado = [None] * len(cenarios)
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=trabalhadores, initializer=_iniciar_trabalhador,
+                             initargs=(asdict(CONFIG),)) as executor:
+        futuros = {
+            executor.submit(_executar_tarefa, cenarios[i].modulo, cenarios[i].indice, repeticoes, timeout): i
+            for i in _intercalar(cenarios)
+        }
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            resultado, erro = futuro.result()
+            coletado[i] = (cenarios[i], resultado, erro)
+            if resultado is not None:
+                icone = "✅" if _aprovado(cenarios[i], resultado, erro) else "❌"
+                print(f"{icone} {cenarios[i].chave}: {resultado.status_real} | Média: {resultado.media:.3f}s")
+            else:
+                print(f"❌ {cenarios[i].chave}: {erro.strip().splitlines()[-1]}")
+
+    resultado = ResultadoParalelo(trabalhadores, time.perf_counter() - inicio, coletado)
+    _gravar(resultado)
+    print(f"\n📈 {len(cenarios)} cenário(s) em {resultado.duracao:.2f}s, {len(resultado.falhas)} falha(s)")
+    return resultado
+
+
+def _gravar(resultado):
+    registros = {}
+    for cenario, r, _ in resultado.resultados:
+        if r is None or not cenario.arquivo_csv:
+            continue
+        if cenario.arquivo_csv not in registros:
+            registros[cenario.arquivo_csv] = RegistroCSV(cenario.arquivo_csv, modo="paralelo")
+        registros[cenario.arquivo_csv].gravar(r)
@@ -0,0 +1,173 @@
+import json
+import re
+from typing import NamedTuple
+
+# ===============================================================
+# FORMATO DE EXPOSIÇÃO DO PROMETHEUS
+# ===============================================================
+# Leitura em uma passada do texto de /metricas (formato de exposição 0.0.4).
+# Cada linha de amostra vira uma ``AmostraMetrica`` já tipada pela família
+# declarada em "# TYPE": o tipo de cada nome é resolvido uma vez e guardado, e
+# só rótulos com escapes passam por expressão regular (o resto sai com
+# str.split/partition, em C). Assim a coleta a cada segundo durante a carga
+# não disputa CPU com os usuários virtuais.
+TIPOS = ("counter", "gauge", "histogram", "summary", "untyped")
+
+# Sufixos das séries derivadas de uma família (ex.: <nome>_bucket de um histogram)
+_SUFIXOS = {
+    "histogram": ("_bucket", "_sum", "_count", "_created"),
+    "summary": ("_sum", "_count", "_created"),
+    "counter": ("_total", "_created"),
+}
+
+_ROTULO = re.compile(r'[ \t]*([a-zA-Z_][a-zA-Z0-9_]*)[ \t]*=[ \t]*"((?:[^"\\]|\\.)*)"[ \t]*(,?)[ \t]*')
+_ESCAPES = re.compile(r"\\(.)")
+_TROCAS = {"n": "\n", "\\": "\\", '"': '"'}
+
+
+class AmostraMetrica(NamedTuple):
+    familia: str  # nome declarado em "# TYPE" (ex.: api_request_duration_seconds)
+    nome: str  # nome da série (ex.: api_request_duration_seconds_bucket)
+    rotulos: dict
+    valor: float
+    tipo: str  # counter | gauge | histogram | summary | untyped
+
+    @property
+    def balde(self):
+        """Limite superior (``le``) de um balde de histograma, ou ``None``."""
+        le = self.rotulos.get("le") if self.nome.endswith("_bucket") else None
+        return None if le is None else float(le)
+
+
+def _desescapar(valor):
+    return _ESCAPES.sub(lambda m: _TROCAS.get(m.group(1), "\\" + m.group(1)), valor)
+
+
+def _rotulos_sem_escape(linha, inicio):
+    """Caminho rápido para o caso comum: sem escapes, nenhum valor contém aspas.
+
+    Devolve ``None`` quando a linha foge do formato estrito; o leitor então
+    recorre à expressão regular, que também produz a mensagem de erro.
+    """
+    fim = linha.rfind("}")
+    if fim < inicio:
+        return None
+    rotulos = {}
+    bloco = linha[inicio:fim]
+    if bloco:
+        pares = bloco[:-1].split('",') if bloco.endswith(",") else bloco.split('",')
+        if not pares[-1].endswith('"'):
+            return None
+        pares[-1] = pares[-1][:-1]
+        for par in pares:
+            nome, sep, valor = par.partition('="')
+            if not sep or '"' in valor or not (nome.isidentifier() and nome.isascii()):
+                return None
+            rotulos[nome] = valor
+    return rotulos, fim + 1
+
+
+class LeitorExposicao:
+    """Converte linhas do formato de exposição em ``AmostraMetrica``.
+
+    Uso::
+
+        leitor = LeitorExposicao()
+        for amostra in leitor.amostras(resp.iter_lines(decode_unicode=True)):
+            ...
+        leitor.tipos  # {familia: tipo}, lido das linhas "# TYPE"
+        leitor.ajudas  # {familia: texto}, lido das linhas "# HELP"
+
+    Linhas malformadas levantam ``ValueError`` com o número da linha.
+    """
+
+    def __init__(self):
+        self.tipos = {}
+        self.ajudas = {}
+        self._familias = {}  # nome da série -> (familia, tipo)
+
+    def _familia(self, nome):
+        encontrada = self._familias.get(nome)
+        if encontrada is None:
+            encontrada = (nome, self.tipos.get(nome, "untyped"))
+            if nome not in self.tipos:
+                for tipo_familia, sufixos in _SUFIXOS.items():
+                    for sufixo in sufixos:
+                        base = nome[:-len(sufixo)]
+                        if nome.endswith(sufixo) and self.tipos.get(base) == tipo_familia:
+                            encontrada = (base, tipo_familia)
+                            break
+            self._familias[nome] = encontrada
+        return encontrada
+
+    def _comentario(self, linha, numero):
+        partes = linha[1:].split(None, 3)
+        if len(partes) < 3 or partes[0] not in ("TYPE", "HELP"):
+            return  # comentário livre
+        if partes[0] == "TYPE":
+            if partes[2] not in TIPOS:
+                raise ValueError(f"Linha {numero}: tipo de métrica desconhecido {partes[2]!r}")
+            self.tipos[partes[1]] = partes[2]
+            self._familias.clear()
+        else:
+            self.ajudas[partes[1]] = _desescapar(" ".join(partes[2:]))
+
+    def _rotulos(self, linha, inicio, numero):
+        if "\\" not in linha:
+            rapido = _rotulos_sem_escape(linha, inicio)
+            if rapido is not None:
+                return rapido
+        rotulos = {}
+        pos = inicio
+        while linha[pos:pos + 1] != "}":
+            m = _ROTULO.match(linha, pos)
+            if m is None:
+                raise ValueError(f"Linha {numero}: rótulos malformados: {linha!r}")
+            valor = m.group(2)
+            rotulos[m.group(1)] = _desescapar(valor) if "\\" in valor else valor
+            pos = m.end()
+            if not m.group(3) and linha[pos:pos + 1] != "}":
+                raise ValueError(f"Linha {numero}: esperado ',' ou '}}': {linha!r}")
+        return rotulos, pos + 1
+
+    def amostras(self, linhas):
+        for numero, linha in enumerate(linhas, 1):
+            linha = linha.strip()
+            if not linha:
+                continue
+            if linha[0] == "#":
+                self._comentario(linha, numero)
+                continue
+
+            chave = linha.find("{")
+            espaco = linha.find(" ")
+            if chave == -1 or -1 < espaco < chave:
+                nome, rotulos, resto = linha[:espaco], {}, linha[espaco:]
+                if espaco == -1:
+                    raise ValueError(f"Linha {numero}: amostra sem valor: {linha!r}")
+            else:
+                nome = linha[:chave].rstrip()
+                rotulos, fim = self._rotulos(linha, chave + 1, numero)
+                resto = linha[fim:]
+            campos = resto.split()
+            if not nome or not 1 <= len(campos) <= 2:
+                raise ValueError(f"Linha {numero}: amostra malformada: {linha!r}")
+            try:
+                valor = float(campos[0])
+            except ValueError:
+                raise ValueError(f"Linha {numero}: valor inválido {campos[0]!r}") from None
+            familia, tipo = self._familia(nome)
+            yield AmostraMetrica(familia, nome, rotulos, valor, tipo)
+
+
+def texto_exposicao(resp):
+    """A API real devolve a exposição serializada como string JSON; o texto puro também é aceito."""
+    texto = resp.text
+    if texto.lstrip().startswith('"'):
+        texto = json.loads(texto)
+    return texto
+
+
+def analisar(texto, leitor=None):
+    """Lista de ``AmostraMetrica`` de um texto completo de exposição."""
+    return list((leitor or LeitorExposicao()).amostras(texto.splitlines()))
@@ -0,0 +1,508 @@
+import csv
+import math
+import os
+import statistics
+
+from .configuracao import CONFIG
+from .histograma import PERCENTIS_PADRAO, Histograma
+from .historico import registrar_resultado
+from .metricas import localizar
+
+# ===============================================================
+# CABEÇALHO PADRÃO DOS CSVs DE RESULTADO
+# ===============================================================
+CABECALHO = [
+    "Cenário",
+    "Parâmetros",
+    "Status Esperado",
+    "Status Real",
+    "Tempo Médio (s)",
+    "Tempo Mínimo (s)",
+    "Tempo Máximo (s)",
+    "Sucesso",
+    "Amostras",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO] + [
+    "Primeira Requisição (s)",
+    "Regime (s)",
+    "Tentativas até Aquecer",
+    "Precisão da Mediana IC 95% (±%)",
+    "Conexão Média (s)",
+    "TTFB Médio (s)",
+    "Transferência Média (s)",
+    "Decodificação Média (s)",
+    "Tamanho Médio (bytes)",
+    "Requisições Servidor",
+    "Tempo Médio Servidor (s)",
+    "p50 Servidor (s)",
+    "p99 Servidor (s)",
+    "Ambiente",
+]
+
+COLUNAS_SERVIDOR_CARGA = ["Requisições Servidor (endpoint)", "p50 Servidor (s)", "p99 Servidor (s)"]
+
+CABECALHO_CARGA = [
+    "Cenário",
+    "Parâmetros",
+    "Usuários",
+    "Requisições",
+    "Erros",
+    "Vazão (req/s)",
+    "Tempo Médio (s)",
+    "Tempo Mínimo (s)",
+    "Tempo Máximo (s)",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO]
+
+
+CABECALHO_VARREDURA = [
+    "Endpoint",
+    "Variável",
+    "Valor",
+    "Parâmetros",
+    "Status Esperado",
+    "Status Real",
+    "Amostras",
+    "Mediana (s)",
+    "Tempo Médio (s)",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO] + [
+    "Tamanho Médio (bytes)",
+    "Tamanho da Query (caracteres)",
+    "Linhas (média)",
+    "Linhas/s",
+    "MB/s",
+    "Ajuste Linear (s)",
+]
+
+CABECALHO_AJUSTE = [
+    "Endpoint",
+    "Variável",
+    "Pontos",
+    "Intercepto (s)",
+    "Inclinação (s/unidade)",
+    "R² Linear",
+    "Coeficiente (s)",
+    "Expoente",
+    "R² Potência",
+]
+
+
+CABECALHO_PAGINACAO = [
+    "Página",
+    "Offset",
+    "Limit",
+    "Status",
+    "Linhas",
+    "Bytes",
+    "Tempo (s)",
+    "TTFB (s)",
+    "Transferência (s)",
+    "Início (s)",
+]
+
+CABECALHO_SATURACAO = [
+    "Usuários",
+    "Duração do Degrau (s)",
+    "Requisições",
+    "Erros",
+    "Taxa de Erros (%)",
+    "Vazão (req/s)",
+    "Ganho de Vazão (%)",
+    "Tempo Médio (s)",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO] + [
+    "p99 Servidor (s)",
+    "Joelho",
+]
+
+CABECALHO_RESISTENCIA = [
+    "Início do Balde (s)",
+    "Requisições",
+    "Erros",
+    "Vazão (req/s)",
+    "Tempo Médio (s)",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO]
+
+CABECALHO_DERIVA = [
+    "Série",
+    "Pontos",
+    "Inicial",
+    "Final",
+    "Variação sobre a Média (%)",
+    "R²",
+    "Deriva",
+]
+
+CABECALHO_CARREGAMENTO = [
+    "Chamada",
+    "Endpoint",
+    "Parâmetros",
+    "Status Esperado",
+    "Status Real",
+    "Amostras",
+    "Mediana (s)",
+    "Tempo Médio (s)",
+] + [f"p{p:g} (s)" for p in PERCENTIS_PADRAO] + [
+    "Caminho Crítico (%)",
+    "Folga Mediana (s)",
+    "Ganho se Instantânea (s)",
+]
+
+CABECALHO_AQUECIMENTO = [
+    "Cenário",
+    "Parâmetros",
+    "Quebra de Cache",
+    "Status Esperado",
+    "Status Real",
+    "Amostras",
+    "Primeira Requisição (s)",
+    "Regime (s)",
+    "Penalidade Fria (%)",
+    "Tentativas até Aquecer",
+    "Curva de Aquecimento (× regime)",
+    "Regime sem Cache / com Cache",
+]
+
+
+def _colunas_percentis(percentis):
+    return ["" if v is None else round(v, 3) for v in percentis.values()]
+
+
+def _colunas_servidor(m, media=True):
+    """Requisições, média (opcional), p50 e p99 medidos pelo servidor; vazio sem coleta."""
+    if m is None:
+        return [""] * (4 if media else 3)
+    quantis = _colunas_percentis(m.quantis([50.0, 99.0]))
+    media_servidor = ["" if m.media is None else round(m.media, 3)] if media else []
+    return [m.requisicoes] + media_servidor + quantis
+
+
+def _precisao_percentual(resultado):
+    precisao = resultado.precisao()
+    return "" if math.isinf(precisao) else round(precisao * 100, 1)
+
+
+def _abrir(caminho, modo):
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    return open(caminho, modo, newline="", encoding="utf-8")
+
+
+class RegistroCSV:
+    """Arquivo CSV de resultados de um módulo de teste.
+
+    O arquivo é recriado (com cabeçalho) na primeira gravação do processo e
+    recebe uma linha por cenário nas gravações seguintes; é só o retrato da
+    última execução. As amostras brutas vão também para o histórico
+    (``benchmark.historico``), que não é sobrescrito.
+    """
+
+    def __init__(self, caminho, modo="pytest"):
+        self.caminho = caminho
+        self.modo = modo
+        self._iniciado = False
+
+    def gravar(self, resultado):
+        modo = "a" if self._iniciado else "w"
+        with _abrir(self.caminho, modo) as csvfile:
+            writer = csv.writer(csvfile)
+            if not self._iniciado:
+                writer.writerow(CABECALHO)
+                self._iniciado = True
+            writer.writerow([
+                resultado.descricao,
+                str(resultado.params),
+                resultado.status_esperado,
+                resultado.status_real,
+                round(resultado.media, 3),
+                round(resultado.minimo, 3),
+                round(resultado.maximo, 3),
+                "OK" if resultado.sucesso else "FALHA",
+                len(resultado.amostras),
+            ] + _colunas_percentis(resultado.percentis()) + [
+                _arredondar(resultado.frio),
+                _arredondar(resultado.regime),
+                "" if resultado.aquecimento is None else resultado.aquecimento,
+                _precisao_percentual(resultado),
+            ] + [
+                round(v, 3) if fase != "bytes" else round(v) for fase, v in resultado.fases_medias().items()
+            ] + _colunas_servidor(resultado.servidor) + [CONFIG.ambiente])
+        registrar_resultado(resultado, self.modo)
+
+
+def _mesclar(resultados):
+    total = Histograma()
+    for r in resultados:
+        total.mesclar(r.histograma)
+    return total
+
+
+def _gravar_tabela_carga(caminho, cabecalho, resultado, extras, modo):
+    for r in resultado.cenarios.values():
+        registrar_resultado(r, modo)
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(cabecalho + COLUNAS_SERVIDOR_CARGA + ["Ambiente"])
+        for chave, r in resultado.cenarios.items():
+            erros = sum(1 for a in r.amostras if a.status != r.status_esperado)
+            writer.writerow([
+                r.descricao,
+                str(r.params),
+                resultado.usuarios,
+                len(r.amostras),
+                erros,
+                round(resultado.vazao_cenario(chave), 3),
+                round(r.media, 3),
+                round(r.minimo, 3),
+                round(r.maximo, 3),
+            ] + _colunas_percentis(r.percentis()) + extras(chave)
+                + _colunas_servidor(resultado.servidor.get(localizar(r.url)[1]), media=False) + [CONFIG.ambiente])
+
+        total = _mesclar(resultado.cenarios.values())
+        writer.writerow([
+            "Total",
+            "",
+            resultado.usuarios,
+            resultado.total_requisicoes,
+            resultado.total_erros,
+            round(resultado.vazao, 3),
+            _arredondar(total.media),
+            _arredondar(total.minimo),
+            _arredondar(total.maximo),
+        ] + _colunas_percentis(total.percentis_confiaveis()) + extras(None)
+            + _colunas_servidor(None, media=False) + [CONFIG.ambiente])
+
+
+def gravar_carga(caminho, resultado):
+    """Grava o resultado de uma execução de carga (uma linha por cenário e o total)."""
+    _gravar_tabela_carga(caminho, CABECALHO_CARGA, resultado, lambda chave: [], "carga")
+
+
+def gravar_taxa_constante(caminho, resultado):
+    """Grava uma execução em malha aberta: latência corrigida e, ao lado, o tempo de serviço."""
+    cabecalho = CABECALHO_CARGA + ["Taxa Alvo (req/s)", "p50 Serviço (s)", "p99 Serviço (s)"]
+
+    def extras(chave):
+        servico = _mesclar(resultado.servico.values()) if chave is None else resultado.servico[chave].histograma
+        percentis = servico.percentis_confiaveis([50.0, 99.0])
+        return [resultado.taxa_alvo] + _colunas_percentis(percentis)
+
+    _gravar_tabela_carga(caminho, cabecalho, resultado, extras, "taxa")
+
+
+def _arredondar(v, casas=3):
+    return "" if v is None else round(v, casas)
+
+
+def gravar_varredura(caminho, resultado):
+    """Grava os pontos de uma varredura e, em ``<caminho>_ajuste.csv``, a curva de cada endpoint."""
+    ajustes = resultado.ajustes()
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_VARREDURA + ["Ambiente"])
+        for p in resultado.pontos:
+            r = p.resultado
+            ajuste = ajustes.get(p.endpoint)
+            writer.writerow([
+                p.endpoint,
+                resultado.variavel,
+                f"{p.x:g}",
+                r.params,
+                r.status_esperado,
+                r.status_real,
+                len(r.amostras),
+                round(p.mediana, 3),
+                round(r.media, 3),
+            ] + _colunas_percentis(r.percentis()) + [
+                round(r.fases_medias()["bytes"]),
+                p.tamanho_query,
+                _arredondar(p.itens, 1),
+                _arredondar(p.linhas_por_segundo if p.itens is not None else None, 1),
+                _arredondar(p.mb_por_segundo),
+                "" if ajuste is None else round(ajuste.prever(p.x), 3),
+                CONFIG.ambiente,
+            ])
+
+    with _abrir(os.path.splitext(caminho)[0] + "_ajuste.csv", "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_AJUSTE + ["Ambiente"])
+        for endpoint, pontos in resultado.por_endpoint().items():
+            a = ajustes.get(endpoint)
+            if a is None:
+                writer.writerow([endpoint, resultado.variavel, len(pontos)] + [""] * 6 + [CONFIG.ambiente])
+                continue
+            writer.writerow([
+                endpoint,
+                resultado.variavel,
+                len(pontos),
+                round(a.intercepto, 4),
+                round(a.inclinacao, 6),
+                round(a.r2, 3),
+                _arredondar(a.coeficiente, 4),
+                _arredondar(a.expoente),
+                _arredondar(a.r2_potencia),
+                CONFIG.ambiente,
+            ])
+
+
+def gravar_paginacao(caminho, resultado):
+    """Grava uma linha por página de uma varredura paginada, em ordem de offset."""
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_PAGINACAO + ["Ambiente"])
+        for p in resultado.paginas:
+            a = p.amostra
+            writer.writerow([
+                a.tentativa,
+                p.offset,
+                resultado.limit,
+                a.status,
+                p.itens,
+                a.bytes,
+                round(a.duracao, 4),
+                round(a.ttfb, 4),
+                round(a.transferencia, 4),
+                round(p.inicio, 3),
+                CONFIG.ambiente,
+            ])
+
+
+def gravar_distribuido(caminho, resultado):
+    """Grava uma carga distribuída: os histogramas mesclados de cada cenário e o total de todos os geradores."""
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_CARGA + ["Geradores"] + COLUNAS_SERVIDOR_CARGA + ["Ambiente"])
+        linhas = [(r.descricao, str(r.params), r.requisicoes, r.erros, resultado.vazao_cenario(chave), r.histograma,
+                   resultado.servidor.get(localizar(r.url)[1])) for chave, r in resultado.cenarios.items()]
+        linhas.append(("Total", "", resultado.total_requisicoes, resultado.total_erros, resultado.vazao,
+                       resultado.total(), None))
+        for descricao, params, requisicoes, erros, vazao, h, servidor in linhas:
+            writer.writerow([
+                descricao,
+                params,
+                resultado.usuarios,
+                requisicoes,
+                erros,
+                round(vazao, 3),
+                _arredondar(h.media),
+                _arredondar(h.minimo),
+                _arredondar(h.maximo),
+            ] + _colunas_percentis(h.percentis_confiaveis()) + [len(resultado.parciais)]
+                + _colunas_servidor(servidor, media=False) + [CONFIG.ambiente])
+
+
+def gravar_saturacao(caminho, resultado):
+    """Grava uma linha por degrau de concorrência, marcando o joelho.
+
+    Vazão e latências são das respostas bem-sucedidas; os erros têm colunas próprias.
+    """
+    joelho, _ = resultado.joelho()
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_SATURACAO + ["Ambiente"])
+        for i, d in enumerate(resultado.degraus):
+            h = d.histograma
+            ganho = resultado.ganho(i)
+            p99_servidor = [m.quantil(99.0) for m in d.resultado.servidor.values() if m is not None]
+            writer.writerow([
+                d.usuarios,
+                resultado.duracao_degrau,
+                d.resultado.total_requisicoes,
+                d.erros,
+                round(d.taxa_erros * 100, 1),
+                round(d.vazao, 3),
+                "" if ganho is None else round(ganho * 100, 1),
+                _arredondar(h.media),
+            ] + _colunas_percentis(h.percentis_confiaveis()) + [
+                _arredondar(max(p99_servidor, default=None)),
+                "SIM" if i == joelho else "",
+                CONFIG.ambiente,
+            ])
+
+
+def gravar_resistencia(caminho, resultado):
+    """Grava a latência por balde de tempo de uma execução de resistência.
+
+    A tendência de cada série vai para ``<caminho>_deriva.csv`` e as leituras
+    do /health/detailed, para ``<caminho>_saude.csv``.
+    """
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_RESISTENCIA + ["Ambiente"])
+        for b in resultado.baldes:
+            h = b.histograma
+            writer.writerow([
+                round(b.inicio, 1),
+                h.total,
+                b.erros,
+                round(h.total / resultado.intervalo_balde, 3),
+                _arredondar(h.media),
+            ] + _colunas_percentis(h.percentis_confiaveis()) + [CONFIG.ambiente])
+
+    base = os.path.splitext(caminho)[0]
+    with _abrir(base + "_deriva.csv", "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_DERIVA + ["Ambiente"])
+        for d in resultado.derivas():
+            writer.writerow([
+                d.serie,
+                d.pontos,
+                round(d.inicial, 4),
+                round(d.final, 4),
+                round(d.variacao * 100, 1),
+                round(d.r2, 3),
+                "SIM" if d.sinalizada else "",
+                CONFIG.ambiente,
+            ])
+
+    with _abrir(base + "_saude.csv", "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Instante (s)", "Série", "Valor", "Ambiente"])
+        for instante, valores in resultado.saude:
+            for nome, valor in valores.items():
+                writer.writerow([round(instante, 1), nome, valor, CONFIG.ambiente])
+
+
+def gravar_carregamento(caminho, resultado):
+    """Grava o tempo composto da página e, por chamada, a participação no caminho crítico."""
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_CARREGAMENTO + ["Ambiente"])
+        linhas = [(resultado.cenario_composto(), "", ["", "", ""])]
+        for i, ch in enumerate(resultado.pagina.chamadas):
+            extras = [round(resultado.fracao_critica(i) * 100, 1), round(resultado.folga(i), 3),
+                      round(resultado.ganho_potencial(i), 3)]
+            linhas.append((resultado.cenario_chamada(i), ch.caminho, extras))
+        for r, endpoint, extras in linhas:
+            writer.writerow([
+                r.descricao,
+                endpoint,
+                r.params,
+                r.status_esperado,
+                r.status_real,
+                len(r.amostras),
+                round(statistics.median(r.tempos), 3),
+                round(r.media, 3),
+            ] + _colunas_percentis(r.percentis()) + extras + [CONFIG.ambiente])
+
+
+def gravar_aquecimento(caminho, resultado):
+    """Grava primeira requisição, regime e curva de cada cenário, com e sem quebra de cache."""
+    with _abrir(caminho, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CABECALHO_AQUECIMENTO + ["Ambiente"])
+        for comp in resultado.comparacoes:
+            for quebra, r in (("Não", comp.com_cache), ("Sim", comp.sem_cache)):
+                penalidade = round((r.frio / r.regime - 1) * 100, 1) if r.regime else ""
+                writer.writerow([
+                    comp.cenario.descricao,
+                    str(comp.cenario.params),
+                    quebra,
+                    r.status_esperado,
+                    r.status_real,
+                    len(r.amostras),
+                    _arredondar(r.frio),
+                    _arredondar(r.regime),
+                    penalidade,
+                    "" if r.aquecimento is None else r.aquecimento,
+                    ";".join(f"{x:.2f}" for x in r.curva_aquecimento()),
+                    _arredondar(comp.dependencia, 2),
+                ] + [CONFIG.ambiente])
@@ -0,0 +1,212 @@
+import math
+import random
+import statistics
+from dataclasses import dataclass
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+ALFA_PADRAO = 0.01  # significância do teste de Mann–Whitney (unilateral)
+LIMIAR_REGRESSAO_PADRAO = 1.20  # mediana atual / mediana da base a partir da qual é regressão
+LIMIAR_REGRESSAO_RAPIDO = 1.5  # endpoints de milissegundos: oscilam mais em termos relativos
+DIFERENCA_MINIMA = 0.005  # segundos: abaixo disso a diferença de medianas é ruído
+AMOSTRAS_MINIMAS = 5
+REAMOSTRAGENS = 1000
+MAX_AMOSTRAS_BOOTSTRAP = 2000
+
+
+# ===============================================================
+# ESTATÍSTICA
+# ===============================================================
+def mann_whitney(base, atual):
+    """Teste U de Mann–Whitney pela aproximação normal (com correção de empates).
+
+    Devolve ``(p_maior, p_menor)``: p-valores unilaterais para "``atual`` tende a
+    ser maior que ``base``" e para "tende a ser menor".
+    """
+    n1, n2 = len(base), len(atual)
+    combinados = sorted([(v, 0) for v in base] + [(v, 1) for v in atual])
+    n = n1 + n2
+    soma_postos_atual = 0.0
+    empates = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combinados[j + 1][0] == combinados[i][0]:
+            j += 1
+        posto = (i + j) / 2 + 1
+        t = j - i + 1
+        empates += t ** 3 - t
+        soma_postos_atual += posto * sum(1 for k in range(i, j + 1) if combinados[k][1])
+        i = j + 1
+
+    u = soma_postos_atual - n2 * (n2 + 1) / 2
+    media = n1 * n2 / 2
+    variancia = n1 * n2 / 12 * ((n + 1) - empates / (n * (n - 1)))
+    if variancia <= 0:
+        return 1.0, 1.0
+    desvio = math.sqrt(variancia)
+    z_maior = (u - media - 0.5) / desvio
+    z_menor = (media - u - 0.5) / desvio
+    return 0.5 * math.erfc(z_maior / math.sqrt(2)), 0.5 * math.erfc(z_menor / math.sqrt(2))
+
+
+def intervalo_quantil(valores, p, confianca=0.95):
+    """Intervalo de confiança do percentil ``p`` sem supor distribuição (estatísticas de ordem).
+
+    O número de amostras abaixo do percentil verdadeiro segue Binomial(n, p/100);
+    os limites são as estatísticas de ordem cujas caudas somam no máximo
+    ``1 - confianca``. Devolve ``None`` enquanto não há amostras suficientes
+    (para p95 com 95% de confiança, por exemplo, são necessárias 72).
+    """
+    n = len(valores)
+    q = p / 100
+    if n == 0 or not 0 < q < 1:
+        return None
+    cauda = (1 - confianca) / 2
+    acumulada = []
+    total = 0.0
+    for k in range(n + 1):
+        total += math.exp(math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+                          + k * math.log(q) + (n - k) * math.log(1 - q))
+        acumulada.append(total)
+    # x_(l) <= percentil com probabilidade P(B >= l); x_(u) >= percentil com P(B <= u - 1)
+    inferior = max((l for l in range(1, n + 1) if acumulada[l - 1] <= cauda), default=None)
+    superior = min((u for u in range(1, n + 1) if 1 - acumulada[u - 1] <= cauda), default=None)
+    if inferior is None or superior is None:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[inferior - 1], ordenados[superior - 1]
+
+
+def bootstrap_razao_medianas(base, atual, confianca=0.95, reamostragens=REAMOSTRAGENS, semente=0):
+    """Intervalo de confiança (percentil) da razão mediana(atual) / mediana(base)."""
+    rng = random.Random(semente)
+    if len(base) > MAX_AMOSTRAS_BOOTSTRAP:
+        base = rng.sample(base, MAX_AMOSTRAS_BOOTSTRAP)
+    if len(atual) > MAX_AMOSTRAS_BOOTSTRAP:
+        atual = rng.sample(atual, MAX_AMOSTRAS_BOOTSTRAP)
+    razoes = []
+    for _ in range(reamostragens):
+        m_base = statistics.median(rng.choices(base, k=len(base)))
+        m_atual = statistics.median(rng.choices(atual, k=len(atual)))
+        razoes.append(m_atual / m_base if m_base > 0 else math.inf)
+    razoes.sort()
+    cauda = (1 - confianca) / 2
+    return razoes[int(cauda * (reamostragens - 1))], razoes[int((1 - cauda) * (reamostragens - 1))]
+
+
+# ===============================================================
+# COMPARAÇÃO DE EXECUÇÕES
+# ===============================================================
+@dataclass
+class Comparacao:
+    endpoint: str
+    cenario: str
+    n_base: int
+    n_atual: int
+    mediana_base: float = None
+    mediana_atual: float = None
+    intervalo: tuple = None  # IC 95% da razão de medianas
+    p_valor: float = None  # unilateral, na direção da variação observada
+    limiar: float = LIMIAR_REGRESSAO_PADRAO
+    veredito: str = "insuficiente"  # regressão | melhora | estável | insuficiente
+
+    @property
+    def razao(self):
+        if self.mediana_base is None or self.mediana_atual is None or self.mediana_base <= 0:
+            return None
+        return self.mediana_atual / self.mediana_base
+
+    @property
+    def regressao(self):
+        return self.veredito == "regressão"
+
+
+def comparar_amostras(endpoint, cenario, base, atual, limiar=LIMIAR_REGRESSAO_PADRAO, alfa=ALFA_PADRAO):
+    """Compara as distribuições de latência de um cenário em duas execuções.
+
+    É regressão quando o Mann–Whitney indica ``atual`` significativamente mais
+    lento (p < ``alfa``), a mediana cresceu pelo menos ``limiar`` vezes e a
+    diferença absoluta passa de ``DIFERENCA_MINIMA``; melhora é o simétrico.
+    """
+    comparacao = Comparacao(endpoint, cenario, len(base), len(atual), limiar=limiar)
+    if len(base) < AMOSTRAS_MINIMAS or len(atual) < AMOSTRAS_MINIMAS:
+        return comparacao
+
+    comparacao.mediana_base = statistics.median(base)
+    comparacao.mediana_atual = statistics.median(atual)
+    comparacao.intervalo = bootstrap_razao_medianas(base, atual)
+    p_maior, p_menor = mann_whitney(base, atual)
+    diferenca = comparacao.mediana_atual - comparacao.mediana_base
+    razao = comparacao.razao if comparacao.razao is not None else math.inf
+
+    if diferenca >= 0:
+        comparacao.p_valor = p_maior
+        significativa = p_maior < alfa and razao >= limiar and diferenca > DIFERENCA_MINIMA
+        comparacao.veredito = "regressão" if significativa else "estável"
+    else:
+        comparacao.p_valor = p_menor
+        significativa = p_menor < alfa and razao <= 1 / limiar and -diferenca > DIFERENCA_MINIMA
+        comparacao.veredito = "melhora" if significativa else "estável"
+    return comparacao
+
+
+def comparar_execucoes(historico, id_base, id_atual, limiares=None, alfa=ALFA_PADRAO):
+    """Compara todos os cenários presentes nas duas execuções do histórico.
+
+    ``limiares`` mapeia endpoint -> razão de medianas tolerada; os demais usam
+    ``LIMIAR_REGRESSAO_PADRAO``. Cenários que só existem numa das execuções
+    aparecem como "insuficiente".
+    """
+    limiares = limiares or {}
+    base = historico.duracoes(id_base)
+    atual = historico.duracoes(id_atual)
+    return [
+        comparar_amostras(
+            endpoint, cenario, base.get((endpoint, cenario), []), atual.get((endpoint, cenario), []),
+            limiares.get(endpoint, LIMIAR_REGRESSAO_PADRAO), alfa,
+        )
+        for endpoint, cenario in sorted(set(base) | set(atual))
+    ]
+
+
+def comparar_com_referencia(historico, id_atual, referencia="base", limiares=None, alfa=ALFA_PADRAO):
+    """Resolve a execução de referência (``"base"``, ``"anterior"`` ou um id) e compara.
+
+    Devolve ``(id_base, comparacoes)``; ``ValueError`` se a referência não
+    existe ou é de outro modo (uma carga não se compara com uma rodada do pytest).
+    """
+    atual = historico.execucao(id_atual)
+    if atual is None:
+        raise ValueError(f"Execução não encontrada: {id_atual}")
+    id_base = historico.resolver(referencia, atual.ambiente, id_atual)
+    if id_base is None:
+        raise ValueError(f"Sem execução de referência {referencia!r} no ambiente {atual.ambiente!r}")
+    base = historico.execucao(id_base)
+    if base.modo != atual.modo:
+        raise ValueError(f"A referência {id_base} é do modo {base.modo!r} e a execução {id_atual} do modo "
+                         f"{atual.modo!r}")
+    return id_base, comparar_execucoes(historico, id_base, id_atual, limiares, alfa)
+
+
+def relatorio(comparacoes, todos=False):
+    """Linhas do relatório: regressões e melhoras sempre; estáveis só com ``todos``."""
+    contagem = {}
+    linhas = []
+    for c in comparacoes:
+        contagem[c.veredito] = contagem.get(c.veredito, 0) + 1
+        if todos or c.veredito in ("regressão", "melhora"):
+            linhas.append(formatar_comparacao(c))
+    resumo = ", ".join(f"{n} {v}" for v, n in sorted(contagem.items()))
+    return linhas + [f"📈 {len(comparacoes)} cenário(s): {resumo or 'nenhum'}"]
+
+
+def formatar_comparacao(c):
+    icone = {"regressão": "❌", "melhora": "🚀", "estável": "✅"}.get(c.veredito, "⚠️")
+    linha = f"{icone} {c.endpoint} :: {c.cenario} — {c.veredito}"
+    if c.razao is None:
+        return linha + f" (n base={c.n_base}, n atual={c.n_atual})"
+    return (linha + f" | mediana {c.mediana_base:.3f}s → {c.mediana_atual:.3f}s "
+            f"(×{c.razao:.2f}, IC95% {c.intervalo[0]:.2f}–{c.intervalo[1]:.2f}, "
+            f"p={c.p_valor:.2g}, limiar ×{c.limiar:.2f})")
@@ -0,0 +1,250 @@
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+
+from .carga import USUARIOS_PADRAO
+from .histograma import Histograma
+from .metricas import ColetorPeriodico, localizar
+from .motor import TIMEOUT_PADRAO, formatar_percentis, medir_requisicao, nova_sessao
+from .varredura import ajustar
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+INTERVALO_BALDE_PADRAO = 60.0  # segundos por balde de latência
+INTERVALO_AMOSTRAGEM_PADRAO = 30.0  # segundos entre leituras de /metricas e /health/detailed
+CAMINHO_SAUDE = "/health/detailed"
+# Deriva: a reta ajustada à série sobe, do começo ao fim, mais que LIMIAR_DERIVA
+# do nível médio e explica ao menos R2_MINIMO da variação (tendência, não ruído). A fração
+# AQUECIMENTO inicial fica de fora: caches enchendo no começo não são vazamento.
+LIMIAR_DERIVA = 0.20
+R2_MINIMO = 0.5
+AQUECIMENTO = 0.10
+
+
+# ===============================================================
+# ESTRUTURAS DE RESULTADO
+# ===============================================================
+@dataclass
+class BaldeTempo:
+    """Latências de todos os cenários num intervalo de ``INTERVALO_BALDE_PADRAO`` segundos."""
+    inicio: float  # segundos desde o começo da execução
+    histograma: Histograma = field(default_factory=Histograma)
+    erros: int = 0
+
+    def mesclar(self, outro):
+        self.histograma.mesclar(outro.histograma)
+        self.erros += outro.erros
+
+
+@dataclass
+class Deriva:
+    serie: str
+    inicial: float  # valor da reta ajustada no fim do aquecimento
+    final: float  # valor da reta ajustada no fim da execução
+    media: float  # média da série no mesmo trecho
+    r2: float
+    pontos: int
+
+    @property
+    def variacao(self):
+        """Subida da reta em relação ao nível médio da série (a reta pode começar perto de zero)."""
+        return (self.final - self.inicial) / self.media if self.media > 0 else 0.0
+
+    @property
+    def sinalizada(self):
+        return self.variacao > LIMIAR_DERIVA and self.r2 >= R2_MINIMO
+
+
+@dataclass
+class ResultadoResistencia:
+    usuarios: int
+    duracao: float = 0.0
+    intervalo_balde: float = INTERVALO_BALDE_PADRAO
+    baldes: list = field(default_factory=list)  # BaldeTempo em ordem de tempo
+    cenarios: dict = field(default_factory=dict)  # chave -> BaldeTempo da execução inteira
+    saude: list = field(default_factory=list)  # (instante, {série: valor}) de /health/detailed
+    serie_servidor: dict = field(default_factory=dict)  # endpoint -> [(instante, MetricasServidor)]
+
+    @property
+    def total_requisicoes(self):
+        return sum(b.histograma.total for b in self.baldes)
+
+    @property
+    def total_erros(self):
+        return sum(b.erros for b in self.baldes)
+
+    def series(self):
+        """``{nome: [(instante, valor)]}`` de tudo que é monitorado quanto à deriva."""
+        series = {"cliente.p99": [(b.inicio + self.intervalo_balde / 2, b.histograma.percentil(99.0))
+                                  for b in self.baldes if b.histograma.total]}
+        for endpoint, serie in self.serie_servidor.items():
+            series[f"servidor.p99 {endpoint}"] = [
+                (t, m.quantil(99.0)) for t, m in serie if m is not None and m.contagem
+            ]
+        for instante, valores in self.saude:
+            for nome, valor in valores.items():
+                series.setdefault(nome, []).append((instante, valor))
+        return {nome: [(t, v) for t, v in pontos if v is not None] for nome, pontos in series.items()}
+
+    def derivas(self, aquecimento=AQUECIMENTO):
+        derivas = []
+        corte = self.duracao * aquecimento
+        for nome, pontos in self.series().items():
+            pontos = [(t, v) for t, v in pontos if t >= corte]
+            ajuste = ajustar([t for t, _ in pontos], [v for _, v in pontos])
+            if ajuste is None:
+                continue
+            t0, t1 = pontos[0][0], pontos[-1][0]
+            media = statistics.fmean(v for _, v in pontos)
+            derivas.append(Deriva(nome, ajuste.prever(t0), ajuste.prever(t1), media, ajuste.r2, len(pontos)))
+        return derivas
+
+
+# ===============================================================
+# /health/detailed
+# ===============================================================
+def valores_saude(dados):
+    """``size_mb`` e estatísticas numéricas de cada banco DuckDB, como ``{"energia.size_mb": 12.3, ...}``."""
+    valores = {}
+    for banco, info in (dados.get("duckdb_databases") or {}).items():
+        if not isinstance(info, dict):
+            continue
+        numericos = {"size_mb": info.get("size_mb"), **{f"stats.{k}": v for k, v in (info.get("stats") or {}).items()}}
+        for nome, valor in numericos.items():
+            if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+                valores[f"{banco}.{nome}"] = float(valor)
+    return valores
+
+
+class _MonitorSaude:
+    """Lê /health/detailed a cada ``intervalo`` segundos numa thread própria (como ``ColetorPeriodico``)."""
+
+    def __init__(self, intervalo, url_base, timeout):
+        self.intervalo = intervalo
+        self.url = url_base + CAMINHO_SAUDE
+        self.timeout = timeout
+        self.amostras = []  # (instante relativo, {série: valor})
+        self._sessao = nova_sessao()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._laco, daemon=True)
+        self._inicio = None
+
+    def _amostrar(self):
+        try:
+            resp = self._sessao.get(self.url, timeout=self.timeout)
+            valores = valores_saude(resp.json()) if resp.status_code == 200 else None
+        except (requests.RequestException, ValueError):
+            valores = None
+        instante = time.perf_counter() - self._inicio
+        if valores:
+            self.amostras.append((instante, valores))
+        tamanhos = " | ".join(f"{k} {v:g}" for k, v in (valores or {}).items() if k.endswith("size_mb"))
+        print(f"⏱️ {time.strftime('%H:%M:%S', time.gmtime(instante))} | {tamanhos or 'sem /health/detailed'}")
+
+    def _laco(self):
+        while not self._parar.wait(self.intervalo):
+            self._amostrar()
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        self._amostrar()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._parar.set()
+        self._thread.join()
+        self._amostrar()
+        self._sessao.close()
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def _usuario_virtual(indice, cenarios, pesos, inicio, fim, intervalo_balde, timeout, semente):
+    """Sorteia cenários pelos pesos até ``fim``; guarda só histogramas, não amostras (a execução dura horas)."""
+    sorteio = random.Random(None if semente is None else semente + indice)
+    sessao = nova_sessao()
+    baldes = {}
+    por_cenario = {}
+    try:
+        while (agora := time.perf_counter()) < fim:
+            cenario = sorteio.choices(cenarios, pesos)[0]
+            resp, duracao = medir_requisicao(sessao, cenario.url, cenario.params, timeout, tolerar_falhas=True)
+            erro = resp is None or resp.status_code != cenario.status_esperado
+            indice_balde = int((agora - inicio) // intervalo_balde)
+            for destino, chave, inicio_balde in ((baldes, indice_balde, indice_balde * intervalo_balde),
+                                                 (por_cenario, cenario.chave, 0.0)):
+                balde = destino.setdefault(chave, BaldeTempo(inicio_balde))
+                balde.histograma.registrar(duracao)
+                balde.erros += erro
+    finally:
+        sessao.close()
+    return baldes, por_cenario
+
+
+def executar_resistencia(cenarios, duracao, pesos=None, usuarios=USUARIOS_PADRAO,
+                         intervalo_balde=INTERVALO_BALDE_PADRAO, intervalo_amostragem=INTERVALO_AMOSTRAGEM_PADRAO,
+                         timeout=TIMEOUT_PADRAO, semente=None):
+    """Roda uma mistura ponderada dos cenários por ``duracao`` segundos (tipicamente horas).
+
+    ``pesos`` (mesma ordem de ``cenarios``) define a frequência relativa de
+    cada cenário. A latência é resumida por balde de tempo; /metricas e
+    /health/detailed são lidos a cada ``intervalo_amostragem`` segundos. No
+    fim, cada série (p99 do cliente, p99 do servidor por endpoint, ``size_mb``
+    e estatísticas dos bancos) ganha uma reta de tendência, e subidas
+    consistentes são sinalizadas como deriva.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+    pesos = list(pesos) if pesos is not None else [1.0] * len(cenarios)
+    if len(pesos) != len(cenarios) or any(p < 0 for p in pesos) or sum(pesos) <= 0:
+        raise ValueError("Informe um peso não negativo por cenário, com soma positiva")
+
+    print(f"\n=== Resistência: {len(cenarios)} cenário(s), {usuarios} usuário(s) por "
+          f"{time.strftime('%H:%M:%S', time.gmtime(duracao))} ===")
+    url_base = localizar(cenarios[0].url)[0]
+    resultado = ResultadoResistencia(usuarios, intervalo_balde=intervalo_balde)
+    with ColetorPeriodico(intervalo_amostragem, url_base) as coletor, \
+            _MonitorSaude(intervalo_amostragem, url_base, timeout) as monitor:
+        inicio = time.perf_counter()
+        fim = inicio + duracao
+        with ThreadPoolExecutor(max_workers=usuarios) as executor:
+            futuros = [
+                executor.submit(_usuario_virtual, i, cenarios, pesos, inicio, fim, intervalo_balde, timeout, semente)
+                for i in range(usuarios)
+            ]
+            parciais = [f.result() for f in futuros]
+        resultado.duracao = time.perf_counter() - inicio
+
+    baldes = {}
+    for por_balde, por_cenario in parciais:
+        for indice, balde in por_balde.items():
+            baldes.setdefault(indice, BaldeTempo(balde.inicio)).mesclar(balde)
+        for chave, balde in por_cenario.items():
+            resultado.cenarios.setdefault(chave, BaldeTempo(0.0)).mesclar(balde)
+    resultado.baldes = [baldes[i] for i in sorted(baldes)]
+    resultado.saude = monitor.amostras
+    for endpoint in dict.fromkeys(localizar(c.url)[1] for c in cenarios):
+        resultado.serie_servidor[endpoint] = coletor.serie(endpoint)
+
+    _imprimir(resultado)
+    return resultado
+
+
+def _imprimir(resultado):
+    for chave, b in resultado.cenarios.items():
+        print(f"➡️ {chave}: {b.histograma.total} req | {b.erros} erro(s) | "
+              f"{formatar_percentis(b.histograma.percentis_confiaveis())}")
+    print(f"\n📈 Total: {resultado.total_requisicoes} req em {resultado.duracao:.0f}s, "
+          f"{resultado.total_erros} erro(s)")
+    for d in resultado.derivas():
+        icone = "🔺" if d.sinalizada else "  "
+        print(f"{icone} {d.serie}: {d.inicial:.4g} → {d.final:.4g} ({d.variacao:+.0%} da média, R² {d.r2:.2f}, "
+              f"{d.pontos} pontos)")
@@ -0,0 +1,132 @@
+import contextlib
+import io
+from dataclasses import dataclass, field
+
+from .cliente_async import CARGA_POR_CLIENTE
+from .histograma import Histograma
+from .motor import TIMEOUT_PADRAO, formatar_percentis
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+NIVEIS_PADRAO = (1, 2, 4, 8, 16, 32, 64)  # usuários virtuais por degrau
+DURACAO_DEGRAU_PADRAO = 30.0  # segundos em cada degrau
+# Critérios do joelho: dobrar a concorrência rendeu menos que GANHO_MINIMO de
+# vazão, ou o p99 passou de FATOR_P99 vezes o p99 do primeiro degrau.
+GANHO_MINIMO = 0.10
+FATOR_P99 = 4.0
+
+
+# ===============================================================
+# RESULTADO DO TESTE EM DEGRAUS
+# ===============================================================
+# Vazão e latência de um degrau contam só as respostas com o status esperado:
+# um servidor que passa a falhar rápido (5xx imediato) pareceria continuar
+# escalando. Os erros viram uma série própria (``taxa_erros``).
+@dataclass
+class Degrau:
+    usuarios: int
+    resultado: object  # ResultadoCarga do degrau
+
+    @property
+    def histograma(self):
+        """Latências das respostas bem-sucedidas de todos os cenários."""
+        h = Histograma()
+        for r in self.resultado.cenarios.values():
+            for a in r.amostras:
+                if a.status == r.status_esperado:
+                    h.registrar(a.duracao)
+        return h
+
+    @property
+    def vazao(self):
+        """Respostas bem-sucedidas por segundo."""
+        duracao = self.resultado.duracao
+        return (self.resultado.total_requisicoes - self.erros) / duracao if duracao > 0 else 0.0
+
+    @property
+    def erros(self):
+        return self.resultado.total_erros
+
+    @property
+    def taxa_erros(self):
+        total = self.resultado.total_requisicoes
+        return self.erros / total if total else 0.0
+
+    @property
+    def p99(self):
+        return self.histograma.percentil(99.0)
+
+
+@dataclass
+class ResultadoSaturacao:
+    cenarios: list  # chaves dos cenários exercitados
+    duracao_degrau: float
+    degraus: list = field(default_factory=list)
+
+    def ganho(self, i):
+        """Variação relativa da vazão do degrau ``i`` sobre o anterior (``None`` no primeiro)."""
+        if i == 0 or self.degraus[i - 1].vazao <= 0:
+            return None
+        return self.degraus[i].vazao / self.degraus[i - 1].vazao - 1
+
+    def joelho(self, ganho_minimo=GANHO_MINIMO, fator_p99=FATOR_P99):
+        """``(índice do último degrau antes da saturação, motivo)``, ou ``(None, None)`` se não saturou.
+
+        O degrau seguinte ao joelho é o primeiro em que a vazão parou de subir
+        ou o p99 disparou; o joelho é a maior concorrência que ainda rendeu.
+        """
+        base_p99 = self.degraus[0].p99 if self.degraus else None
+        for i in range(1, len(self.degraus)):
+            ganho = self.ganho(i)
+            if ganho is not None and ganho < ganho_minimo:
+                return i - 1, (f"vazão subiu só {ganho:+.0%} de {self.degraus[i - 1].usuarios} "
+                               f"para {self.degraus[i].usuarios} usuários")
+            p99 = self.degraus[i].p99
+            if base_p99 and p99 is not None and p99 > fator_p99 * base_p99:
+                return i - 1, (f"p99 foi a {p99:.3f}s com {self.degraus[i].usuarios} usuários "
+                               f"({p99 / base_p99:.1f}× o de {self.degraus[0].usuarios})")
+        return None, None
+
+    @property
+    def vazao_maxima(self):
+        return max((d.vazao for d in self.degraus), default=0.0)
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def executar_saturacao(cenarios, niveis=NIVEIS_PADRAO, duracao_degrau=DURACAO_DEGRAU_PADRAO,
+                       cliente="requests", timeout=TIMEOUT_PADRAO, intervalo_metricas=None):
+    """Sobe a concorrência em degraus e mantém cada um por ``duracao_degrau`` segundos.
+
+    Cada degrau é uma carga em laço fechado independente (``executar_carga``
+    ou a versão asyncio, conforme ``cliente``), com conexões novas; o relatório
+    traz vazão e percentis por degrau (só das respostas bem-sucedidas), a taxa
+    de erros e o joelho em que a vazão para de subir ou o p99 dispara.
+    """
+    if not cenarios:
+        raise ValueError("Nenhum cenário selecionado para a carga")
+
+    print(f"\n=== Saturação: {len(cenarios)} cenário(s), degraus de {duracao_degrau:g}s com "
+          f"{', '.join(map(str, niveis))} usuário(s) ===")
+    resultado = ResultadoSaturacao([c.chave for c in cenarios], duracao_degrau)
+    for usuarios in niveis:
+        with contextlib.redirect_stdout(io.StringIO()):
+            carga = CARGA_POR_CLIENTE[cliente](cenarios, usuarios=usuarios, duracao=duracao_degrau, timeout=timeout,
+                                               intervalo_metricas=intervalo_metricas)
+        resultado.degraus.append(Degrau(usuarios, carga))
+        ganho = resultado.ganho(len(resultado.degraus) - 1)
+        variacao = f" ({ganho:+.0%})" if ganho is not None else ""
+        degrau = resultado.degraus[-1]
+        print(f"➡️ {usuarios:>4} usuário(s): {degrau.vazao:8.2f} req/s{variacao} | {degrau.erros} erro(s) "
+              f"({degrau.taxa_erros:.1%}) | {formatar_percentis(degrau.histograma.percentis_confiaveis())}")
+
+    indice, motivo = resultado.joelho()
+    print(f"\n📈 Vazão máxima: {resultado.vazao_maxima:.2f} req/s")
+    if indice is None:
+        print(f"⚠️ Sem joelho até {niveis[-1]} usuários: suba os degraus para encontrar a saturação")
+    else:
+        joelho = resultado.degraus[indice]
+        print(f"🔺 Joelho em {joelho.usuarios} usuário(s), {joelho.vazao:.2f} req/s: {motivo}")
+    return resultado
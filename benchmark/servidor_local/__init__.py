@@ -0,0 +1,4 @@
+from .dados import ConfiguracaoDados, DadosSinteticos
+from .servidor import ServidorLocal
+
+__all__ = ["ConfiguracaoDados", "DadosSinteticos", "ServidorLocal"]
@@ -0,0 +1,274 @@
+import math
+import random
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+SETORES = ["Produção", "Administrativo", "Refrigeração", "Iluminação", "Climatização", "Utilidades"]
+TIPOS_TEMPERATURA = {
+    # tipo: (temperatura base, limite mínimo, limite máximo)
+    "AMBIENTE": (22.0, 15.0, 30.0),
+    "REFRIGERADOR": (4.0, 0.0, 8.0),
+    "FREEZER": (-18.0, -25.0, -12.0),
+}
+PERFIL_HORARIO = [
+    0.35, 0.30, 0.30, 0.30, 0.32, 0.40, 0.60, 0.85, 1.05, 1.15, 1.20, 1.20,
+    1.10, 1.15, 1.20, 1.20, 1.15, 1.10, 1.45, 1.50, 1.40, 0.90, 0.60, 0.45,
+]
+FATOR_DIA_SEMANA = [1.0, 1.02, 1.03, 1.01, 0.97, 0.70, 0.55]
+HORAS_PONTA = (18, 19, 20)
+TARIFA_PONTA = 1.35  # R$/kWh
+TARIFA_FORA_PONTA = 0.72  # R$/kWh
+_MASCARA = (1 << 64) - 1
+
+
+@dataclass
+class ConfiguracaoDados:
+    medidores_energia: int = 1000
+    medidores_temperatura: int = 200
+    dias: int = 90
+    leituras_por_hora: int = 4
+    semente: int = 42
+
+
+@dataclass
+class Leitura:
+    medidor_id: int
+    data_leitura: datetime
+    temperatura: float
+    umidade: float
+    zscore: float
+    anomalia_estatistica: bool
+    fora_limites: bool
+
+
+def _misturar(a, b, semente):
+    """Hash 64 bits (finalizador do SplitMix64) para gerar ruído determinístico sem estado."""
+    h = (a * 0x9E3779B97F4A7C15 + b * 0xC2B2AE3D27D4EB4F + semente) & _MASCARA
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASCARA
+    h ^= h >> 33
+    return h
+
+
+class DadosSinteticos:
+    """Base sintética usada pelo servidor local.
+
+    Energia: consumo e fator de potência por (medidor, dia, hora) ficam em
+    ``array('d')`` contíguos (índice ``(m * dias + d) * 24 + h``), e o número de
+    leituras brutas é ``leituras_por_hora`` por hora. Temperatura/umidade: as
+    leituras brutas não são materializadas; cada uma é calculada a partir de
+    (medidor, posição no tempo) sob demanda, e os agregados diários são
+    calculados na primeira consulta e guardados em cache.
+    """
+
+    def __init__(self, config=None, agora=None):
+        self.config = config or ConfiguracaoDados()
+        self.agora = agora or datetime.now().replace(microsecond=0)
+        self.fim_data = self.agora.date()
+        self.inicio_data = self.fim_data - timedelta(days=self.config.dias - 1)
+        self.intervalo = timedelta(hours=1) / self.config.leituras_por_hora
+        self._gerar_energia()
+        self._gerar_temperatura()
+
+    # ---------------------------------------------------------------
+    # Calendário
+    # ---------------------------------------------------------------
+    def data_do_dia(self, d):
+        return self.inicio_data + timedelta(days=d)
+
+    def faixa_dias(self, data_inicio=None, data_fim=None):
+        """Índices de dia [d0, d1) cobertos pelo filtro de datas (dias inteiros)."""
+        d0 = 0 if data_inicio is None else (data_inicio - self.inicio_data).days
+        d1 = self.config.dias if data_fim is None else (data_fim - self.inicio_data).days + 1
+        return max(0, d0), min(self.config.dias, d1)
+
+    # ---------------------------------------------------------------
+    # Energia
+    # ---------------------------------------------------------------
+    def _gerar_energia(self):
+        cfg = self.config
+        rng = random.Random(cfg.semente)
+        self.medidores_energia = list(range(1, cfg.medidores_energia + 1))
+        self.descricao_energia = {
+            m: f"Medidor {m:04d} - {SETORES[m % len(SETORES)]}" for m in self.medidores_energia
+        }
+        self.consumo = array("d")
+        self.fator_potencia = array("d")
+        self.consumo_dia = array("d")
+        self.consumo_ponta_dia = array("d")
+        for _ in self.medidores_energia:
+            base = rng.uniform(0.5, 25.0)
+            fp_base = rng.uniform(0.78, 0.97)
+            for d in range(cfg.dias):
+                fator = FATOR_DIA_SEMANA[self.data_do_dia(d).weekday()] * rng.uniform(0.85, 1.15)
+                if rng.random() < 0.01:
+                    fator *= rng.uniform(2.0, 4.0)
+                horas = [base * fator * p * rng.uniform(0.9, 1.1) for p in PERFIL_HORARIO]
+                self.consumo.extend(horas)
+                self.fator_potencia.extend(min(1.0, fp_base + rng.gauss(0, 0.03)) for _ in range(24))
+                self.consumo_dia.append(sum(horas))
+                self.consumo_ponta_dia.append(sum(horas[h] for h in HORAS_PONTA))
+        self._gerar_anomalias_energia()
+
+    def _gerar_anomalias_energia(self):
+        dias = self.config.dias
+        self.zscore_dia = array("d", bytes(8 * len(self.consumo_dia)))
+        anomalias = []
+        for i, m in enumerate(self.medidores_energia):
+            serie = self.consumo_dia[i * dias:(i + 1) * dias]
+            media = sum(serie) / dias
+            desvio = math.sqrt(sum((v - media) ** 2 for v in serie) / dias) or 1.0
+            for d, v in enumerate(serie):
+                z = (v - media) / desvio
+                self.zscore_dia[i * dias + d] = z
+                if abs(z) >= 2.0:
+                    anomalias.append((d, m, v, z))
+        anomalias.sort(key=lambda a: (-a[0], a[1]))
+        self.anomalias_energia = anomalias
+
+    def indice_medidor_energia(self, m):
+        return m - 1 if 1 <= m <= self.config.medidores_energia else None
+
+    def fatia_horas(self, m, d0, d1):
+        """Posições [ini, fim) no array horário de um medidor entre os dias d0 e d1."""
+        base = self.indice_medidor_energia(m) * self.config.dias
+        return (base + d0) * 24, (base + d1) * 24
+
+    def leituras_energia(self, horas):
+        return horas * self.config.leituras_por_hora
+
+    # ---------------------------------------------------------------
+    # Temperatura e umidade
+    # ---------------------------------------------------------------
+    def _gerar_temperatura(self):
+        cfg = self.config
+        rng = random.Random(cfg.semente + 1)
+        tipos = list(TIPOS_TEMPERATURA)
+        self.medidores_temperatura = list(range(1, cfg.medidores_temperatura + 1))
+        self.tipo_temperatura = {}
+        self.perfil_temperatura = {}
+        for m in self.medidores_temperatura:
+            tipo = tipos[0] if rng.random() < 0.5 else rng.choice(tipos[1:])
+            base, _, _ = TIPOS_TEMPERATURA[tipo]
+            self.tipo_temperatura[m] = tipo
+            self.perfil_temperatura[m] = (
+                base + rng.uniform(-1.5, 1.5),  # temperatura média
+                rng.uniform(0.5, 3.0),          # amplitude diária
+                rng.uniform(0.3, 1.2),          # ruído
+                rng.uniform(35.0, 70.0),        # umidade média
+            )
+        self.descricao_temperatura = {
+            m: f"Sensor {m:04d} - {self.tipo_temperatura[m].title()}" for m in self.medidores_temperatura
+        }
+        inicio = datetime.combine(self.inicio_data, datetime.min.time())
+        self.inicio_leituras = inicio
+        self.total_posicoes = int((self.agora - inicio) / self.intervalo) + 1
+        self._cache_dia_temperatura = {}
+        self._padrao_horario = None
+
+    def instante(self, k):
+        return self.inicio_leituras + k * self.intervalo
+
+    def posicao(self, instante):
+        """Primeira posição de leitura em ou após ``instante`` (limitada à base)."""
+        k = math.ceil((instante - self.inicio_leituras) / self.intervalo)
+        return min(max(0, k), self.total_posicoes)
+
+    def _valores(self, m, k):
+        """(temperatura, umidade, anomalia) crus de uma leitura; caminho rápido dos agregados."""
+        media, amplitude, ruido, umidade_media = self.perfil_temperatura[m]
+        h = _misturar(m, k, self.config.semente)
+        u1 = (h & 0xFFFFFFFF) / 4294967296.0
+        u2 = (h >> 32) / 4294967296.0
+        por_dia = 24 * self.config.leituras_por_hora
+        temperatura = media + amplitude * math.sin(2 * math.pi * ((k % por_dia) / por_dia - 0.375)) \
+            + (u1 - 0.5) * 2 * ruido
+        anomalia = u2 > 0.985
+        if anomalia:
+            temperatura += (8.0 + 8.0 * u1) * (1 if u2 > 0.9925 else -1)
+        umidade = min(100.0, max(0.0, umidade_media + (u2 - 0.5) * 10))
+        return temperatura, umidade, anomalia
+
+    def faixa_posicoes(self, data_inicio=None, data_fim=None):
+        """Posições [k0, k1) das leituras entre ``data_inicio`` e ``data_fim`` (inclusive)."""
+        k0 = 0 if data_inicio is None else self.posicao(data_inicio)
+        if data_fim is None:
+            k1 = self.total_posicoes
+        else:
+            k1 = min(self.total_posicoes, max(0, math.floor((data_fim - self.inicio_leituras) / self.intervalo) + 1))
+        return k0, max(k0, k1)
+
+    def leitura(self, m, k):
+        temperatura, umidade, anomalia = self._valores(m, k)
+        media, amplitude, ruido, _ = self.perfil_temperatura[m]
+        _, minimo, maximo = TIPOS_TEMPERATURA[self.tipo_temperatura[m]]
+        return Leitura(
+            medidor_id=m,
+            data_leitura=self.instante(k),
+            temperatura=round(temperatura, 2),
+            umidade=round(umidade, 2),
+            zscore=round((temperatura - media) / (amplitude + ruido), 3),
+            anomalia_estatistica=anomalia,
+            fora_limites=not (minimo <= temperatura <= maximo),
+        )
+
+    def agregado_dia_temperatura(self, m, d):
+        """(leituras, soma, mínimo, máximo, anomalias) de um sensor num dia, com cache."""
+        chave = (m, d)
+        agregado = self._cache_dia_temperatura.get(chave)
+        if agregado is None:
+            por_dia = 24 * self.config.leituras_por_hora
+            k0 = d * por_dia
+            k1 = min(k0 + por_dia, self.total_posicoes)
+            _, minimo_tipo, maximo_tipo = TIPOS_TEMPERATURA[self.tipo_temperatura[m]]
+            valores = self._valores
+            temperaturas = []
+            anomalias = 0
+            for k in range(k0, k1):
+                temperatura, _, anomalia = valores(m, k)
+                temperaturas.append(temperatura)
+                if anomalia or not (minimo_tipo <= temperatura <= maximo_tipo):
+                    anomalias += 1
+            if temperaturas:
+                agregado = (len(temperaturas), sum(temperaturas), min(temperaturas), max(temperaturas), anomalias)
+            else:
+                agregado = (0, 0.0, None, None, 0)
+            self._cache_dia_temperatura[chave] = agregado
+        return agregado
+
+    def padrao_horario_temperatura(self):
+        """Somas de temperatura e umidade e contagem por hora do dia sobre toda a base, com cache."""
+        if self._padrao_horario is None:
+            por_hora = self.config.leituras_por_hora
+            somas, umidades, totais = [0.0] * 24, [0.0] * 24, [0] * 24
+            for m in self.medidores_temperatura:
+                for k in range(self.total_posicoes):
+                    temperatura, umidade, _ = self._valores(m, k)
+                    h = (k // por_hora) % 24
+                    somas[h] += temperatura
+                    umidades[h] += umidade
+                    totais[h] += 1
+            self._padrao_horario = (somas, umidades, totais)
+        return self._padrao_horario
+
+    def aquecer(self):
+        """Pré-calcula os agregados de temperatura que normalmente são montados sob demanda."""
+        for m in self.medidores_temperatura:
+            for d in range(self.config.dias):
+                self.agregado_dia_temperatura(m, d)
+        self.padrao_horario_temperatura()
+
+    # ---------------------------------------------------------------
+    # Resumo usado por /health/detailed
+    # ---------------------------------------------------------------
+    @property
+    def total_leituras_energia(self):
+        return len(self.consumo) * self.config.leituras_por_hora
+
+    @property
+    def total_leituras_temperatura(self):
+        return self.total_posicoes * len(self.medidores_temperatura)
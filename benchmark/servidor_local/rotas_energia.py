@@ -0,0 +1,374 @@
+import math
+from datetime import date, datetime, timedelta
+
+from .dados import HORAS_PONTA, TARIFA_FORA_PONTA, TARIFA_PONTA
+from .validacao import intervalo_datas, lista_inteiros, parametro
+
+# ===============================================================
+# ROTAS /analise_energia/*
+# ===============================================================
+PREFIXO = "/analise_energia"
+DIAS_SEMANA = ["Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira", "Sexta-feira", "Sábado", "Domingo"]
+FATOR_POTENCIA_IDEAL = 0.92
+LIMITE_MAXIMO = 100000
+
+
+def _custo(total, ponta):
+    return ponta * TARIFA_PONTA + (total - ponta) * TARIFA_FORA_PONTA
+
+
+def _filtros(dados, query):
+    """Filtros comuns: intervalo de datas (dias inteiros) e lista de medidores existentes."""
+    inicio, fim = intervalo_datas(query, date)
+    ids = lista_inteiros(query, "medidor_ids")
+    if ids is None:
+        medidores = dados.medidores_energia
+    else:
+        medidores = [m for m in dict.fromkeys(ids) if dados.indice_medidor_energia(m) is not None]
+    d0, d1 = dados.faixa_dias(inicio, fim)
+    return medidores, d0, d1
+
+
+def _dia(dados, m, d):
+    return dados.indice_medidor_energia(m) * dados.config.dias + d
+
+
+def consumo_temporal(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    agregacao = parametro(query, "agregacao", padrao="dia", opcoes=["hora", "dia", "semana", "mes"])
+    limit = parametro(query, "limit", int, padrao=1000, minimo=1, maximo=LIMITE_MAXIMO)
+    resultado = []
+
+    if agregacao == "hora":
+        lph = dados.config.leituras_por_hora
+        for d in range(d1 - 1, d0 - 1, -1):
+            for h in range(23, -1, -1):
+                periodo = f"{dados.data_do_dia(d).isoformat()} {h:02d}:00:00"
+                for m in medidores:
+                    consumo = dados.consumo[_dia(dados, m, d) * 24 + h]
+                    resultado.append({
+                        "periodo": periodo,
+                        "medidor_id": m,
+                        "medidor_descricao": dados.descricao_energia[m],
+                        "consumo_total_kwh": round(consumo, 3),
+                        "consumo_medio_kwh": round(consumo / lph, 3),
+                        "total_leituras": lph,
+                    })
+                    if len(resultado) >= limit:
+                        return resultado
+        return resultado
+
+    grupos = {}
+    for d in range(d1 - 1, d0 - 1, -1):
+        dia = dados.data_do_dia(d)
+        if agregacao == "semana":
+            chave = dia - timedelta(days=dia.weekday())
+        elif agregacao == "mes":
+            chave = dia.replace(day=1)
+        else:
+            chave = dia
+        grupos.setdefault(chave.isoformat(), []).append(d)
+
+    leituras_dia = dados.leituras_energia(24)
+    for periodo, dias in grupos.items():
+        for m in medidores:
+            consumo = sum(dados.consumo_dia[_dia(dados, m, d)] for d in dias)
+            leituras = leituras_dia * len(dias)
+            resultado.append({
+                "periodo": periodo,
+                "medidor_id": m,
+                "medidor_descricao": dados.descricao_energia[m],
+                "consumo_total_kwh": round(consumo, 3),
+                "consumo_medio_kwh": round(consumo / leituras, 3),
+                "total_leituras": leituras,
+            })
+            if len(resultado) >= limit:
+                return resultado
+    return resultado
+
+
+def analise_custos(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    limit = parametro(query, "limit", int, padrao=1000, minimo=1, maximo=LIMITE_MAXIMO)
+    resultado = []
+    for d in range(d1 - 1, d0 - 1, -1):
+        if len(resultado) >= limit:
+            break
+        total = sum(dados.consumo_dia[_dia(dados, m, d)] for m in medidores)
+        ponta = sum(dados.consumo_ponta_dia[_dia(dados, m, d)] for m in medidores)
+        custo_ponta = round(ponta * TARIFA_PONTA, 2)
+        custo_fora_ponta = round((total - ponta) * TARIFA_FORA_PONTA, 2)
+        resultado.append({
+            "dia": dados.data_do_dia(d).isoformat(),
+            "custo_ponta": custo_ponta,
+            "custo_fora_ponta": custo_fora_ponta,
+            "custo_total": round(custo_ponta + custo_fora_ponta, 2),
+        })
+    return resultado
+
+
+def analise_fator_potencia(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    limit = parametro(query, "limit", int, padrao=24, minimo=1, maximo=LIMITE_MAXIMO)
+    soma, minimo, maximo, abaixo, total = [0.0] * 24, [math.inf] * 24, [-math.inf] * 24, [0] * 24, [0] * 24
+    for m in medidores:
+        ini, fim = dados.fatia_horas(m, d0, d1)
+        fatia = dados.fator_potencia[ini:fim]
+        for h in range(24):
+            valores = fatia[h::24]
+            if not valores:
+                continue
+            soma[h] += sum(valores)
+            minimo[h] = min(minimo[h], min(valores))
+            maximo[h] = max(maximo[h], max(valores))
+            abaixo[h] += sum(1 for v in valores if v < FATOR_POTENCIA_IDEAL)
+            total[h] += len(valores)
+    return [
+        {
+            "hora": h,
+            "fp_medio": round(soma[h] / total[h], 4),
+            "fp_min": round(minimo[h], 4),
+            "fp_max": round(maximo[h], 4),
+            "percentual_abaixo_ideal": round(100.0 * abaixo[h] / total[h], 2),
+        }
+        for h in range(24) if total[h]
+    ][:limit]
+
+
+def _resumo_medidor(dados, m, d0, d1):
+    i0, i1 = _dia(dados, m, d0), _dia(dados, m, d1 - 1) + 1
+    total = sum(dados.consumo_dia[i0:i1])
+    ponta = sum(dados.consumo_ponta_dia[i0:i1])
+    ini, fim = dados.fatia_horas(m, d0, d1)
+    return total, ponta, ini, fim
+
+
+def comparacao_medidores(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    limit = parametro(query, "limit", int, padrao=1000, minimo=1, maximo=LIMITE_MAXIMO)
+    if d0 >= d1:
+        return []
+    periodo = f"{dados.data_do_dia(d0).isoformat()} a {dados.data_do_dia(d1 - 1).isoformat()}"
+    resultado = []
+    for m in medidores:
+        total, ponta, ini, fim = _resumo_medidor(dados, m, d0, d1)
+        leituras = dados.leituras_energia(fim - ini)
+        resultado.append({
+            "medidor_descricao": dados.descricao_energia[m],
+            "periodo": periodo,
+            "consumo_total_kwh": round(total, 3),
+            "custo_total": round(_custo(total, ponta), 2),
+            "consumo_medio_kwh": round(total / leituras, 4),
+            "pico_consumo_kwh": round(max(dados.consumo[ini:fim]), 3),
+            "fator_potencia_medio": round(sum(dados.fator_potencia[ini:fim]) / (fim - ini), 4),
+            "total_leituras": leituras,
+        })
+    resultado.sort(key=lambda r: -r["consumo_total_kwh"])
+    return resultado[:limit]
+
+
+def consumo_por_dia_semana(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    totais, ocorrencias = [0.0] * 7, [0] * 7
+    for d in range(d0, d1):
+        dia_semana = dados.data_do_dia(d).weekday()
+        totais[dia_semana] += sum(dados.consumo_dia[_dia(dados, m, d)] for m in medidores)
+        ocorrencias[dia_semana] += len(medidores)
+    return [
+        {
+            "dia_semana": DIAS_SEMANA[i],
+            "dia_numero": i,
+            "consumo_medio_kwh": round(totais[i] / ocorrencias[i], 3),
+            "consumo_total_kwh": round(totais[i], 3),
+        }
+        for i in range(7) if ocorrencias[i]
+    ]
+
+
+def consumo_por_hora(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    totais, horas = [0.0] * 24, [0] * 24
+    for m in medidores:
+        ini, fim = dados.fatia_horas(m, d0, d1)
+        fatia = dados.consumo[ini:fim]
+        for h in range(24):
+            valores = fatia[h::24]
+            totais[h] += sum(valores)
+            horas[h] += len(valores)
+    resultado = []
+    for h in range(24):
+        if not horas[h]:
+            continue
+        leituras = dados.leituras_energia(horas[h])
+        resultado.append({
+            "hora": h,
+            "horario_ponta": h in HORAS_PONTA,
+            "consumo_medio_kwh": round(totais[h] / leituras, 4),
+            "consumo_total_kwh": round(totais[h], 3),
+            "total_leituras": leituras,
+        })
+    return resultado
+
+
+def dashboard_operacional(dados, query):
+    hoje = dados.config.dias - 1
+    consumos = [(dados.consumo_dia[_dia(dados, m, hoje)], m) for m in dados.medidores_energia]
+    total = sum(c for c, _ in consumos)
+    ponta = sum(dados.consumo_ponta_dia[_dia(dados, m, hoje)] for m in dados.medidores_energia)
+    fp = [
+        sum(dados.fator_potencia[_dia(dados, m, hoje) * 24:(_dia(dados, m, hoje) + 1) * 24]) / 24
+        for m in dados.medidores_energia
+    ]
+    semana = [
+        sum(dados.consumo_dia[_dia(dados, m, d)] for m in dados.medidores_energia)
+        for d in range(max(0, hoje - 7), hoje)
+    ]
+    consumos.sort(reverse=True)
+    return {
+        "total_medidores": len(dados.medidores_energia),
+        "consumo_total_dia_kwh": round(total, 3),
+        "custo_total_dia": round(_custo(total, ponta), 2),
+        "consumo_medio_horario_kwh": round(total / 24, 3),
+        "fator_potencia_medio": round(sum(fp) / len(fp), 4) if fp else 0.0,
+        "anomalias_detectadas": sum(1 for a in dados.anomalias_energia if a[0] == hoje),
+        "previsao_consumo_proximo_periodo": round(sum(semana) / len(semana), 3) if semana else round(total, 3),
+        "top_consumidores": [
+            {"medidor": dados.descricao_energia[m], "consumo_kwh": round(c, 3)} for c, m in consumos[:5]
+        ],
+        "timestamp_atualizacao": datetime.now().isoformat(),
+    }
+
+
+def _classificar_fp(fp):
+    if fp >= 0.95:
+        return "Excelente"
+    if fp >= FATOR_POTENCIA_IDEAL:
+        return "Adequado"
+    if fp >= 0.85:
+        return "Atenção"
+    return "Crítico"
+
+
+def eficiencia_energetica(dados, query):
+    d0, d1 = 0, dados.config.dias
+    resultado = []
+    for m in dados.medidores_energia:
+        total, _, ini, fim = _resumo_medidor(dados, m, d0, d1)
+        fp = sum(dados.fator_potencia[ini:fim]) / (fim - ini)
+        desvio = FATOR_POTENCIA_IDEAL - fp
+        consumo_mensal = total / dados.config.dias * 30
+        economia = max(0.0, desvio) * consumo_mensal * TARIFA_FORA_PONTA
+        recomendacoes = []
+        if desvio > 0:
+            recomendacoes.append("Avaliar instalação de banco de capacitores")
+        if desvio > 0.05:
+            recomendacoes.append("Revisar cargas indutivas e motores subdimensionados")
+        if not recomendacoes:
+            recomendacoes.append("Manter monitoramento periódico")
+        resultado.append({
+            "medidor_descricao": dados.descricao_energia[m],
+            "fator_potencia_medio": round(fp, 4),
+            "fator_potencia_ideal": FATOR_POTENCIA_IDEAL,
+            "desvio_fp": round(desvio, 4),
+            "potencial_economia_mensal": round(economia, 2),
+            "recomendacoes": recomendacoes,
+            "classificacao": _classificar_fp(fp),
+        })
+    resultado.sort(key=lambda r: -r["potencial_economia_mensal"])
+    return resultado
+
+
+def estatisticas_gerais(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    total = ponta = fp = 0.0
+    horas = 0
+    for m in medidores:
+        if d0 >= d1:
+            break
+        t, p, ini, fim = _resumo_medidor(dados, m, d0, d1)
+        total += t
+        ponta += p
+        fp += sum(dados.fator_potencia[ini:fim])
+        horas += fim - ini
+    leituras = dados.leituras_energia(horas)
+    return {
+        "total_leituras": leituras,
+        "total_medidores": len(medidores),
+        "periodo": {
+            "inicio": dados.data_do_dia(d0).isoformat() if d0 < d1 else None,
+            "fim": dados.data_do_dia(d1 - 1).isoformat() if d0 < d1 else None,
+        },
+        "consumo": {
+            "total_kwh": round(total, 3),
+            "medio_kwh": round(total / leituras, 4) if leituras else 0.0,
+        },
+        "custo_total": round(_custo(total, ponta), 2),
+        "fator_potencia_medio": round(fp / horas, 4) if horas else 0.0,
+    }
+
+
+def top_consumidores(dados, query):
+    medidores, d0, d1 = _filtros(dados, query)
+    top_n = parametro(query, "top_n", int, padrao=10, minimo=5, maximo=50)
+    if d0 >= d1:
+        return []
+    ranking = []
+    for m in medidores:
+        total, ponta, _, _ = _resumo_medidor(dados, m, d0, d1)
+        ranking.append((total, ponta, m))
+    ranking.sort(reverse=True)
+    return [
+        {
+            "posicao": i + 1,
+            "medidor": dados.descricao_energia[m],
+            "consumo_total_kwh": round(total, 3),
+            "custo_total": round(_custo(total, ponta), 2),
+        }
+        for i, (total, ponta, m) in enumerate(ranking[:top_n])
+    ]
+
+
+def _gravidade_energia(z):
+    if abs(z) >= 3.0:
+        return "alta"
+    if abs(z) >= 2.5:
+        return "media"
+    return "baixa"
+
+
+def anomalias_detectadas(dados, query):
+    limit = parametro(query, "limit", int, padrao=50, minimo=1, maximo=500)
+    ids = lista_inteiros(query, "medidor_ids")
+    filtro = set(ids) if ids is not None else None
+    resultado = []
+    for i, (d, m, consumo, z) in enumerate(dados.anomalias_energia):
+        if filtro is not None and m not in filtro:
+            continue
+        resultado.append({
+            "id": i + 1,
+            "medidor_descricao": dados.descricao_energia[m],
+            "data": dados.data_do_dia(d).isoformat(),
+            "consumo_kwh": round(consumo, 3),
+            "consumo_zscore": round(z, 3),
+            "is_anomalia": True,
+            "gravidade": _gravidade_energia(z),
+            "motivo": f"Consumo {'acima' if z > 0 else 'abaixo'} da média ({z:+.1f} desvios padrão)",
+        })
+        if len(resultado) >= limit:
+            break
+    return resultado
+
+
+ROTAS = {
+    f"{PREFIXO}/consumo-temporal": consumo_temporal,
+    f"{PREFIXO}/analise-custos": analise_custos,
+    f"{PREFIXO}/analise-fator-potencia": analise_fator_potencia,
+    f"{PREFIXO}/comparacao-medidores": comparacao_medidores,
+    f"{PREFIXO}/consumo-por-dia-semana": consumo_por_dia_semana,
+    f"{PREFIXO}/consumo-por-hora": consumo_por_hora,
+    f"{PREFIXO}/dashboard-operacional": dashboard_operacional,
+    f"{PREFIXO}/eficiencia-energetica": eficiencia_energetica,
+    f"{PREFIXO}/estatisticas-gerais": estatisticas_gerais,
+    f"{PREFIXO}/top-consumidores": top_consumidores,
+    f"{PREFIXO}/anomalias-detectadas": anomalias_detectadas,
+}
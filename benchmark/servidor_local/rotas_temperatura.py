@@ -0,0 +1,234 @@
+import math
+from datetime import datetime
+
+from .dados import TIPOS_TEMPERATURA
+from .validacao import intervalo_datas, lista_inteiros, parametro
+
+# ===============================================================
+# ROTAS /analise_medidores_temp_hum/*
+# ===============================================================
+PREFIXO = "/analise_medidores_temp_hum"
+GRAVIDADES = ["baixa", "media", "alta"]
+LIMITE_ALERTA_DIA = 3  # anomalias no dia para o sensor entrar em alerta
+
+
+def _sensores(dados, query, tipo=None):
+    ids = lista_inteiros(query, "medidor_ids")
+    if ids is None:
+        sensores = dados.medidores_temperatura
+    else:
+        sensores = sorted(m for m in set(ids) if m in dados.tipo_temperatura)
+    if tipo is not None:
+        sensores = [m for m in sensores if dados.tipo_temperatura[m] == tipo]
+    return sensores
+
+
+def _anomala(leitura):
+    return leitura.anomalia_estatistica or leitura.fora_limites
+
+
+def _item_medicao(dados, leitura):
+    return {
+        "data_leitura": leitura.data_leitura.isoformat(),
+        "medidor_id": leitura.medidor_id,
+        "temperatura": leitura.temperatura,
+        "umidade": leitura.umidade,
+        "tipo_medidor": dados.tipo_temperatura[leitura.medidor_id],
+        "anomalia_estatistica": leitura.anomalia_estatistica,
+        "fora_limites_definidos": leitura.fora_limites,
+        "anomalia_alvo": _anomala(leitura),
+    }
+
+
+def medicoes_enriquecidas(dados, query):
+    tipo = parametro(query, "tipo_sensor", opcoes=list(TIPOS_TEMPERATURA))
+    inicio, fim = intervalo_datas(query, datetime)
+    limit = parametro(query, "limit", int, padrao=100, minimo=1, maximo=1000)
+    offset = parametro(query, "offset", int, padrao=0, minimo=0)
+    apenas_anomalias = parametro(query, "apenas_anomalias", bool, padrao=False)
+    sensores = _sensores(dados, query, tipo)
+    k0, k1 = dados.faixa_posicoes(inicio, fim)
+    if not sensores:
+        return []
+
+    resultado = []
+    if not apenas_anomalias:
+        # Ordem (data_leitura desc, medidor_id): a linha ``offset`` é calculável diretamente.
+        k, j = k1 - 1 - offset // len(sensores), offset % len(sensores)
+        while k >= k0 and len(resultado) < limit:
+            resultado.append(_item_medicao(dados, dados.leitura(sensores[j], k)))
+            j += 1
+            if j == len(sensores):
+                k, j = k - 1, 0
+        return resultado
+
+    pular = offset
+    for k in range(k1 - 1, k0 - 1, -1):
+        for m in sensores:
+            leitura = dados.leitura(m, k)
+            if not _anomala(leitura):
+                continue
+            if pular:
+                pular -= 1
+                continue
+            resultado.append(_item_medicao(dados, leitura))
+            if len(resultado) >= limit:
+                return resultado
+    return resultado
+
+
+def series_temporais_hora(dados, query):
+    inicio, fim = intervalo_datas(query, datetime)
+    limit = parametro(query, "limit", int, padrao=100, minimo=1, maximo=10000)
+    sensores = _sensores(dados, query)
+    k0, k1 = dados.faixa_posicoes(inicio, fim)
+    lph = dados.config.leituras_por_hora
+    resultado = []
+    if not sensores or k0 >= k1:
+        return resultado
+    for hora in range((k1 - 1) // lph, k0 // lph - 1, -1):
+        posicoes = range(max(k0, hora * lph), min(k1, (hora + 1) * lph))
+        for m in sensores:
+            leituras = [dados.leitura(m, k) for k in posicoes]
+            temperaturas = [l.temperatura for l in leituras]
+            media = sum(temperaturas) / len(temperaturas)
+            desvio = None
+            if len(temperaturas) > 1:
+                desvio = round(math.sqrt(sum((t - media) ** 2 for t in temperaturas) / (len(temperaturas) - 1)), 3)
+            resultado.append({
+                "medidor_id": m,
+                "medidor_descricao": dados.descricao_temperatura[m],
+                "data_hora": dados.instante(hora * lph).isoformat(),
+                "temp_media": round(media, 3),
+                "temp_min": min(temperaturas),
+                "temp_max": max(temperaturas),
+                "temp_desvio_padrao": desvio,
+                "total_leituras": len(leituras),
+                "total_anomalias": sum(1 for l in leituras if _anomala(l)),
+            })
+            if len(resultado) >= limit:
+                return resultado
+    return resultado
+
+
+def resumo_por_medidor(dados, query):
+    inicio, fim = intervalo_datas(query, datetime)
+    d0, d1 = dados.faixa_dias(inicio.date() if inicio else None, fim.date() if fim else None)
+    _, k1 = dados.faixa_posicoes(None, fim)
+    resultado = []
+    for m in dados.medidores_temperatura:
+        agregados = [dados.agregado_dia_temperatura(m, d) for d in range(d0, d1)]
+        agregados = [a for a in agregados if a[0]]
+        if not agregados:
+            continue
+        total = sum(a[0] for a in agregados)
+        anomalias = sum(a[4] for a in agregados)
+        percentual = 100.0 * anomalias / total
+        resultado.append({
+            "medidor_id": m,
+            "medidor_descricao": dados.descricao_temperatura[m],
+            "total_leituras": total,
+            "temperatura_media": round(sum(a[1] for a in agregados) / total, 3),
+            "temperatura_min": round(min(a[2] for a in agregados), 2),
+            "temperatura_max": round(max(a[3] for a in agregados), 2),
+            "total_anomalias": anomalias,
+            "percentual_anomalias": round(percentual, 2),
+            "ultima_leitura": dados.instante(k1 - 1).isoformat(),
+            "status": "ALERTA" if percentual > 5.0 else "OK",
+        })
+    return resultado
+
+
+def padroes_consumo_hora(dados, query):
+    parametro(query, "tipo_sensor", opcoes=["temperatura", "umidade"])
+    somas, umidades, totais = dados.padrao_horario_temperatura()
+    return [
+        {
+            "hora": h,
+            "temperatura_media": round(somas[h] / totais[h], 3),
+            "umidade_media": round(umidades[h] / totais[h], 3),
+            "total_leituras": totais[h],
+        }
+        for h in range(24) if totais[h]
+    ]
+
+
+def _gravidade_temperatura(z):
+    if abs(z) >= 6.0:
+        return "alta"
+    if abs(z) >= 4.0:
+        return "media"
+    return "baixa"
+
+
+def anomalias_detectadas(dados, query):
+    gravidade_min = parametro(query, "gravidade_min", padrao="baixa", opcoes=GRAVIDADES)
+    limit = parametro(query, "limit", int, padrao=50, minimo=1, maximo=500)
+    sensores = _sensores(dados, query)
+    nivel_minimo = GRAVIDADES.index(gravidade_min)
+    resultado = []
+    for k in range(dados.total_posicoes - 1, -1, -1):
+        for m in sensores:
+            leitura = dados.leitura(m, k)
+            if not _anomala(leitura):
+                continue
+            gravidade = _gravidade_temperatura(leitura.zscore)
+            if GRAVIDADES.index(gravidade) < nivel_minimo:
+                continue
+            resultado.append({
+                "medidor_id": m,
+                "medidor_descricao": dados.descricao_temperatura[m],
+                "data_leitura": leitura.data_leitura.isoformat(),
+                "temperatura": leitura.temperatura,
+                "temp_zscore": leitura.zscore,
+                "anomalia_tipo": "temperatura_alta" if leitura.zscore > 0 else "temperatura_baixa",
+                "gravidade": gravidade,
+            })
+            if len(resultado) >= limit:
+                return resultado
+    return resultado
+
+
+def dashboard_operacional(dados, query):
+    hoje = dados.config.dias - 1
+    agregados = {m: dados.agregado_dia_temperatura(m, hoje) for m in dados.medidores_temperatura}
+    leituras = sum(a[0] for a in agregados.values())
+    return {
+        "total_medidores": len(dados.medidores_temperatura),
+        "medidores_ativos": sum(1 for a in agregados.values() if a[0]),
+        "total_leituras_hoje": leituras,
+        "total_anomalias_hoje": sum(a[4] for a in agregados.values()),
+        "temperatura_media_geral": round(sum(a[1] for a in agregados.values()) / leituras, 3) if leituras else 0.0,
+        "medidores_com_alerta": [
+            {"medidor_id": m, "medidor": dados.descricao_temperatura[m], "anomalias_hoje": a[4]}
+            for m, a in agregados.items() if a[4] >= LIMITE_ALERTA_DIA
+        ],
+        "timestamp_atualizacao": datetime.now().isoformat(),
+    }
+
+
+def status_medidores(dados, query):
+    ultima = dados.total_posicoes - 1
+    resultado = []
+    for m in dados.medidores_temperatura:
+        leitura = dados.leitura(m, ultima)
+        resultado.append({
+            "medidor_id": m,
+            "medidor": dados.descricao_temperatura[m],
+            "ultima_leitura": leitura.data_leitura.isoformat(),
+            "dias_sem_dados": (dados.agora.date() - leitura.data_leitura.date()).days,
+            "ultima_temperatura_c": leitura.temperatura,
+            "ultima_umidade_percent": leitura.umidade,
+        })
+    return resultado
+
+
+ROTAS = {
+    f"{PREFIXO}/medicoes-enriquecidas": medicoes_enriquecidas,
+    f"{PREFIXO}/series-temporais-hora": series_temporais_hora,
+    f"{PREFIXO}/resumo-por-medidor": resumo_por_medidor,
+    f"{PREFIXO}/padroes-consumo-hora": padroes_consumo_hora,
+    f"{PREFIXO}/anomalias-detectadas": anomalias_detectadas,
+    f"{PREFIXO}/dashboard-operacional": dashboard_operacional,
+    f"{PREFIXO}/status-medidores": status_medidores,
+}
@@ -0,0 +1,221 @@
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from . import rotas_energia, rotas_temperatura
+from .dados import DadosSinteticos
+from .validacao import ErroValidacao
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+VERSAO = "0.0.1"
+MODO = "Desenvolvimento"
+BALDES_DURACAO = [0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0]
+
+
+# ===============================================================
+# MÉTRICAS PROMETHEUS DO SERVIDOR
+# ===============================================================
+class MetricasServidor:
+    """Contadores e histogramas no formato exposto pela API real em /metricas."""
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self.inicio = time.time()
+        self.requisicoes = {}
+        self.duracoes = {}
+
+    def registrar(self, metodo, endpoint, status, duracao):
+        with self._trava:
+            chave = (metodo, endpoint, str(status))
+            self.requisicoes[chave] = self.requisicoes.get(chave, 0) + 1
+            baldes, soma, total = self.duracoes.get((metodo, endpoint), ([0] * len(BALDES_DURACAO), 0.0, 0))
+            baldes = [c + (duracao <= limite) for c, limite in zip(baldes, BALDES_DURACAO)]
+            self.duracoes[(metodo, endpoint)] = (baldes, soma + duracao, total + 1)
+
+    def exposicao(self):
+        with self._trava:
+            # Como no prometheus_client, as métricas do processo saem mesmo antes da
+            # primeira requisição instrumentada.
+            linhas = [
+                "# HELP process_start_time_seconds Start time of the process since unix epoch in seconds.",
+                "# TYPE process_start_time_seconds gauge",
+                f"process_start_time_seconds {self.inicio:.2f}",
+                "# HELP api_requests_total Total de requisições recebidas pela API",
+                "# TYPE api_requests_total counter",
+            ]
+            for (metodo, endpoint, status), total in sorted(self.requisicoes.items()):
+                linhas.append(
+                    f'api_requests_total{{method="{metodo}",endpoint="{endpoint}",status_code="{status}"}} {float(total)}'
+                )
+            linhas += [
+                "# HELP api_request_duration_seconds Duração das requisições em segundos",
+                "# TYPE api_request_duration_seconds histogram",
+            ]
+            for (metodo, endpoint), (baldes, soma, total) in sorted(self.duracoes.items()):
+                rotulos = f'method="{metodo}",endpoint="{endpoint}"'
+                for limite, contagem in zip(BALDES_DURACAO, baldes):
+                    linhas.append(f'api_request_duration_seconds_bucket{{{rotulos},le="{limite}"}} {float(contagem)}')
+                linhas.append(f'api_request_duration_seconds_bucket{{{rotulos},le="+Inf"}} {float(total)}')
+                linhas.append(f"api_request_duration_seconds_sum{{{rotulos}}} {soma}")
+                linhas.append(f"api_request_duration_seconds_count{{{rotulos}}} {float(total)}")
+        return "\n".join(linhas) + "\n"
+
+
+# ===============================================================
+# ROTAS PADRÃO (/, /health, /health/detailed, /metricas)
+# ===============================================================
+def _servicos():
+    return {
+        "mysql": {"status": "connected", "host": "localhost", "database": "sintetico"},
+        "database_manager": {"status": "ok"},
+    }
+
+
+def raiz(servidor, query):
+    return {"service": "Time Series Analytics API (servidor local)", "version": VERSAO, "status": MODO, "docs": "/docs"}
+
+
+def health(servidor, query):
+    return {
+        "version": VERSAO,
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "mode": MODO,
+        "services": _servicos(),
+    }
+
+
+def health_detailed(servidor, query):
+    dados = servidor.dados
+    tamanho_energia = (len(dados.consumo) + len(dados.fator_potencia)) * 8 / 1e6
+    tamanho_controle = len(dados._cache_dia_temperatura) * 5 * 8 / 1e6
+    return {
+        **health(servidor, query),
+        "duckdb_databases": {
+            "controle": {
+                "path": "memoria://controle",
+                "exists": True,
+                "has_tables": True,
+                "has_data": bool(dados.medidores_temperatura),
+                "size_mb": round(tamanho_controle, 3),
+                "stats": {
+                    "medidores": len(dados.medidores_temperatura),
+                    "leituras": dados.total_leituras_temperatura,
+                    "agregados_em_cache": len(dados._cache_dia_temperatura),
+                },
+            },
+            "energia": {
+                "path": "memoria://energia",
+                "exists": True,
+                "has_tables": True,
+                "has_data": bool(dados.medidores_energia),
+                "size_mb": round(tamanho_energia, 3),
+                "stats": {"medidores": len(dados.medidores_energia), "leituras": dados.total_leituras_energia},
+            },
+        },
+    }
+
+
+def metricas(servidor, query):
+    # A API real devolve o texto Prometheus serializado como string JSON.
+    return servidor.metricas.exposicao()
+
+
+ROTAS_PADRAO = {
+    "/": raiz,
+    "/health": health,
+    "/health/detailed": health_detailed,
+    "/metricas": metricas,
+}
+
+
+# ===============================================================
+# SERVIDOR HTTP
+# ===============================================================
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ServidorLocal/" + VERSAO
+    # Cabeçalhos e corpo saem em escritas separadas; com Nagle ligado a segunda
+    # espera o ACK atrasado do cliente e toda resposta pequena leva ~40 ms.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        inicio = time.perf_counter()
+        partes = urlsplit(self.path)
+        servidor = self.server.servidor_local
+        rota = servidor.rotas.get(partes.path)
+        if rota is None:
+            status, corpo = 404, {"detail": "Not Found"}
+        else:
+            try:
+                status, corpo = 200, rota(servidor.contexto(partes.path), parse_qs(partes.query))
+            except ErroValidacao as erro:
+                status, corpo = 422, {"detail": erro.detalhe}
+            except Exception as erro:  # noqa: BLE001 - vira 500 como na API real
+                status, corpo = 500, {"detail": f"Internal Server Error: {erro}"}
+
+        conteudo = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+        servidor.metricas.registrar("GET", partes.path if rota else "desconhecido", status,
+                                    time.perf_counter() - inicio)
+
+    def log_message(self, *args):
+        pass
+
+
+class ServidorLocal:
+    """Substituto local da API, servindo as mesmas rotas sobre ``DadosSinteticos``.
+
+    Uso::
+
+        with ServidorLocal(dados) as srv:
+            requests.get(srv.url + "/health")
+    """
+
+    def __init__(self, dados=None, host="127.0.0.1", porta=0):
+        self.dados = dados or DadosSinteticos()
+        self.metricas = MetricasServidor()
+        self.rotas = {**ROTAS_PADRAO, **rotas_energia.ROTAS, **rotas_temperatura.ROTAS}
+        self._http = ThreadingHTTPServer((host, porta), _Handler, bind_and_activate=False)
+        self._http.daemon_threads = True
+        self._http.request_queue_size = 128
+        self._http.server_bind()
+        self._http.server_activate()
+        self._http.servidor_local = self
+        self._thread = None
+
+    def contexto(self, caminho):
+        # Rotas padrão recebem o servidor (métricas, dados); as de análise só os dados.
+        return self if caminho in ROTAS_PADRAO else self.dados
+
+    @property
+    def url(self):
+        host, porta = self._http.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def iniciar(self):
+        self._thread = threading.Thread(target=self._http.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def servir_para_sempre(self):
+        self._http.serve_forever()
+
+    def parar(self):
+        self._http.shutdown()
+        self._http.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
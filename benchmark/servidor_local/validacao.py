@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+# ===============================================================
+# VALIDAÇÃO DE PARÂMETROS (formato de erro do FastAPI)
+# ===============================================================
+class ErroValidacao(Exception):
+    """Vira uma resposta 422 com ``{"detail": ...}``, como a API real."""
+
+    def __init__(self, detalhe):
+        super().__init__(detalhe)
+        self.detalhe = detalhe
+
+
+def _erro(nome, valor, tipo, mensagem):
+    return ErroValidacao([{"type": tipo, "loc": ["query", nome], "msg": mensagem, "input": valor}])
+
+
+def _converter(nome, valor, tipo):
+    if tipo is int:
+        try:
+            return int(valor)
+        except ValueError:
+            raise _erro(nome, valor, "int_parsing",
+                        "Input should be a valid integer, unable to parse string as an integer")
+    if tipo is bool:
+        if valor.lower() in ("true", "1", "yes", "on"):
+            return True
+        if valor.lower() in ("false", "0", "no", "off"):
+            return False
+        raise _erro(nome, valor, "bool_parsing", "Input should be a valid boolean")
+    if tipo in (date, datetime):
+        try:
+            convertido = datetime.fromisoformat(valor)
+        except ValueError:
+            raise _erro(nome, valor, f"{tipo.__name__}_parsing", f"Input should be a valid {tipo.__name__}")
+        return convertido.date() if tipo is date else convertido
+    return valor
+
+
+def parametro(query, nome, tipo=str, padrao=None, minimo=None, maximo=None, opcoes=None):
+    """Lê um parâmetro simples da query string (``parse_qs``) aplicando tipo e limites."""
+    valores = query.get(nome)
+    if not valores:
+        return padrao
+    valor = _converter(nome, valores[-1], tipo)
+    if minimo is not None and valor < minimo:
+        raise _erro(nome, valores[-1], "greater_than_equal", f"Input should be greater than or equal to {minimo}")
+    if maximo is not None and valor > maximo:
+        raise _erro(nome, valores[-1], "less_than_equal", f"Input should be less than or equal to {maximo}")
+    if opcoes is not None and valor not in opcoes:
+        esperado = ", ".join(f"'{o}'" for o in opcoes)
+        raise _erro(nome, valores[-1], "enum", f"Input should be {esperado}")
+    return valor
+
+
+def lista_inteiros(query, nome):
+    """Parâmetro repetido (``medidor_ids=1&medidor_ids=2``) convertido para ``list[int]``."""
+    valores = query.get(nome)
+    if not valores:
+        return None
+    return [_converter(nome, v, int) for v in valores]
+
+
+def intervalo_datas(query, tipo=date):
+    """Lê ``data_inicio``/``data_fim`` e rejeita intervalos invertidos."""
+    inicio = parametro(query, "data_inicio", tipo)
+    fim = parametro(query, "data_fim", tipo)
+    if inicio is not None and fim is not None and inicio > fim:
+        raise ErroValidacao("data_inicio deve ser anterior ou igual a data_fim")
+    return inicio, fim
@@ -0,0 +1,72 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from benchmark.configuracao import CONFIG
+from benchmark.servidor_local import ConfiguracaoDados, DadosSinteticos, ServidorLocal
+
+
+# ===============================================================
+# SERVIDOR HTTP MÍNIMO
+# ===============================================================
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if "lento" in self.path:
+            time.sleep(0.1)
+        status = 422 if "invalido" in self.path else 200
+        corpo = b"[]"
+        if "lista" in self.path:
+            corpo = json.dumps([{"medidor_id": i, "valor": i / 10} for i in range(1000)]).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Servidor(ThreadingHTTPServer):
+    request_queue_size = 128  # o padrão (5) descarta conexões dos testes com muitos usuários
+
+
+@pytest.fixture
+def servidor():
+    srv = _Servidor(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+# ===============================================================
+# SERVIDOR LOCAL (DADOS SINTÉTICOS)
+# ===============================================================
+@pytest.fixture(scope="session")
+def _servidor_local_sessao():
+    dados = DadosSinteticos(ConfiguracaoDados(medidores_energia=10, medidores_temperatura=4, dias=5))
+    with ServidorLocal(dados) as srv:
+        yield srv
+
+
+@pytest.fixture
+def servidor_local(_servidor_local_sessao, monkeypatch):
+    """Um ``ServidorLocal`` pequeno, iniciado uma vez por sessão, com o ``CONFIG`` apontado para ele."""
+    monkeypatch.setattr(CONFIG, "base_url", _servidor_local_sessao.url)
+    return _servidor_local_sessao
+
+
+@pytest.fixture(autouse=True)
+def historico_temporario(tmp_path, monkeypatch):
+    """Os testes unitários nunca gravam no histórico real."""
+    caminho = str(tmp_path / "historico.sqlite")
+    monkeypatch.setattr(CONFIG, "historico", caminho)
+    return caminho
@@ -0,0 +1,38 @@
+import csv
+
+import pytest
+
+from benchmark.aquecimento import executar_aquecimento
+from benchmark.catalogo import Cenario
+from benchmark.registro import gravar_aquecimento
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_precisa_de_duas_repeticoes():
+    with pytest.raises(ValueError, match="2 repetições"):
+        executar_aquecimento([Cenario("m", "http://api/x", {}, "X", 200)], repeticoes=1)
+
+
+def test_mede_com_e_sem_cache_e_grava_csv(servidor, tmp_path):
+    cenarios = [
+        Cenario("m", servidor + "/x", {"data_inicio": "2024-01-10"}, "Janela", 200),
+        Cenario("m", servidor + "/invalido", {}, "Inválido", 422),
+    ]
+
+    resultado = executar_aquecimento(cenarios, repeticoes=4)
+
+    assert [c.cenario.descricao for c in resultado.comparacoes] == ["Janela", "Inválido"]
+    for comp in resultado.comparacoes:
+        assert comp.com_cache.sucesso and comp.sem_cache.sucesso
+        assert len(comp.sem_cache.curva_aquecimento()) == 4
+        assert comp.dependencia > 0
+
+    caminho = tmp_path / "aquecimento.csv"
+    gravar_aquecimento(str(caminho), resultado)
+    with open(caminho, newline="", encoding="utf-8") as f:
+        linhas = list(csv.reader(f))
+    assert [(l[0], l[2]) for l in linhas[1:]] == [("Janela", "Não"), ("Janela", "Sim"),
+                                                  ("Inválido", "Não"), ("Inválido", "Sim")]
+    assert len(linhas[1][10].split(";")) == 4
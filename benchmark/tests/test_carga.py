@@ -0,0 +1,40 @@
+from benchmark.carga import executar_carga
+from benchmark.catalogo import Cenario, carregar_catalogo, listar_modulos
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_carga_distribui_rodadas_entre_usuarios(servidor):
+    cenarios = [
+        Cenario("m", f"{servidor}/ok", {}, "OK", 200),
+        Cenario("m", f"{servidor}/invalido", {}, "Inválido", 422),
+    ]
+
+    resultado = executar_carga(cenarios, usuarios=3, rodadas=2)
+
+    assert resultado.total_requisicoes == 3 * 2 * 2
+    assert resultado.total_erros == 0
+    assert {len(r.amostras) for r in resultado.cenarios.values()} == {6}
+    assert resultado.vazao > 0
+
+
+def test_carga_conta_status_inesperado_e_falha_de_conexao(servidor):
+    cenarios = [
+        Cenario("m", f"{servidor}/invalido", {}, "Esperava 200", 200),
+        Cenario("m", "http://127.0.0.1:9/fechado", {}, "Sem servidor", 200),
+    ]
+
+    resultado = executar_carga(cenarios, usuarios=2, rodadas=1, timeout=2)
+
+    assert resultado.total_erros == resultado.total_requisicoes == 4
+
+
+def test_catalogo_carrega_cenarios_dos_modulos_de_teste():
+    assert "energia/test_consumo_temporal.py" in listar_modulos()
+
+    cenarios = carregar_catalogo(["energia/test_consumo_temporal.py"], ["Limit 10"])
+
+    assert len(cenarios) == 1
+    assert cenarios[0].params == {"limit": 10}
+    assert cenarios[0].url.endswith("/analise_energia/consumo-temporal")
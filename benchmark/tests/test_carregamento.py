@@ -0,0 +1,51 @@
+import pytest
+
+from benchmark.carregamento import PAGINAS, Carregamento, Chamada, Pagina, ResultadoCarregamento, executar_carregamento
+from benchmark.registro import gravar_carregamento
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_caminho_critico_e_ganho_potencial():
+    pagina = Pagina("P", [Chamada("A", "/a"), Chamada("B", "/b"), Chamada("C", "/c")])
+    resultado = ResultadoCarregamento(pagina, [
+        Carregamento([(0.0, 0.30, 200), (0.0, 0.10, 200), (0.01, 0.20, 200)]),
+        Carregamento([(0.0, 0.25, 200), (0.0, 0.12, 200), (0.01, 0.30, 200)]),
+        Carregamento([(0.0, 0.40, 200), (0.0, 0.11, 200), (0.01, 0.10, 200)]),
+    ])
+
+    assert resultado.compostos == pytest.approx([0.30, 0.31, 0.40])
+    assert resultado.fracao_critica(0) == pytest.approx(2 / 3)
+    assert resultado.fracao_critica(1) == 0
+    # sem A: 0.21, 0.31, 0.11 -> ganhos 0.09, 0.0, 0.29
+    assert resultado.ganho_potencial(0) == pytest.approx(0.09)
+    assert resultado.ganho_potencial(1) == 0
+    assert resultado.folga(1) == pytest.approx(0.20)
+    assert resultado.cenario_composto().sucesso
+
+
+def test_falha_de_uma_chamada_falha_o_composto():
+    pagina = Pagina("P", [Chamada("A", "/a"), Chamada("B", "/b")])
+    resultado = ResultadoCarregamento(pagina, [Carregamento([(0.0, 0.1, 200), (0.0, 0.2, 500)])])
+
+    assert resultado.cenario_composto().amostras[0].status == 500
+    assert not resultado.cenario_composto().sucesso
+    assert resultado.cenario_chamada(0).sucesso
+
+
+def test_pagina_de_operacoes_contra_servidor_local(servidor_local, tmp_path):
+    pagina = PAGINAS["operacoes"]
+
+    resultado = executar_carregamento(pagina, repeticoes=3)
+
+    assert len(resultado.carregamentos) == 3
+    assert resultado.cenario_composto().sucesso
+    assert sum(resultado.fracao_critica(i) for i in range(len(pagina.chamadas))) == pytest.approx(1.0)
+    assert resultado.paralelismo() >= 1.0
+
+    caminho = tmp_path / "pagina.csv"
+    gravar_carregamento(str(caminho), resultado)
+    linhas = caminho.read_text(encoding="utf-8").splitlines()
+    assert len(linhas) == 2 + len(pagina.chamadas)
+    assert "(composto)" in linhas[1]
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from benchmark.catalogo import Cenario
+from benchmark.cliente_async import (
+    ClienteAsync, ErroHTTP, executar_carga_async, executar_taxa_constante_async, preparar,
+)
+
+
+def _cenario(servidor, caminho, status=200):
+    return Cenario("m", servidor + caminho, {}, caminho, status)
+
+
+async def _servidor_bruto(resposta):
+    """Servidor TCP que responde sempre os mesmos bytes, para exercitar o parser."""
+    async def atender(leitor, escritor):
+        while (await leitor.readuntil(b"\r\n\r\n")):
+            escritor.write(resposta)
+            await escritor.drain()
+
+    async def atender_tolerante(leitor, escritor):
+        try:
+            await atender(leitor, escritor)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            escritor.close()
+
+    srv = await asyncio.start_server(atender_tolerante, "127.0.0.1", 0)
+    return srv, f"http://127.0.0.1:{srv.sockets[0].getsockname()[1]}"
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_preparar_serializa_query_e_cabecalhos():
+    req = preparar("http://api:8000/x?a=1", {"medidor_ids": [1, 2], "b": "c d"})
+
+    assert req.destino == ("http", "api", 8000)
+    linhas = req.dados.decode().split("\r\n")
+    assert linhas[0] == "GET /x?a=1&medidor_ids=1&medidor_ids=2&b=c+d HTTP/1.1"
+    assert "Host: api:8000" in linhas
+    assert req.dados.endswith(b"\r\n\r\n")
+
+
+def test_get_reaproveita_a_conexao(servidor):
+    async def cenario():
+        cliente = ClienteAsync()
+        try:
+            respostas = [await cliente.get(preparar(servidor + "/lista")) for _ in range(3)]
+            return respostas, len(cliente._abertas)
+        finally:
+            await cliente.fechar()
+
+    respostas, conexoes = asyncio.run(cenario())
+
+    assert {status for status, _ in respostas} == {200}
+    assert respostas[0][1] > 10_000
+    assert conexoes == 1
+
+
+def test_get_le_corpo_chunked():
+    resposta = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n")
+
+    async def cenario():
+        srv, url = await _servidor_bruto(resposta)
+        cliente = ClienteAsync()
+        try:
+            return [await cliente.get(preparar(url)) for _ in range(2)]
+        finally:
+            await cliente.fechar()
+            srv.close()
+
+    assert asyncio.run(cenario()) == [(200, 11), (200, 11)]
+
+
+def test_resposta_malformada_levanta_erro():
+    async def cenario():
+        srv, url = await _servidor_bruto(b"lixo\r\n\r\n")
+        cliente = ClienteAsync()
+        try:
+            await cliente.get(preparar(url))
+        finally:
+            await cliente.fechar()
+            srv.close()
+
+    with pytest.raises(ErroHTTP):
+        asyncio.run(cenario())
+
+
+def test_carga_async_mantem_muitas_requisicoes_em_voo(servidor):
+    resultado = executar_carga_async([_cenario(servidor, "/lento")], usuarios=50, rodadas=1)
+
+    assert resultado.total_requisicoes == 50
+    assert resultado.total_erros == 0
+    # 50 requisições de 0,1s em sequência levariam 5s
+    assert resultado.duracao < 2.5
+
+
+def test_carga_async_conta_erros_e_falhas_de_conexao(servidor):
+    cenarios = [_cenario(servidor, "/invalido"), Cenario("m", "http://127.0.0.1:9/x", {}, "Fechada", 200)]
+
+    resultado = executar_carga_async(cenarios, usuarios=2, rodadas=2, timeout=2)
+
+    assert resultado.total_requisicoes == 8
+    assert resultado.total_erros == 8
+    assert {a.status for a in resultado.cenarios["m::Fechada"].amostras} == {None}
+
+
+def test_taxa_constante_async_segue_a_agenda(servidor):
+    resultado = executar_taxa_constante_async([_cenario(servidor, "/rapido")], taxa=100, duracao=0.5)
+
+    assert resultado.total_requisicoes == 50
+    assert resultado.total_erros == 0
+    assert resultado.duracao >= 0.49
+    chave = next(iter(resultado.cenarios))
+    assert len(resultado.servico[chave].amostras) == 50
+    for corrigido, servico in zip(resultado.cenarios[chave].amostras, resultado.servico[chave].amostras):
+        assert corrigido.duracao >= servico.duracao
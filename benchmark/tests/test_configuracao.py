@@ -0,0 +1,37 @@
+import pytest
+
+from benchmark.configuracao import Configuracao, url_do_ambiente
+
+
+def test_perfil_padrao_aponta_para_dev():
+    config = Configuracao(ambiente="dev", base_url=None)
+
+    assert config.url_base == "http://172.16.40.100:8025"
+
+
+def test_variavel_de_ambiente_redefine_o_perfil(monkeypatch):
+    monkeypatch.setenv("BENCH_URL_HOMOLOG", "http://homolog:8025/")
+    config = Configuracao(ambiente="dev", base_url=None)
+    config.selecionar_ambiente("homolog")
+
+    assert config.url_base == "http://homolog:8025"
+
+
+def test_perfil_sem_url_configurada_falha(monkeypatch):
+    monkeypatch.delenv("BENCH_URL_PROD", raising=False)
+
+    with pytest.raises(ValueError, match="BENCH_URL_PROD"):
+        url_do_ambiente("prod")
+
+
+def test_ambiente_desconhecido_falha():
+    with pytest.raises(ValueError, match="desconhecido"):
+        Configuracao().selecionar_ambiente("staging")
+
+
+def test_base_url_explicita_tem_precedencia():
+    config = Configuracao(ambiente="dev", base_url=None)
+    config.selecionar_ambiente("local", "http://127.0.0.1:9999")
+
+    assert config.ambiente == "local"
+    assert config.url_base == "http://127.0.0.1:9999"
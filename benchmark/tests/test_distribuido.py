@@ -0,0 +1,101 @@
+import socketserver
+import threading
+
+import pytest
+
+from benchmark import distribuido
+from benchmark.configuracao import CONFIG
+from benchmark.distribuido import ParcialGerador, ResultadoDistribuido, ResumoCenario, executar_distribuido
+from benchmark.histograma import Histograma
+from benchmark.registro import gravar_distribuido
+
+MODULO = ["default/test_health.py"]
+
+
+@pytest.fixture
+def inicio_imediato(monkeypatch):
+    monkeypatch.setattr(distribuido, "ATRASO_INICIO", 0.2)
+
+
+@pytest.fixture
+def gerador_remoto():
+    srv = socketserver.TCPServer(("127.0.0.1", 0), distribuido._AtenderTarefa)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def _resumo(tempos, status):
+    h = Histograma()
+    for t in tempos:
+        h.registrar(t)
+    return ResumoCenario("Health", {}, 200, "http://x/health", h, status)
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_mescla_equivale_a_medir_tudo_num_processo():
+    a = ParcialGerador("g1", 10.0, 12.0, {"m::Health": _resumo([0.01] * 90, {"200": 90})})
+    b = ParcialGerador("g2", 10.5, 13.0, {"m::Health": _resumo([0.5] * 10, {"200": 8, "500": 2})})
+
+    resultado = ResultadoDistribuido(usuarios=8)
+    for parcial in (a, b):
+        resultado.mesclar(ParcialGerador.de_dict(parcial.para_dict()))
+
+    r = resultado.cenarios["m::Health"]
+    assert r.requisicoes == 100
+    assert r.erros == 2
+    assert r.histograma.percentil(90) == pytest.approx(0.01, rel=1e-3)
+    assert r.histograma.percentil(95) == pytest.approx(0.5, rel=1e-3)
+    assert resultado.duracao == pytest.approx(3.0)
+    assert resultado.vazao == pytest.approx(100 / 3.0)
+
+
+def test_processos_locais_somam_as_requisicoes(servidor_local, inicio_imediato, tmp_path):
+
+    resultado = executar_distribuido(MODULO, processos=2, usuarios=2, rodadas=3)
+
+    assert len(resultado.parciais) == 2
+    assert resultado.total_requisicoes == 2 * 2 * 3
+    assert resultado.total_erros == 0
+
+    caminho = tmp_path / "distribuido.csv"
+    gravar_distribuido(str(caminho), resultado)
+    linhas = caminho.read_text(encoding="utf-8").splitlines()
+    assert len(linhas) == 3 and linhas[-1].startswith("Total,")
+
+
+def test_gerador_remoto_pelo_protocolo_local(servidor_local, inicio_imediato, gerador_remoto):
+
+    resultado = executar_distribuido(MODULO, processos=0, remotos=[gerador_remoto], taxa=40, duracao=0.5,
+                                     cliente="async")
+
+    assert [p.gerador for p in resultado.parciais] == [gerador_remoto]
+    assert resultado.total_requisicoes == 20
+    assert resultado.total_erros == 0
+
+
+def test_falha_do_gerador_remoto_chega_ao_coordenador(servidor_local, inicio_imediato, gerador_remoto):
+
+    with pytest.raises(RuntimeError, match="KeyError"):
+        executar_distribuido(MODULO, processos=0, remotos=[gerador_remoto], rodadas=1, cliente="inexistente")
+
+
+def test_gerador_recusa_modulo_fora_do_catalogo_e_configuracao_desconhecida(gerador_remoto):
+    tarefa = {"modulos": MODULO, "descricoes": None, "configuracao": {"repeticoes": 3}, "usuarios": 1,
+              "rodadas": 1, "duracao": None, "taxa": None, "max_em_voo": 1, "cliente": "requests",
+              "timeout": 5, "inicio": 0.0, "gerador": gerador_remoto}
+    base_url = CONFIG.base_url
+
+    with pytest.raises(RuntimeError, match="fora do catálogo: /tmp/x.py"):
+        distribuido._executar_remoto(gerador_remoto, {**tarefa, "modulos": ["/tmp/x.py"]})
+    with pytest.raises(RuntimeError, match="não permitidos: base_url"):
+        distribuido._executar_remoto(gerador_remoto, {**tarefa, "configuracao": {"base_url": "http://outro"}})
+    assert CONFIG.base_url == base_url
+
+
+def test_gerador_so_escuta_fora_do_loopback_com_expor():
+    with pytest.raises(ValueError, match="expor"):
+        distribuido.servir("0.0.0.0", 0)
@@ -0,0 +1,56 @@
+import math
+import random
+
+import pytest
+
+from benchmark.histograma import Histograma, amostras_minimas
+
+
+def _percentil_exato(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[max(1, math.ceil(p / 100 * len(ordenados))) - 1]
+
+
+def test_percentis_respeitam_precisao_relativa():
+    aleatorio = random.Random(42)
+    valores = [aleatorio.lognormvariate(-1, 1) for _ in range(20000)]
+    h = Histograma()
+    for v in valores:
+        h.registrar(v)
+
+    for p in [50, 90, 95, 99, 99.9]:
+        assert h.percentil(p) == pytest.approx(_percentil_exato(valores, p), rel=2e-3, abs=2e-6)
+    assert h.media == pytest.approx(sum(valores) / len(valores))
+    assert h.minimo == min(valores)
+    assert h.maximo == max(valores)
+
+
+def test_mescla_equivale_a_registrar_tudo_num_histograma():
+    a, b, tudo = Histograma(), Histograma(), Histograma()
+    for i in range(1, 1001):
+        (a if i % 2 else b).registrar(i / 1000)
+        tudo.registrar(i / 1000)
+
+    mesclado = Histograma().mesclar(a).mesclar(b)
+
+    assert mesclado.contagens == tudo.contagens
+    assert mesclado.total == 1000
+    assert mesclado.percentis() == tudo.percentis()
+
+
+def test_serializacao_preserva_conteudo():
+    h = Histograma()
+    for v in [0.001, 0.25, 1.5, 30.0]:
+        h.registrar(v)
+
+    copia = Histograma.de_dict(h.para_dict())
+
+    assert copia.contagens == h.contagens
+    assert copia.percentil(99) == h.percentil(99)
+
+
+def test_histograma_vazio_e_amostras_minimas():
+    assert Histograma().percentil(50) is None
+    assert amostras_minimas(50) == 2
+    assert amostras_minimas(99) == 100
+    assert amostras_minimas(99.9) == 1000
@@ -0,0 +1,54 @@
+from benchmark import CONFIG, RegistroCSV, ResultadoCenario
+from benchmark import historico as modulo_historico
+from benchmark.historico import Historico, nova_execucao, registrar_resultado
+from benchmark.motor import Amostra
+
+
+def _resultado(descricao, duracoes, url="http://api:8025/analise_energia/consumo-temporal"):
+    amostras = [Amostra(i + 1, 200, d) for i, d in enumerate(duracoes)]
+    return ResultadoCenario(descricao, {"limit": 10}, 200, amostras, url=url)
+
+
+def test_execucoes_acumulam_sem_sobrescrever(tmp_path):
+    historico = Historico(str(tmp_path / "h.sqlite"))
+    primeira, segunda = nova_execucao("pytest"), nova_execucao("pytest")
+    for execucao, duracoes in [(primeira, [0.1, 0.2]), (segunda, [0.3])]:
+        historico.registrar_execucao(execucao)
+        historico.gravar(execucao, _resultado("Limit 10", duracoes))
+
+    execucoes = historico.execucoes()
+
+    assert {e.id for e, _ in execucoes} == {primeira.id, segunda.id}
+    assert {e.id: n for e, n in execucoes} == {primeira.id: 2, segunda.id: 1}
+    assert historico.duracoes(primeira.id) == {("/analise_energia/consumo-temporal", "Limit 10"): [0.1, 0.2]}
+    assert [d for _, d in historico.tendencia("/analise_energia/consumo-temporal", "Limit 10")] == [[0.1, 0.2], [0.3]]
+
+
+def test_duracoes_ignoram_status_inesperado(tmp_path):
+    historico = Historico(str(tmp_path / "h.sqlite"))
+    execucao = nova_execucao("pytest")
+    historico.registrar_execucao(execucao)
+    resultado = _resultado("Limit 10", [0.1])
+    resultado.amostras.append(Amostra(2, 500, 9.0))
+    historico.gravar(execucao, resultado)
+
+    assert list(historico.duracoes(execucao.id).values()) == [[0.1]]
+
+
+def test_registro_csv_grava_no_historico_da_execucao_corrente(tmp_path, historico_temporario, monkeypatch):
+    monkeypatch.setattr(modulo_historico, "_execucao", None)
+    registro = RegistroCSV(str(tmp_path / "r.csv"))
+    registro.gravar(_resultado("A", [0.1]))
+    registro.gravar(_resultado("B", [0.2, 0.3], url="http://api:8025/health"))
+
+    execucoes = Historico(historico_temporario).execucoes()
+
+    assert len(execucoes) == 1
+    execucao, amostras = execucoes[0]
+    assert amostras == 3 and execucao.ambiente == CONFIG.ambiente and execucao.modo == "pytest"
+
+
+def test_historico_desligado(tmp_path, monkeypatch):
+    monkeypatch.setattr(CONFIG, "historico", "")
+
+    assert registrar_resultado(_resultado("A", [0.1])) is None
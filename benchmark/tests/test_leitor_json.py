@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from benchmark.leitor_json import LeitorListaJSON
+
+
+def _ler(texto, tamanho):
+    dados = texto.encode("utf-8")
+    leitor = LeitorListaJSON()
+    itens = []
+    for i in range(0, len(dados), tamanho):
+        itens.extend(leitor.alimentar(dados[i:i + tamanho]))
+    itens.extend(leitor.finalizar())
+    return itens, leitor
+
+
+@pytest.mark.parametrize("tamanho", [1, 3, 7, 64, 100000])
+def test_blocos_de_qualquer_tamanho_dao_o_mesmo_resultado(tamanho):
+    lista = [
+        {"periodo": "2025-01-01", "medidor_id": 12, "medidor_descricao": "Câmara fria ⚡", "consumo": 1.5e3},
+        {"medidor_descricao": None, "total": -0.25, "tags": ["a", "]", ","]},
+        123456,
+        1.5,
+        -2.25e-3,
+        6e10,
+        "texto com \"aspas\" e [colchetes]",
+        [],
+    ]
+    texto = json.dumps(lista, ensure_ascii=False, indent=2)
+
+    itens, leitor = _ler(texto, tamanho)
+
+    assert itens == lista
+    assert leitor.itens == len(lista)
+    assert leitor.bytes == len(texto.encode("utf-8"))
+
+
+def test_lista_vazia():
+    assert _ler(" [ ] \n", 1)[0] == []
+
+
+@pytest.mark.parametrize("texto, erro", [
+    ('{"a": 1}', ValueError),
+    ("[1, 2", json.JSONDecodeError),
+    ("[1 2]", json.JSONDecodeError),
+    ("[1, 2,]", json.JSONDecodeError),
+    ("[1] 2", json.JSONDecodeError),
+])
+def test_json_invalido_ou_que_nao_e_lista(texto, erro):
+    with pytest.raises(erro):
+        _ler(texto, 2)
@@ -0,0 +1,36 @@
+import pytest
+
+from benchmark.catalogo import Cenario
+from benchmark.cliente_async import TAXA_POR_CLIENTE
+from benchmark.malha_aberta import executar_taxa_constante
+
+
+def test_taxa_constante_cumpre_a_agenda(servidor):
+    cenarios = [Cenario("m", f"{servidor}/ok", {}, "OK", 200)]
+
+    resultado = executar_taxa_constante(cenarios, taxa=40, duracao=0.5)
+
+    assert resultado.total_requisicoes == 20
+    assert resultado.total_erros == 0
+    assert resultado.atraso_maximo < 0.1
+
+
+def test_latencia_corrigida_inclui_a_fila_quando_o_servidor_atrasa(servidor):
+    # Servidor leva ~0,1s e o cliente só tem uma conexão: a 20 req/s a fila cresce.
+    cenarios = [Cenario("m", f"{servidor}/lento", {}, "Lento", 200)]
+
+    resultado = executar_taxa_constante(cenarios, taxa=20, duracao=0.5, max_em_voo=1)
+
+    corrigido = resultado.cenarios["m::Lento"]
+    servico = resultado.servico["m::Lento"]
+    assert servico.maximo < 0.3
+    assert corrigido.maximo > 0.4
+    assert corrigido.maximo > 2 * servico.maximo
+
+
+@pytest.mark.parametrize("cliente", sorted(TAXA_POR_CLIENTE))
+def test_agenda_sem_requisicoes_e_recusada(servidor, cliente):
+    cenarios = [Cenario("m", f"{servidor}/ok", {}, "OK", 200)]
+
+    with pytest.raises(ValueError, match="nenhuma requisição"):
+        TAXA_POR_CLIENTE[cliente](cenarios, taxa=0.3, duracao=2)
@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+from benchmark.carga import executar_carga
+from benchmark.catalogo import Cenario
+from benchmark.configuracao import CONFIG
+from benchmark.metricas import MetricasServidor, diferenca, instantaneo
+from benchmark.motor import executar_cenario, nova_sessao
+
+EXPOSICAO = """# HELP api_requests_total Total de requisições
+# TYPE api_requests_total counter
+api_requests_total{method="GET",endpoint="/health",status_code="200"} 7.0
+api_requests_total{method="GET",endpoint="/health",status_code="500"} 1.0
+# TYPE api_request_duration_seconds histogram
+api_request_duration_seconds_bucket{method="GET",endpoint="/health",le="0.1"} 4.0
+api_request_duration_seconds_bucket{method="GET",endpoint="/health",le="0.5"} 8.0
+api_request_duration_seconds_bucket{method="GET",endpoint="/health",le="+Inf"} 8.0
+api_request_duration_seconds_sum{method="GET",endpoint="/health"} 1.2
+api_request_duration_seconds_count{method="GET",endpoint="/health"} 8.0
+"""
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_instantaneo_agrupa_contadores_e_baldes_por_endpoint():
+    estado = instantaneo(EXPOSICAO)["/health"]
+
+    assert estado.requisicoes == {"200": 7.0, "500": 1.0}
+    assert estado.baldes == {0.1: 4.0, 0.5: 8.0, math.inf: 8.0}
+    assert estado.contagem == 8.0
+
+
+def test_quantil_interpola_dentro_do_balde():
+    m = MetricasServidor("/x", {"200": 10}, {0.1: 5.0, 0.5: 10.0, math.inf: 10.0}, soma=1.5, contagem=10.0)
+
+    assert m.quantil(50) == pytest.approx(0.1)
+    assert m.quantil(75) == pytest.approx(0.3)
+    assert m.media == pytest.approx(0.15)
+
+
+def test_diferenca_subtrai_a_coleta_anterior():
+    antes = instantaneo(EXPOSICAO)
+    depois = instantaneo(EXPOSICAO.replace("7.0", "10.0").replace("} 8.0", "} 11.0"))
+
+    m = diferenca(antes, depois, "/health")
+
+    assert m.requisicoes == 3
+    assert m.contagem == 3.0
+    assert diferenca(None, depois, "/health") is None
+
+
+def test_cenario_anexa_metricas_do_servidor(servidor_local, monkeypatch):
+    monkeypatch.setattr(CONFIG, "metricas_servidor", True)
+
+    resultado = executar_cenario(nova_sessao(), servidor_local.url + "/health", {}, "Health", 200, repeticoes=4)
+
+    assert resultado.servidor.endpoint == "/health"
+    assert resultado.servidor.requisicoes == 4
+    assert resultado.servidor.quantil(50) is not None
+
+
+def test_carga_coleta_metricas_periodicamente(servidor_local):
+    cenarios = [Cenario("m", servidor_local.url + "/health", {}, "Health", 200)]
+
+    resultado = executar_carga(cenarios, usuarios=2, rodadas=5, intervalo_metricas=0.05)
+
+    assert resultado.servidor["/health"].requisicoes == 10
+    assert all(m is not None for _, m in resultado.serie_servidor["/health"])
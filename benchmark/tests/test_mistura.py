@@ -0,0 +1,85 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from benchmark.malha_aberta import ResultadoTaxaConstante
+from benchmark.mistura import (
+    PENSAR_PADRAO, Escolha, Fluxo, JanelaDatas, ListaMedidores, ModeloTrafego, executar_mistura,
+)
+from benchmark.registro import gravar_taxa_constante
+
+PAINEL = "energia/test_dashboard_operacional.py"
+CONSUMO = "energia/test_consumo_temporal.py"
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_variacoes_sorteiam_parametros_validos():
+    sorteio = random.Random(3)
+    hoje = date.today()
+
+    janela = JanelaDatas((1, 30), (1, 1)).sortear(sorteio, [])
+    ids = ListaMedidores((4,), (1,)).sortear(sorteio, [7, 8, 9])["medidor_ids"]
+    top = Escolha("top_n", (5, 10)).sortear(sorteio, [])
+
+    assert janela["data_fim"] == hoje.isoformat()
+    assert janela["data_inicio"] in {hoje.isoformat(), (hoje - timedelta(days=29)).isoformat()}
+    assert sorted(ids) == [7, 8, 9]
+    assert top["top_n"] in (5, 10)
+
+
+def test_cenario_inexistente_no_catalogo():
+    modelo = ModeloTrafego([Fluxo(PAINEL, "Não existe", 1.0)])
+
+    with pytest.raises(ValueError, match="Não existe"):
+        executar_mistura(modelo, duracao=0.1)
+
+
+def test_malha_aberta_segue_as_proporcoes_do_modelo(servidor_local):
+    modelo = ModeloTrafego([
+        Fluxo(PAINEL, "Sem parâmetros", 30.0, nome="Painel"),
+        Fluxo(CONSUMO, "Intervalo 3 dias", 10.0, (JanelaDatas(), ListaMedidores()), nome="Consumo"),
+    ])
+
+    resultado = executar_mistura(modelo, duracao=2.0, semente=7)
+
+    assert isinstance(resultado, ResultadoTaxaConstante)
+    assert resultado.total_erros == 0
+    painel = len(resultado.cenarios["Painel"].amostras)
+    consumo = len(resultado.cenarios["Consumo"].amostras)
+    assert 40 <= painel + consumo <= 120  # Poisson de média 80
+    assert painel > 1.5 * consumo
+    assert resultado.cenarios["Consumo"].params["medidor_ids"] == "sorteado"
+
+
+def test_laco_fechado_com_tempo_de_pensar(servidor_local):
+    modelo = ModeloTrafego([Fluxo(PAINEL, "Sem parâmetros", 1.0)], pensar=0.2)
+
+    resultado = executar_mistura(modelo, duracao=1.0, usuarios=3, semente=1)
+
+    assert resultado.usuarios == 3
+    assert resultado.total_erros == 0
+    # 3 usuários pensando 0,2s em média fazem bem menos que um laço sem pausa
+    assert 3 <= resultado.total_requisicoes <= 40
+
+
+def test_malha_aberta_sem_chegadas_ainda_grava_o_resultado(servidor_local, tmp_path):
+    modelo = ModeloTrafego([Fluxo(PAINEL, "Sem parâmetros", 1.0)])
+
+    resultado = executar_mistura(modelo, duracao=0.05, escala=0.01, semente=1)
+    gravar_taxa_constante(tmp_path / "mistura.csv", resultado)
+
+    assert resultado.total_requisicoes == 0
+    assert resultado.cenarios == {}
+    total = (tmp_path / "mistura.csv").read_text(encoding="utf-8").splitlines()[-1].split(",")
+    assert total[0] == "Total" and total[3] == "0" and total[6:9] == ["", "", ""]
+
+
+def test_laco_fechado_mais_curto_que_o_tempo_de_pensar_mede_todos_os_usuarios(servidor_local):
+    modelo = ModeloTrafego([Fluxo(PAINEL, "Sem parâmetros", 1.0)], pensar=PENSAR_PADRAO)
+
+    resultado = executar_mistura(modelo, duracao=0.5, usuarios=4, semente=2)
+
+    assert resultado.total_requisicoes >= 4
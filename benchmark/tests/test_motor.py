@@ -0,0 +1,178 @@
+import csv
+
+import pytest
+
+from benchmark import CONFIG, RegistroCSV, ResultadoCenario, executar_cenario
+from benchmark.motor import PARAMETRO_QUEBRA_CACHE, REPETICOES_MINIMAS, SUFIXO_SEM_CACHE, Amostra, nova_sessao
+
+
+# ===============================================================
+# SESSÃO FALSA (sem rede)
+# ===============================================================
+class RespostaFalsa:
+    content = b"[]"
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+
+class SessaoFalsa:
+    def __init__(self, status):
+        self.status = list(status)
+        self.chamadas = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.chamadas.append((url, params, timeout))
+        return RespostaFalsa(self.status.pop(0))
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_executa_todas_as_repeticoes():
+    sessao = SessaoFalsa([200] * 3)
+    validados = []
+
+    resultado = executar_cenario(sessao, "http://api/x", {"limit": 10}, "Limit 10", 200,
+                                 validar=validados.append, repeticoes=3, timeout=5)
+
+    assert len(resultado.amostras) == 3
+    assert len(validados) == 3
+    assert resultado.sucesso
+    assert resultado.status_real == 200
+    assert all(c == ("http://api/x", {"limit": 10}, 5) for c in sessao.chamadas)
+
+
+def test_interrompe_no_primeiro_status_inesperado():
+    sessao = SessaoFalsa([200, 422, 200])
+    validados = []
+
+    resultado = executar_cenario(sessao, "http://api/x", {}, "Falha", 200,
+                                 validar=validados.append, repeticoes=3)
+
+    assert len(resultado.amostras) == 2
+    assert len(validados) == 1
+    assert not resultado.sucesso
+    assert resultado.status_real == 422
+
+
+def test_nao_valida_respostas_de_erro_esperadas():
+    sessao = SessaoFalsa([422, 422])
+    validados = []
+
+    resultado = executar_cenario(sessao, "http://api/x", {}, "Inválido", 422,
+                                 validar=validados.append, repeticoes=2)
+
+    assert resultado.sucesso
+    assert validados == []
+
+
+def test_frio_regime_e_curva_de_aquecimento():
+    tempos = [0.5, 0.3, 0.12, 0.1, 0.1, 0.11]
+    resultado = ResultadoCenario("A", {}, 200, [Amostra(i + 1, 200, t) for i, t in enumerate(tempos)])
+
+    assert resultado.frio == 0.5
+    assert resultado.regime == pytest.approx(0.1)  # mediana da segunda metade
+    assert resultado.aquecimento == 3  # 0.12 ainda passa de 10% acima do regime
+    assert resultado.curva_aquecimento()[:2] == pytest.approx([5.0, 3.0])
+    assert ResultadoCenario("B", {}, 200, [Amostra(1, 200, 0.1)]).regime is None
+
+
+def test_quebra_de_cache_perturba_os_parametros_a_cada_tentativa():
+    sessao = SessaoFalsa([200] * 2)
+    params = {"data_inicio": "2024-01-10", "data_fim": "2024-01-20", "limit": 5}
+
+    resultado = executar_cenario(sessao, "http://api/x", params, "Janela", 200, repeticoes=2, quebrar_cache=True)
+
+    enviados = [p for _, p, _ in sessao.chamadas]
+    assert [(p["data_inicio"], p["data_fim"]) for p in enviados] == [("2024-01-09", "2024-01-19"),
+                                                                     ("2024-01-08", "2024-01-18")]
+    assert all(p["limit"] == 5 for p in enviados)
+    assert enviados[0][PARAMETRO_QUEBRA_CACHE] != enviados[1][PARAMETRO_QUEBRA_CACHE]
+    assert resultado.params == params and PARAMETRO_QUEBRA_CACHE not in params
+    assert resultado.descricao == f"Janela {SUFIXO_SEM_CACHE}"
+
+
+def test_repeticoes_adaptativas_param_quando_o_intervalo_estreita(servidor, monkeypatch):
+    monkeypatch.setattr(CONFIG, "precisao", 0.5)
+    monkeypatch.setattr(CONFIG, "orcamento", 30.0)
+
+    resultado = executar_cenario(nova_sessao(), servidor + "/lento", {}, "Lento", 200)
+
+    # 0,1s de espera no servidor: a mediana estabiliza logo após o mínimo
+    assert REPETICOES_MINIMAS <= len(resultado.amostras) <= 20
+    assert resultado.precisao() <= 0.5
+
+
+def test_repeticoes_adaptativas_respeitam_o_orcamento(servidor, monkeypatch):
+    monkeypatch.setattr(CONFIG, "precisao", 1e-9)
+    monkeypatch.setattr(CONFIG, "orcamento", 0.3)
+
+    resultado = executar_cenario(nova_sessao(), servidor + "/lento", {}, "Lento", 200)
+
+    assert REPETICOES_MINIMAS <= len(resultado.amostras) <= 5
+
+
+def test_repeticoes_explicitas_desligam_o_modo_adaptativo(monkeypatch):
+    monkeypatch.setattr(CONFIG, "precisao", 0.5)
+
+    resultado = executar_cenario(SessaoFalsa([200] * 3), "http://api/x", {}, "Fixo", 200, repeticoes=3)
+
+    assert len(resultado.amostras) == 3
+
+
+def test_registro_csv_recria_arquivo_e_anexa_linhas(tmp_path):
+    caminho = tmp_path / "resultado.csv"
+    caminho.write_text("lixo de uma execução anterior\n", encoding="utf-8")
+    registro = RegistroCSV(str(caminho))
+
+    for descricao in ["A", "B"]:
+        resultado = ResultadoCenario(descricao, {}, 200, [Amostra(1, 200, 0.1), Amostra(2, 200, 0.3)])
+        registro.gravar(resultado)
+
+    with open(caminho, newline="", encoding="utf-8") as f:
+        linhas = list(csv.reader(f))
+
+    assert linhas[0][0] == "Cenário"
+    assert [l[0] for l in linhas[1:]] == ["A", "B"]
+    assert linhas[1][4:9] == ["0.2", "0.1", "0.3", "OK", "2"]
+    assert linhas[1][9] == "0.1"  # p50
+    assert linhas[1][10:14] == ["", "", "", ""]  # poucas amostras para p90+
+    assert linhas[0][-1] == "Ambiente" and linhas[1][-1] == CONFIG.ambiente
+
+
+def test_leitura_em_fluxo_valida_cada_item(servidor):
+    itens = []
+
+    resultado = executar_cenario(nova_sessao(), servidor + "/lista", {}, "Lista", 200,
+                                 validar_item=itens.append, repeticoes=2)
+
+    assert resultado.sucesso
+    assert len(itens) == 2000 and itens[-1] == {"medidor_id": 999, "valor": 99.9}
+    assert all(a.decodificacao > 0 for a in resultado.amostras)
+
+
+def test_leitura_em_fluxo_propaga_falha_de_validacao(servidor):
+    def validar_item(item):
+        assert item["medidor_id"] < 500, "medidor fora da faixa"
+
+    with pytest.raises(AssertionError, match="fora da faixa"):
+        executar_cenario(nova_sessao(), servidor + "/lista", {}, "Lista", 200,
+                         validar_item=validar_item, repeticoes=1)
+
+
+def test_amostra_separa_fases_da_requisicao(servidor):
+    sessao = nova_sessao()
+
+    resultado = executar_cenario(sessao, servidor + "/lento/lista", {}, "Lenta", 200,
+                                 validar=lambda resp: resp.json(), repeticoes=2)
+
+    primeira, segunda = resultado.amostras
+    assert primeira.conexao > 0 and segunda.conexao == 0  # keep-alive reaproveita a conexão
+    assert primeira.ttfb >= 0.1
+    assert primeira.duracao == pytest.approx(primeira.conexao + primeira.ttfb + primeira.transferencia)
+    assert primeira.decodificacao > 0
+    assert primeira.bytes == segunda.bytes > 20000
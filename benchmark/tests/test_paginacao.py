@@ -0,0 +1,54 @@
+import pytest
+
+from benchmark.configuracao import CONFIG
+from benchmark.paginacao import paginar
+from benchmark.servidor_local import ConfiguracaoDados, DadosSinteticos, ServidorLocal
+
+
+@pytest.fixture(scope="module")
+def local():
+    dados = DadosSinteticos(ConfiguracaoDados(medidores_energia=5, medidores_temperatura=3, dias=2))
+    with ServidorLocal(dados) as srv:
+        yield srv, dados
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+@pytest.mark.parametrize("paralelismo", [1, 4])
+def test_paginacao_percorre_o_conjunto_inteiro(local, monkeypatch, paralelismo):
+    srv, dados = local
+    monkeypatch.setattr(CONFIG, "base_url", srv.url)
+
+    resultado = paginar(limit=100, paralelismo=paralelismo)
+
+    assert resultado.completa
+    assert resultado.total_linhas == 3 * dados.total_posicoes
+    assert [p.offset for p in resultado.paginas] == sorted(p.offset for p in resultado.paginas)
+    assert not resultado.erros
+    assert resultado.faixas()[0][0] == 0
+
+
+def test_paginacao_para_em_max_paginas_e_no_primeiro_erro(local, monkeypatch):
+    srv, _ = local
+    monkeypatch.setattr(CONFIG, "base_url", srv.url)
+
+    parcial = paginar(limit=10, max_paginas=3)
+    invalida = paginar(params={"tipo_sensor": "INVALIDO"}, limit=10)
+
+    assert len(parcial.paginas) == 3 and not parcial.completa
+    assert len(invalida.paginas) == 1 and invalida.erros
+
+
+def test_timeout_encerra_a_varredura_sem_perder_o_resultado(servidor, monkeypatch):
+    monkeypatch.setattr(CONFIG, "base_url", servidor)
+
+    resultado = paginar("/lento", limit=10, paralelismo=2, timeout=0.02)
+
+    assert resultado.paginas and all(p.amostra.status is None for p in resultado.paginas)
+    assert resultado.erros and not resultado.completa
+
+
+def test_paralelismo_invalido():
+    with pytest.raises(ValueError, match="paralelismo"):
+        paginar(paralelismo=0)
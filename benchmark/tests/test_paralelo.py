@@ -0,0 +1,49 @@
+import csv
+import textwrap
+
+from benchmark.catalogo import carregar_cenarios
+from benchmark.historico import Historico
+from benchmark.paralelo import executar_paralelo
+
+
+def _modulo(tmp_path, servidor, nome, cenarios):
+    caminho = tmp_path / f"test_{nome}.py"
+    caminho.write_text(textwrap.dedent(f"""
+        BASE_URL = "{servidor}/{nome}"
+        ARQUIVO_CSV = r"{tmp_path / (nome + '.csv')}"
+        LIMITE_TEMPO_MEDIO = 30
+        cenarios = {cenarios!r}
+
+        def validar_item(item):
+            assert item["medidor_id"] < 1000
+    """))
+    return str(caminho)
+
+
+def test_coordenador_reune_resultados_na_ordem_do_catalogo(tmp_path, servidor, historico_temporario):
+    lista = _modulo(tmp_path, servidor, "lista", [({}, "A", 200), ({"x": 1}, "B", 200)])
+    erros = _modulo(tmp_path, servidor, "lento_invalido", [({}, "Erro esperado", 422), ({}, "Erro inesperado", 200)])
+    cenarios = carregar_cenarios(lista) + carregar_cenarios(erros)
+
+    resultado = executar_paralelo(cenarios, trabalhadores=3, repeticoes=2, timeout=5)
+
+    assert [c.descricao for c, _, _ in resultado.resultados] == ["A", "B", "Erro esperado", "Erro inesperado"]
+    assert [c.descricao for c, _, _ in resultado.falhas] == ["Erro inesperado"]
+    with open(tmp_path / "lista.csv", encoding="utf-8") as f:
+        assert [linha[0] for linha in csv.reader(f)][1:] == ["A", "B"]
+
+    execucoes = Historico(historico_temporario).execucoes()
+    assert len(execucoes) == 1
+    execucao, amostras = execucoes[0]
+    assert execucao.modo == "paralelo" and amostras == 2 + 2 + 2 + 1
+
+
+def test_falha_de_validacao_nao_derruba_o_coordenador(tmp_path, servidor):
+    modulo = _modulo(tmp_path, servidor, "lista", [({}, "A", 200)])
+    caminho = tmp_path / "test_lista.py"
+    caminho.write_text(caminho.read_text().replace("< 1000", "< 10"))
+
+    resultado = executar_paralelo(carregar_cenarios(modulo), trabalhadores=1, repeticoes=1, timeout=5)
+
+    (cenario, r, erro), = resultado.falhas
+    assert r is None and "AssertionError" in erro
@@ -0,0 +1,71 @@
+import math
+
+import pytest
+
+from benchmark.prometheus import LeitorExposicao, analisar
+
+EXPOSICAO = r"""# HELP process_start_time_seconds Start time of the process.
+# TYPE process_start_time_seconds gauge
+process_start_time_seconds 1.7e+09
+# HELP api_requests_total Total de requisições
+# TYPE api_requests_total counter
+api_requests_total{method="GET",endpoint="/health",status_code="200"} 7.0
+# TYPE api_request_duration_seconds histogram
+api_request_duration_seconds_bucket{method="GET",endpoint="/health",le="0.1"} 4.0
+api_request_duration_seconds_bucket{method="GET",endpoint="/health",le="+Inf"} 8.0 1700000000000
+api_request_duration_seconds_sum{method="GET",endpoint="/health"} 1.2
+api_request_duration_seconds_count{method="GET",endpoint="/health"} 8.0
+sem_tipo{caminho="a \"b\" c\\d\n", vazio="",} NaN
+"""
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_amostras_recebem_familia_e_tipo():
+    leitor = LeitorExposicao()
+    amostras = analisar(EXPOSICAO, leitor)
+
+    assert [(a.familia, a.tipo) for a in amostras[:3]] == [
+        ("process_start_time_seconds", "gauge"),
+        ("api_requests_total", "counter"),
+        ("api_request_duration_seconds", "histogram"),
+    ]
+    assert amostras[0].valor == 1.7e9
+    assert leitor.tipos["api_request_duration_seconds"] == "histogram"
+    assert leitor.ajudas["api_requests_total"] == "Total de requisições"
+
+
+def test_baldes_do_histograma_com_rotulos_e_carimbo_de_tempo():
+    baldes = [a for a in analisar(EXPOSICAO) if a.balde is not None]
+
+    assert [a.balde for a in baldes] == [0.1, math.inf]
+    assert baldes[1].valor == 8.0
+    assert baldes[1].rotulos == {"method": "GET", "endpoint": "/health", "le": "+Inf"}
+
+
+def test_rotulos_com_escapes_e_serie_sem_tipo():
+    ultima = analisar(EXPOSICAO)[-1]
+
+    assert ultima.tipo == "untyped"
+    assert ultima.rotulos == {"caminho": 'a "b" c\\d\n', "vazio": ""}
+    assert math.isnan(ultima.valor)
+
+
+def test_caminho_rapido_aceita_virgula_final_e_chaves_no_valor():
+    amostra = analisar('metrica{a="x,y}",b="",} 3 1700000000000')[0]
+
+    assert amostra.rotulos == {"a": "x,y}", "b": ""}
+    assert amostra.valor == 3.0
+
+
+@pytest.mark.parametrize("linha", [
+    "sem_valor",
+    'metrica{rotulo="x} 1',
+    'metrica{rotulo="x" outro="y"} 1',
+    "metrica abc",
+    "# TYPE metrica desconhecido",
+])
+def test_linha_malformada_levanta_valueerror(linha):
+    with pytest.raises(ValueError, match="Linha 1"):
+        analisar(linha)
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from benchmark import ResultadoCenario
+from benchmark.historico import Historico, nova_execucao
+from benchmark.motor import Amostra
+from benchmark.regressao import comparar_amostras, comparar_com_referencia, intervalo_quantil, mann_whitney
+
+
+def _amostras(mediana, n=30, ruido=0.1, semente=1):
+    rng = random.Random(semente)
+    return [mediana * (1 + rng.uniform(-ruido, ruido)) for _ in range(n)]
+
+
+def test_mann_whitney_distingue_direcao():
+    p_maior, p_menor = mann_whitney(_amostras(0.1), _amostras(0.2, semente=2))
+
+    assert p_maior < 0.001
+    assert p_menor > 0.99
+
+
+def test_mann_whitney_com_valores_todos_iguais():
+    assert mann_whitney([0.1] * 10, [0.1] * 10) == (1.0, 1.0)
+
+
+def test_intervalo_quantil_por_estatisticas_de_ordem():
+    valores = list(range(1, 101))
+
+    inferior, superior = intervalo_quantil(valores, 50)
+
+    assert inferior < 50 < superior
+    assert superior - inferior <= 25
+    assert intervalo_quantil(valores[:5], 50) is None  # 5 amostras não dão 95% de confiança
+    assert intervalo_quantil(valores[:71], 95) is None
+    assert intervalo_quantil(valores[:72], 95) is not None
+
+
+def test_regressao_significativa_acima_do_limiar():
+    c = comparar_amostras("/x", "A", _amostras(0.1), _amostras(0.2, semente=2))
+
+    assert c.regressao
+    assert c.razao == pytest.approx(2, rel=0.15)
+    assert c.intervalo[0] > 1.5
+
+
+@pytest.mark.parametrize("mediana_atual, limiar, veredito", [
+    (0.11, 1.2, "estável"),  # significativa, mas abaixo do limiar
+    (0.2, 3.0, "estável"),  # limiar próprio do endpoint mais folgado
+    (0.05, 1.2, "melhora"),
+])
+def test_veredito_respeita_limiar(mediana_atual, limiar, veredito):
+    c = comparar_amostras("/x", "A", _amostras(0.1, ruido=0.01), _amostras(mediana_atual, ruido=0.01, semente=2),
+                          limiar=limiar)
+
+    assert c.veredito == veredito
+
+
+def test_diferenca_absoluta_minima_evita_falso_alarme():
+    c = comparar_amostras("/health", "A", _amostras(0.001, ruido=0.01), _amostras(0.003, ruido=0.01, semente=2))
+
+    assert c.veredito == "estável"
+
+
+def test_poucas_amostras_e_insuficiente():
+    assert comparar_amostras("/x", "A", [0.1] * 3, [0.5] * 3).veredito == "insuficiente"
+
+
+def test_compara_com_linha_de_base_marcada(tmp_path):
+    historico = Historico(str(tmp_path / "h.sqlite"))
+    ids = []
+    for mediana in (0.1, 0.1, 0.3):
+        execucao = nova_execucao("pytest")
+        historico.registrar_execucao(execucao)
+        amostras = [Amostra(i, 200, d) for i, d in enumerate(_amostras(mediana, semente=len(ids)))]
+        historico.gravar(execucao, ResultadoCenario("A", {}, 200, amostras, url="http://api/x"))
+        ids.append(execucao.id)
+    historico.marcar_base(ids[0])
+
+    id_base, comparacoes = comparar_com_referencia(historico, ids[2], "base", {"/x": 1.5})
+
+    assert id_base == ids[0]
+    assert [c.veredito for c in comparacoes] == ["regressão"]
+    assert comparacoes[0].limiar == 1.5
+    assert comparar_com_referencia(historico, ids[1], "anterior")[0] == ids[0]
+    with pytest.raises(ValueError):
+        comparar_com_referencia(historico, ids[0], "anterior")
+
+
+def test_referencia_de_outro_modo_nao_e_comparada(tmp_path):
+    historico = Historico(str(tmp_path / "h.sqlite"))
+    ids = []
+    for modo in ("pytest", "carga", "pytest", "carga"):
+        execucao = nova_execucao(modo)
+        historico.registrar_execucao(execucao)
+        amostras = [Amostra(i, 200, d) for i, d in enumerate(_amostras(0.1, semente=len(ids)))]
+        historico.gravar(execucao, ResultadoCenario("A", {}, 200, amostras, url="http://api/x"))
+        ids.append(execucao.id)
+    historico.marcar_base(ids[0])
+
+    assert historico.anterior(ids[3]) == ids[1]
+    assert comparar_com_referencia(historico, ids[2], "anterior")[0] == ids[0]
+    assert historico.execucoes(modo="carga", limite=1)[0][0].id == ids[3]
+    with pytest.raises(ValueError, match="modo 'pytest'"):
+        comparar_com_referencia(historico, ids[3], "base")
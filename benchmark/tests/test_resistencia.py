@@ -0,0 +1,100 @@
+import pytest
+
+from benchmark.catalogo import Cenario
+from benchmark.cli import _peso, _pesos, _segundos, main
+from benchmark.registro import gravar_resistencia
+from benchmark.resistencia import ResultadoResistencia, executar_resistencia, valores_saude
+
+
+def _resultado_com_saude(valores):
+    resultado = ResultadoResistencia(usuarios=1, duracao=float(len(valores) * 10))
+    resultado.saude = [(i * 10.0, {"energia.size_mb": v}) for i, v in enumerate(valores)]
+    return resultado
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_valores_saude_extrai_tamanho_e_estatisticas_numericas():
+    dados = {"duckdb_databases": {
+        "energia": {"size_mb": 12.5, "exists": True, "stats": {"leituras": 100, "ativo": True, "nome": "x"}},
+        "controle": {"size_mb": 1, "stats": None},
+    }}
+
+    assert valores_saude(dados) == {"energia.size_mb": 12.5, "energia.stats.leituras": 100.0,
+                                    "controle.size_mb": 1.0}
+
+
+def test_crescimento_consistente_e_sinalizado():
+    resultado = _resultado_com_saude([100 + 5 * i for i in range(20)])
+
+    (deriva,) = resultado.derivas()
+
+    assert deriva.serie == "energia.size_mb"
+    assert deriva.variacao == pytest.approx((195 - 110) / 152.5, rel=0.01)
+    assert deriva.sinalizada
+
+
+def test_serie_estavel_ou_ruidosa_nao_e_sinalizada():
+    estavel = _resultado_com_saude([100.0] * 20)
+    ruidosa = _resultado_com_saude([100, 180, 95, 170, 105, 160, 98, 175, 102, 165] * 2)
+
+    assert not any(d.sinalizada for d in estavel.derivas())
+    assert not any(d.sinalizada for d in ruidosa.derivas())
+
+
+def test_aquecimento_fica_fora_da_tendencia():
+    # cache enchendo no primeiro décimo e estável depois
+    resultado = _resultado_com_saude([0, 50] + [100.0] * 18)
+
+    assert not any(d.sinalizada for d in resultado.derivas())
+
+
+def test_pesos_e_duracao_da_linha_de_comando():
+    cenarios = [Cenario("energia/a.py", "", {}, "X", 200), Cenario("default/b.py", "", {}, "Y", 200)]
+
+    assert _pesos(cenarios, [_peso("energia=3"), _peso("Y=0.5")]) == [3.0, 0.5]
+    assert _pesos(cenarios, None) == [1.0, 1.0]
+    assert _segundos("30m") == 1800 and _segundos("2h") == 7200 and _segundos("45") == 45
+
+
+def test_pesos_negativos_sao_recusados():
+    cenarios = [Cenario("m", "http://api/a", {}, "A", 200), Cenario("m", "http://api/b", {}, "B", 200)]
+
+    with pytest.raises(ValueError, match="não negativo"):
+        executar_resistencia(cenarios, duracao=1.0, pesos=[2, -1])
+
+
+@pytest.mark.parametrize("argumentos", [
+    ["resistencia", "--peso", "energia"],
+    ["resistencia", "--peso", "energia=muito"],
+    ["resistencia", "--peso", "energia=-1"],
+    ["comparar", "--limiar", "/health=0"],
+])
+def test_pares_invalidos_sao_erros_de_argumento(argumentos, capsys):
+    with pytest.raises(SystemExit) as saida:
+        main(argumentos)
+
+    assert saida.value.code == 2
+    assert "argument --" in capsys.readouterr().err
+
+
+def test_execucao_curta_contra_servidor_local(servidor_local, tmp_path):
+    cenarios = [
+        Cenario("m", servidor_local.url + "/health", {}, "Health", 200),
+        Cenario("m", servidor_local.url + "/", {}, "Raiz", 200),
+    ]
+
+    resultado = executar_resistencia(cenarios, duracao=1.0, pesos=[1, 0], usuarios=2, intervalo_balde=0.25,
+                                     intervalo_amostragem=0.2, semente=1)
+
+    assert set(resultado.cenarios) == {"m::Health"}
+    assert resultado.total_erros == 0
+    assert len(resultado.baldes) >= 4
+    assert resultado.saude and "energia.size_mb" in resultado.saude[0][1]
+    assert resultado.serie_servidor["/health"]
+
+    caminho = tmp_path / "resistencia.csv"
+    gravar_resistencia(str(caminho), resultado)
+    assert (tmp_path / "resistencia_deriva.csv").exists()
+    assert "energia.size_mb" in (tmp_path / "resistencia_saude.csv").read_text(encoding="utf-8")
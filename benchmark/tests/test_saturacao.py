@@ -0,0 +1,74 @@
+import pytest
+
+from benchmark.carga import ResultadoCarga
+from benchmark.catalogo import Cenario
+from benchmark.motor import Amostra, ResultadoCenario
+from benchmark.registro import gravar_saturacao
+from benchmark.saturacao import Degrau, ResultadoSaturacao, executar_saturacao
+
+
+def _degrau(usuarios, requisicoes, latencia, duracao=10.0, falhas=0, latencia_falha=0.001):
+    r = ResultadoCenario("x", {}, 200)
+    r.amostras = [Amostra(i, 200, latencia) for i in range(requisicoes)]
+    r.amostras += [Amostra(requisicoes + i, 503, latencia_falha) for i in range(falhas)]
+    return Degrau(usuarios, ResultadoCarga(usuarios, duracao, {"m::x": r}))
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_joelho_quando_a_vazao_para_de_subir():
+    resultado = ResultadoSaturacao(["m::x"], 10.0, [
+        _degrau(1, 100, 0.1), _degrau(2, 200, 0.1), _degrau(4, 380, 0.1), _degrau(8, 400, 0.2),
+    ])
+
+    indice, motivo = resultado.joelho()
+
+    assert indice == 2
+    assert "vazão" in motivo
+    assert resultado.vazao_maxima == 40.0
+
+
+def test_joelho_quando_o_p99_dispara():
+    resultado = ResultadoSaturacao(["m::x"], 10.0, [
+        _degrau(1, 100, 0.1), _degrau(2, 200, 0.1), _degrau(4, 400, 0.5),
+    ])
+
+    indice, motivo = resultado.joelho()
+
+    assert indice == 1
+    assert "p99" in motivo
+
+
+def test_sem_joelho_enquanto_a_vazao_escala():
+    resultado = ResultadoSaturacao(["m::x"], 10.0, [_degrau(1, 100, 0.1), _degrau(2, 200, 0.1)])
+
+    assert resultado.joelho() == (None, None)
+
+
+def test_falhas_rapidas_nao_contam_como_vazao_nem_latencia():
+    resultado = ResultadoSaturacao(["m::x"], 10.0, [
+        _degrau(1, 100, 0.1), _degrau(2, 200, 0.1), _degrau(4, 205, 0.1, falhas=600),
+    ])
+
+    ultimo = resultado.degraus[-1]
+    assert ultimo.vazao == 20.5
+    assert ultimo.p99 == pytest.approx(0.1, rel=1e-3)
+    assert ultimo.taxa_erros == pytest.approx(600 / 805)
+    indice, motivo = resultado.joelho()
+    assert indice == 1 and "vazão" in motivo
+
+
+def test_degraus_contra_servidor(servidor, tmp_path):
+    cenarios = [Cenario("m", servidor + "/lento", {}, "Lento", 200)]
+
+    resultado = executar_saturacao(cenarios, niveis=(1, 4), duracao_degrau=0.5)
+
+    assert [d.usuarios for d in resultado.degraus] == [1, 4]
+    assert all(d.erros == 0 for d in resultado.degraus)
+    # o servidor atende em paralelo: 4 usuários rendem bem mais que 1
+    assert resultado.ganho(1) > 1.5
+
+    caminho = tmp_path / "saturacao.csv"
+    gravar_saturacao(str(caminho), resultado)
+    assert len(caminho.read_text(encoding="utf-8").splitlines()) == 3
@@ -0,0 +1,69 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+from benchmark.servidor_local import ConfiguracaoDados, DadosSinteticos, ServidorLocal
+
+
+@pytest.fixture(scope="module")
+def local():
+    dados = DadosSinteticos(ConfiguracaoDados(medidores_energia=20, medidores_temperatura=6, dias=10))
+    with ServidorLocal(dados) as srv:
+        yield srv
+
+
+def _get(srv, caminho, **params):
+    return requests.get(srv.url + caminho, params=params, timeout=10)
+
+
+def test_rota_desconhecida_devolve_404(local):
+    assert _get(local, "/nao-existe").status_code == 404
+
+
+def test_validacao_segue_formato_do_fastapi(local):
+    resp = _get(local, "/analise_energia/consumo-temporal", medidor_ids=["a"])
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["query", "medidor_ids"]
+
+
+@pytest.mark.parametrize("caminho, params", [
+    ("/analise_energia/consumo-temporal", {"agregacao": "ano"}),
+    ("/analise_energia/top-consumidores", {"top_n": 100}),
+    ("/analise_energia/anomalias-detectadas", {"limit": 1000}),
+    ("/analise_medidores_temp_hum/medicoes-enriquecidas", {"tipo_sensor": "INVALIDO"}),
+    ("/analise_medidores_temp_hum/series-temporais-hora", {"limit": -1}),
+    ("/analise_energia/analise-custos", {"data_inicio": date.today().isoformat(),
+                                         "data_fim": (date.today() - timedelta(days=3)).isoformat()}),
+])
+def test_parametros_invalidos_devolvem_422(local, caminho, params):
+    assert _get(local, caminho, **params).status_code == 422
+
+
+def test_paginacao_por_offset_e_consistente(local):
+    caminho = "/analise_medidores_temp_hum/medicoes-enriquecidas"
+    pagina = _get(local, caminho, limit=30).json()
+    deslocada = _get(local, caminho, limit=10, offset=13).json()
+
+    assert deslocada == pagina[13:23]
+    datas = [item["data_leitura"] for item in pagina]
+    assert datas == sorted(datas, reverse=True)
+
+
+def test_filtro_de_medidores_e_limit(local):
+    dados = _get(local, "/analise_energia/consumo-temporal", medidor_ids=[2, 5, 999], limit=7).json()
+
+    assert len(dados) == 7
+    assert {item["medidor_id"] for item in dados} <= {2, 5}
+
+
+def test_metricas_contam_as_requisicoes(local):
+    for _ in range(3):
+        _get(local, "/health")
+
+    texto = json.loads(_get(local, "/metricas").text)
+
+    assert 'api_requests_total{method="GET",endpoint="/health",status_code="200"}' in texto
+    assert 'api_request_duration_seconds_count{method="GET",endpoint="/health"}' in texto
@@ -0,0 +1,125 @@
+import csv
+from datetime import date
+
+import pytest
+
+from benchmark import varredura
+from benchmark.cli import main
+from benchmark.configuracao import CONFIG
+from benchmark.motor import REPETICOES_MINIMAS, ResultadoCenario
+from benchmark.registro import gravar_varredura
+from benchmark.varredura import (
+    PontoVarredura, ajustar, executar_varredura, executar_varredura_limit, pontos_limit, pontos_medidores,
+    pontos_periodo,
+)
+
+
+# ===============================================================
+# TESTES
+# ===============================================================
+def test_ajuste_linear_e_expoente_da_potencia():
+    xs = [1, 3, 7, 15, 30]
+
+    linear = ajustar(xs, [0.01 + 0.002 * x for x in xs])
+    quadratica = ajustar(xs, [0.001 * x ** 2 for x in xs])
+
+    assert linear.inclinacao == pytest.approx(0.002)
+    assert linear.intercepto == pytest.approx(0.01)
+    assert linear.r2 == pytest.approx(1.0)
+    assert quadratica.expoente == pytest.approx(2.0)
+    assert ajustar([1, 2], [0.1, 0.2]) is None
+
+
+def test_pontos_periodo_terminam_hoje_e_incluem_os_dois_extremos():
+    pontos = pontos_periodo(["/analise_energia/consumo-temporal"], [7, 1], hoje=date(2025, 3, 10))
+
+    assert [x for _, x, _ in pontos] == [1, 7]
+    assert pontos[0][2] == {"limit": 100000, "data_inicio": "2025-03-10", "data_fim": "2025-03-10"}
+    assert pontos[1][2]["data_inicio"] == "2025-03-04"
+
+
+def test_pontos_medidores_usam_ids_descobertos_e_incluem_todos():
+    ids = [3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610]
+    endpoint = "/analise_medidores_temp_hum/series-temporais-hora"
+
+    pontos = pontos_medidores([endpoint], [1, 10, 50], {endpoint: ids})
+    sem_descoberta = pontos_medidores([endpoint], [2])
+
+    assert [x for _, x, _ in pontos] == [1, 10, 12]
+    assert pontos[1][2]["medidor_ids"] == ids[:10]
+    assert sem_descoberta[0][2]["medidor_ids"] == [1, 2]
+
+
+def test_tamanho_da_query_repete_a_chave_de_cada_medidor():
+    ponto = PontoVarredura("/x", 3, ResultadoCenario("", {"medidor_ids": [1, 2, 30], "limit": 5}, 200))
+
+    assert ponto.tamanho_query == len("medidor_ids=1&medidor_ids=2&medidor_ids=30&limit=5")
+
+
+def test_varredura_mede_cada_ponto_e_grava_pontos_e_ajuste(servidor, monkeypatch, tmp_path):
+    monkeypatch.setattr(CONFIG, "base_url", servidor)
+    pontos = [("/ok", x, {"n": x}) for x in (1, 2, 4)] + [("/invalido", 1, {})]
+
+    resultado = executar_varredura(pontos, "n", repeticoes=2)
+    caminho = str(tmp_path / "varredura.csv")
+    gravar_varredura(caminho, resultado)
+
+    assert [len(p.resultado.amostras) for p in resultado.pontos] == [2, 2, 2, 1]
+    assert set(resultado.ajustes()) == {"/ok"}
+    with open(caminho, encoding="utf-8") as f:
+        assert len(list(csv.reader(f))) == 1 + 4
+    with open(str(tmp_path / "varredura_ajuste.csv"), encoding="utf-8") as f:
+        linhas = list(csv.reader(f))
+    assert [linha[0] for linha in linhas[1:]] == ["/ok", "/invalido"]
+
+
+def test_pontos_limit_param_no_maximo_do_endpoint():
+    pontos = pontos_limit(["/analise_energia/anomalias-detectadas"], [10, 100, 1000, 5000])
+
+    assert [x for _, x, _ in pontos] == [10, 100, 500]
+
+
+def test_varredura_de_listas_conta_linhas_e_vazao(servidor, monkeypatch):
+    monkeypatch.setattr(CONFIG, "base_url", servidor)
+
+    ponto = executar_varredura([("/lista", 1000, {"limit": 1000})], "limit", repeticoes=2, listas=True).pontos[0]
+
+    assert ponto.itens == 1000
+    assert ponto.linhas_por_segundo > 0
+    assert ponto.mb_por_segundo == pytest.approx(
+        sum(a.bytes for a in ponto.resultado.amostras) / sum(ponto.resultado.tempos) / 1e6
+    )
+
+
+def test_varredura_interrompida_fecha_a_sessao(monkeypatch):
+    fechadas = []
+    sessao = varredura.nova_sessao()
+    monkeypatch.setattr(sessao, "close", lambda: fechadas.append(sessao))
+    monkeypatch.setattr(varredura, "nova_sessao", lambda: sessao)
+
+    def falhar(*args, **kwargs):
+        raise RuntimeError("interrompida")
+
+    monkeypatch.setattr(varredura, "executar_cenario", falhar)
+
+    with pytest.raises(RuntimeError):
+        executar_varredura([("/ok", 1, {})], "n", repeticoes=1)
+    assert fechadas == [sessao]
+
+
+def test_endpoint_fora_da_dimensao_e_recusado(capsys):
+    with pytest.raises(SystemExit):
+        main(["varredura", "limit", "--endpoint", "/analise_energia/consumo-por-hora"])
+
+    assert "não aceita a dimensão limit" in capsys.readouterr().err
+
+
+def test_varredura_sem_repeticoes_segue_a_precisao(servidor, monkeypatch):
+    monkeypatch.setattr(CONFIG, "base_url", servidor)
+    monkeypatch.setattr(CONFIG, "repeticoes", 2)
+    monkeypatch.setattr(CONFIG, "precisao", 0.5)
+
+    ponto = executar_varredura_limit(["/lista"], [1000]).pontos[0]
+
+    assert len(ponto.resultado.amostras) >= REPETICOES_MINIMAS
+    assert ponto.resultado.precisao() <= 0.5
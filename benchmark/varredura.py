@@ -0,0 +1,317 @@
+import math
+import statistics
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from urllib.parse import urlencode
+
+import requests
+
+from .configuracao import url_endpoint
+from .historico import registrar_resultado
+from .motor import TIMEOUT_PADRAO, aceitar_item, executar_cenario, nova_sessao
+
+# ===============================================================
+# CONFIGURAÇÕES GERAIS
+# ===============================================================
+JANELAS_DIAS = (1, 3, 7, 15, 30, 90, 365)
+
+# Endpoints de energia filtrados por data_inicio/data_fim e os parâmetros fixos
+# de cada um na varredura (limit no máximo para o corte não achatar a curva).
+ENDPOINTS_PERIODO = {
+    "/analise_energia/consumo-temporal": {"limit": 100000},
+    "/analise_energia/analise-custos": {"limit": 100000},
+    "/analise_energia/analise-fator-potencia": {},
+    "/analise_energia/comparacao-medidores": {},
+    "/analise_energia/estatisticas-gerais": {},
+    "/analise_energia/top-consumidores": {},
+}
+
+TAMANHOS_MEDIDORES = (1, 10, 50, 200, 1000)  # mais o ponto "todos"
+
+# Endpoints que aceitam medidor_ids (lista repetida na query string)
+ENDPOINTS_MEDIDORES = {
+    **ENDPOINTS_PERIODO,
+    "/analise_energia/consumo-por-dia-semana": {},
+    "/analise_energia/consumo-por-hora": {},
+    "/analise_energia/anomalias-detectadas": {},
+    "/analise_medidores_temp_hum/medicoes-enriquecidas": {},
+    "/analise_medidores_temp_hum/series-temporais-hora": {},
+    "/analise_medidores_temp_hum/anomalias-detectadas": {},
+}
+
+LIMITES = (10, 100, 1000, 5000, 10000, 50000, 100000)
+
+# Endpoints que devolvem listas paginadas por limit e o maior limit aceito
+ENDPOINTS_LIMIT = {
+    "/analise_energia/consumo-temporal": 100000,
+    "/analise_energia/analise-custos": 100000,
+    "/analise_energia/comparacao-medidores": 100000,
+    "/analise_energia/anomalias-detectadas": 500,
+    "/analise_medidores_temp_hum/medicoes-enriquecidas": 1000,
+    "/analise_medidores_temp_hum/series-temporais-hora": 10000,
+    "/analise_medidores_temp_hum/anomalias-detectadas": 500,
+}
+
+# Onde descobrir os ids existentes de cada domínio: endpoint e parâmetros de
+# uma consulta que devolve uma linha com ``medidor_id`` por medidor.
+DESCOBERTA_MEDIDORES = {
+    "/analise_energia/": ("/analise_energia/consumo-temporal", {"agregacao": "mes", "limit": 100000}),
+    "/analise_medidores_temp_hum/": ("/analise_medidores_temp_hum/status-medidores", {}),
+}
+
+
+# ===============================================================
+# ESTRUTURAS DE RESULTADO
+# ===============================================================
+@dataclass
+class PontoVarredura:
+    endpoint: str
+    x: float  # valor da variável varrida (ex.: dias da janela)
+    resultado: object  # ResultadoCenario
+
+    @property
+    def mediana(self):
+        return statistics.median(self.resultado.tempos)
+
+    def _validas(self):
+        return [a for a in self.resultado.amostras if a.status == self.resultado.status_esperado]
+
+    @property
+    def itens(self):
+        """Linhas por resposta (média), quando a lista foi lida em fluxo; senão ``None``."""
+        contagens = [a.itens for a in self._validas() if a.itens is not None]
+        return sum(contagens) / len(contagens) if contagens else None
+
+    @property
+    def linhas_por_segundo(self):
+        validas = [a for a in self._validas() if a.itens is not None]
+        tempo = sum(a.duracao for a in validas)
+        return sum(a.itens for a in validas) / tempo if tempo > 0 else None
+
+    @property
+    def mb_por_segundo(self):
+        validas = self._validas()
+        tempo = sum(a.duracao for a in validas)
+        return sum(a.bytes for a in validas) / tempo / 1e6 if tempo > 0 else None
+
+    @property
+    def tamanho_query(self):
+        """Caracteres da query string, codificada como o requests faz (listas repetem a chave)."""
+        return len(urlencode(self.resultado.params, doseq=True))
+
+
+@dataclass
+class Ajuste:
+    """Curva latência × variável: reta ``a + b·x`` e potência ``c·x^k``."""
+    intercepto: float
+    inclinacao: float
+    r2: float
+    coeficiente: float = None
+    expoente: float = None  # k ≈ 1: custo linear; k ≈ 0: custo fixo
+    r2_potencia: float = None
+
+    def prever(self, x):
+        return self.intercepto + self.inclinacao * x
+
+
+@dataclass
+class ResultadoVarredura:
+    variavel: str  # nome da variável varrida, usado nos relatórios
+    pontos: list = field(default_factory=list)
+
+    def por_endpoint(self):
+        grupos = {}
+        for p in self.pontos:
+            grupos.setdefault(p.endpoint, []).append(p)
+        return grupos
+
+    def ajustes(self):
+        """``{endpoint: Ajuste}`` sobre as medianas dos pontos com status esperado."""
+        ajustes = {}
+        for endpoint, pontos in self.por_endpoint().items():
+            validos = [p for p in pontos if p.resultado.sucesso]
+            ajuste = ajustar([p.x for p in validos], [p.mediana for p in validos])
+            if ajuste is not None:
+                ajustes[endpoint] = ajuste
+        return ajustes
+
+
+# ===============================================================
+# AJUSTE DA CURVA
+# ===============================================================
+def _r2(xs, ys, a, b):
+    media = statistics.fmean(ys)
+    total = sum((y - media) ** 2 for y in ys)
+    residuo = sum((y - (a + b * x)) ** 2 for x, y in zip(xs, ys))
+    return 1 - residuo / total if total > 0 else 1.0
+
+
+def ajustar(xs, ys):
+    """Mínimos quadrados em escala linear e log-log; ``None`` com menos de 3 pontos."""
+    if len(xs) < 3 or len(set(xs)) < 2:
+        return None
+    b, a = statistics.linear_regression(xs, ys)
+    ajuste = Ajuste(a, b, _r2(xs, ys, a, b))
+    positivos = [(x, y) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(positivos) >= 3 and len({x for x, _ in positivos}) >= 2:
+        lx = [math.log(x) for x, _ in positivos]
+        ly = [math.log(y) for _, y in positivos]
+        k, log_c = statistics.linear_regression(lx, ly)
+        ajuste.coeficiente, ajuste.expoente = math.exp(log_c), k
+        ajuste.r2_potencia = _r2(lx, ly, log_c, k)
+    return ajuste
+
+
+def formatar_ajuste(ajuste, unidade):
+    linha = f"{ajuste.intercepto:.3f}s + {ajuste.inclinacao * 1000:.3f}ms/{unidade} (R² {ajuste.r2:.2f})"
+    if ajuste.expoente is not None:
+        linha += f" | ~{unidade}^{ajuste.expoente:.2f} (R² {ajuste.r2_potencia:.2f})"
+    return linha
+
+
+# ===============================================================
+# EXECUÇÃO
+# ===============================================================
+def executar_varredura(pontos, variavel, repeticoes=None, timeout=TIMEOUT_PADRAO, modo="varredura",
+                       listas=False):
+    """Mede cada ponto ``(endpoint, x, params)`` em sequência e ajusta a curva por endpoint.
+
+    Com ``listas`` as respostas são lidas em fluxo item a item, o que dá as
+    linhas por resposta e a vazão em linhas/s (``PontoVarredura.itens``).
+
+    Os pontos rodam na ordem dada (``pontos_periodo`` agrupa por endpoint, com
+    ``x`` crescente); cada um é um cenário completo (``executar_cenario``)
+    gravado no histórico. Sem ``repeticoes``, cada ponto amostra como
+    ``executar_cenario``: ``CONFIG.repeticoes`` vezes ou, com
+    ``CONFIG.precisao`` ligada, até o IC do percentil alvo estreitar.
+    """
+    if not pontos:
+        raise ValueError("Nenhum ponto selecionado para a varredura")
+    resultado = ResultadoVarredura(variavel)
+    session = nova_sessao()
+    print(f"\n=== Varredura por {variavel}: {len(pontos)} ponto(s) ===")
+    try:
+        for endpoint, x, params in pontos:
+            r = executar_cenario(
+                session, url_endpoint(endpoint), params, f"{variavel} = {x:g}", 200,
+                repeticoes=repeticoes, timeout=timeout, validar_item=aceitar_item if listas else None,
+            )
+            resultado.pontos.append(PontoVarredura(endpoint, x, r))
+            registrar_resultado(r, modo)
+    finally:
+        session.close()
+
+    print(f"\n📈 Latência × {variavel} (mediana e tamanho médio da resposta)")
+    ajustes = resultado.ajustes()
+    for endpoint, pontos_endpoint in resultado.por_endpoint().items():
+        serie = " | ".join(
+            f"{p.x:g}: {p.mediana:.3f}s {p.resultado.fases_medias()['bytes'] / 1024:.0f}KB"
+            + ("" if p.resultado.sucesso else f" ❌ {p.resultado.status_real}")
+            for p in pontos_endpoint
+        )
+        print(f"  {endpoint}: {serie}")
+        if endpoint in ajustes:
+            print(f"    ajuste: {formatar_ajuste(ajustes[endpoint], variavel)}")
+        if listas:
+            print("    vazão: " + " | ".join(_formatar_vazao(p) for p in pontos_endpoint))
+            melhor = max((p for p in pontos_endpoint if p.linhas_por_segundo), default=None,
+                         key=lambda p: p.linhas_por_segundo)
+            if melhor is not None:
+                print(f"    maior vazão: {variavel} = {melhor.x:g} ({melhor.linhas_por_segundo:,.0f} linhas/s)")
+    return resultado
+
+
+def _formatar_vazao(p):
+    if p.itens is None:
+        return f"{p.x:g}: -"
+    return f"{p.x:g}: {p.itens:.0f} linhas, {p.linhas_por_segundo:,.0f} linhas/s, {p.mb_por_segundo:.1f} MB/s"
+
+
+def pontos_periodo(endpoints=None, janelas=JANELAS_DIAS, hoje=None):
+    """Pontos da varredura por período: janela de ``n`` dias terminando em ``hoje``."""
+    hoje = hoje or date.today()
+    return [
+        (endpoint, dias, {**ENDPOINTS_PERIODO.get(endpoint, {}),
+                          "data_inicio": (hoje - timedelta(days=dias - 1)).isoformat(),
+                          "data_fim": hoje.isoformat()})
+        for endpoint in endpoints or ENDPOINTS_PERIODO
+        for dias in sorted(janelas)
+    ]
+
+
+def executar_varredura_periodo(endpoints=None, janelas=JANELAS_DIAS, repeticoes=None, timeout=TIMEOUT_PADRAO):
+    """Latência dos endpoints filtrados por data em janelas crescentes (1 a 365 dias)."""
+    return executar_varredura(pontos_periodo(endpoints, janelas), "dias", repeticoes, timeout)
+
+
+def dominio_medidores(endpoint):
+    """Prefixo de ``DESCOBERTA_MEDIDORES`` que cobre o endpoint, ou ``None``."""
+    return next((prefixo for prefixo in DESCOBERTA_MEDIDORES if endpoint.startswith(prefixo)), None)
+
+
+def descobrir_medidores(session, dominio, timeout=TIMEOUT_PADRAO):
+    """Ids de medidor existentes no domínio, em ordem; vazio se não der para descobrir."""
+    caminho, params = DESCOBERTA_MEDIDORES[dominio]
+    try:
+        resp = session.get(url_endpoint(caminho), params=params, timeout=timeout)
+        resp.raise_for_status()
+        return sorted({item["medidor_id"] for item in resp.json()})
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return []
+
+
+def pontos_medidores(endpoints=None, tamanhos=TAMANHOS_MEDIDORES, medidores=None):
+    """Pontos da varredura por cardinalidade de ``medidor_ids``.
+
+    ``medidores`` mapeia endpoint -> ids existentes (``descobrir_medidores``):
+    cada tamanho usa os primeiros ``n`` ids e há um ponto extra com todos.
+    Tamanhos acima do total do domínio são ignorados. Sem ids conhecidos,
+    usa ``1..n`` como os testes (``list(range(1, 51))``).
+    """
+    pontos = []
+    for endpoint in endpoints or ENDPOINTS_MEDIDORES:
+        fixos = ENDPOINTS_MEDIDORES.get(endpoint, {})
+        ids = (medidores or {}).get(endpoint) or []
+        if not ids:
+            pontos += [(endpoint, n, {**fixos, "medidor_ids": list(range(1, n + 1))}) for n in sorted(tamanhos)]
+            continue
+        tamanhos_validos = sorted({n for n in tamanhos if n < len(ids)} | {len(ids)})
+        pontos += [(endpoint, n, {**fixos, "medidor_ids": ids[:n]}) for n in tamanhos_validos]
+    return pontos
+
+
+def executar_varredura_medidores(endpoints=None, tamanhos=TAMANHOS_MEDIDORES, repeticoes=None,
+                                 timeout=TIMEOUT_PADRAO):
+    """Latência, tamanho da resposta e da query string conforme cresce a lista ``medidor_ids``."""
+    endpoints = endpoints or list(ENDPOINTS_MEDIDORES)
+    por_dominio = {}
+    medidores = {}
+    session = nova_sessao()
+    try:
+        for endpoint in endpoints:
+            dominio = dominio_medidores(endpoint)
+            if dominio is not None and dominio not in por_dominio:
+                por_dominio[dominio] = descobrir_medidores(session, dominio, timeout)
+                print(f"🔎 {dominio}: {len(por_dominio[dominio])} medidor(es) encontrado(s)")
+            medidores[endpoint] = por_dominio.get(dominio, [])
+            if not medidores[endpoint]:
+                print(f"⚠️ {endpoint}: ids de medidor não descobertos, usando 1..n e sem o ponto 'todos'")
+    finally:
+        session.close()
+    return executar_varredura(pontos_medidores(endpoints, tamanhos, medidores), "medidores",
+                              repeticoes, timeout)
+
+
+def pontos_limit(endpoints=None, limites=LIMITES):
+    """Pontos da varredura por ``limit``; acima do máximo do endpoint entra o próprio máximo."""
+    pontos = []
+    for endpoint in endpoints or ENDPOINTS_LIMIT:
+        maximo = ENDPOINTS_LIMIT.get(endpoint, max(limites))
+        valores = sorted({min(limit, maximo) for limit in limites})
+        pontos += [(endpoint, limit, {"limit": limit}) for limit in valores]
+    return pontos
+
+
+def executar_varredura_limit(endpoints=None, limites=LIMITES, repeticoes=None, timeout=TIMEOUT_PADRAO):
+    """Latência, bytes, linhas e vazão (linhas/s e MB/s) por tamanho de página."""
+    return executar_varredura(pontos_limit(endpoints, limites), "limit", repeticoes, timeout, listas=True)
@@ -0,0 +1,112 @@
+import pytest
+
+from benchmark.catalogo import carregar_limiares
+from benchmark.configuracao import AMBIENTES, CONFIG
+from benchmark.historico import Historico, execucao_corrente
+from benchmark.motor import nova_sessao
+from benchmark.regressao import comparar_com_referencia, relatorio
+from benchmark.servidor_local import ServidorLocal
+
+_servidor_local = None
+_relatorio_regressao = []
+
+
+# ===============================================================
+# OPÇÕES DE LINHA DE COMANDO
+# ===============================================================
+def pytest_addoption(parser):
+    grupo = parser.getgroup("benchmark")
+    grupo.addoption("--repeticoes", type=int, default=None,
+                    help="Amostras por cenário (padrão: BENCH_REPETICOES ou 20)")
+    grupo.addoption("--ambiente", choices=list(AMBIENTES), default=None,
+                    help="Perfil de ambiente da API (padrão: BENCH_AMBIENTE ou dev)")
+    grupo.addoption("--base-url", default=None,
+                    help="URL base da API; tem precedência sobre o perfil (padrão: BENCH_BASE_URL)")
+    grupo.addoption("--servidor-local", action="store_true",
+                    help="Sobe o servidor sintético em processo e executa contra ele")
+    grupo.addoption("--historico", default=None,
+                    help="Banco SQLite do histórico (padrão: BENCH_HISTORICO ou resultados/historico.sqlite)")
+    grupo.addoption("--sem-historico", action="store_true", help="Não grava a execução no histórico")
+    grupo.addoption("--metricas-servidor", action="store_true",
+                    help="Lê /metricas antes e depois de cada cenário e grava o tempo medido no servidor")
+    grupo.addoption("--quebrar-cache", action="store_true",
+                    help="Desloca as datas e acrescenta um parâmetro único a cada tentativa (mede o cache frio)")
+    grupo.addoption("--precisao", type=float, default=None,
+                    help="Repetições adaptativas: amostra até o IC 95%% do percentil alvo ficar em ±PRECISAO "
+                         "(ex.: 0.05); ignora --repeticoes (padrão: BENCH_PRECISAO, 0 desliga)")
+    grupo.addoption("--orcamento", type=float, default=None,
+                    help="Tempo máximo (s) por cenário nas repetições adaptativas (padrão: BENCH_ORCAMENTO ou 60)")
+    grupo.addoption("--percentil-alvo", type=float, default=None,
+                    help="Percentil cujo IC controla as repetições adaptativas, ex.: 50 ou 95 (padrão: 50)")
+    grupo.addoption("--comparar-com", metavar="REFERENCIA", default=None,
+                    help="Ao final, compara a execução com 'base', 'anterior' ou um id do histórico "
+                         "e falha se houver regressão significativa")
+
+
+def pytest_configure(config):
+    global _servidor_local
+    if config.getoption("--repeticoes"):
+        CONFIG.repeticoes = config.getoption("--repeticoes")
+    CONFIG.selecionar_ambiente(config.getoption("--ambiente"), config.getoption("--base-url"))
+    if config.getoption("--historico"):
+        CONFIG.historico = config.getoption("--historico")
+    if config.getoption("--sem-historico"):
+        CONFIG.historico = ""
+    if config.getoption("--metricas-servidor"):
+        CONFIG.metricas_servidor = True
+    if config.getoption("--quebrar-cache"):
+        CONFIG.quebrar_cache = True
+    for opcao in ("precisao", "orcamento", "percentil_alvo"):
+        if config.getoption(opcao) is not None:
+            setattr(CONFIG, opcao, config.getoption(opcao))
+    if config.getoption("--servidor-local"):
+        _servidor_local = ServidorLocal().iniciar()
+        CONFIG.selecionar_ambiente("local", _servidor_local.url)
+
+
+def pytest_unconfigure(config):
+    if _servidor_local is not None:
+        _servidor_local.parar()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    referencia = session.config.getoption("--comparar-com")
+    execucao = execucao_corrente()
+    if not referencia or execucao is None:
+        return
+    historico = Historico(CONFIG.historico)
+    try:
+        id_base, comparacoes = comparar_com_referencia(historico, execucao.id, referencia, carregar_limiares())
+    except ValueError as erro:
+        _relatorio_regressao[:] = [f"⚠️ {erro}"]
+        return
+    finally:
+        historico.fechar()
+    _relatorio_regressao[:] = [f"Execução {execucao.id} comparada com {id_base}"] + relatorio(comparacoes)
+    if any(c.regressao for c in comparacoes) and session.exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _relatorio_regressao:
+        terminalreporter.section("regressões de desempenho")
+        for linha in _relatorio_regressao:
+            terminalreporter.write_line(linha)
+
+
+def pytest_report_header(config):
+    try:
+        return f"benchmark: ambiente={CONFIG.ambiente} url={CONFIG.url_base}"
+    except ValueError as erro:
+        return f"benchmark: {erro}"
+
+
+# ===============================================================
+# FIXTURE HTTP SESSION
+# ===============================================================
+@pytest.fixture(scope="session")
+def session():
+    s = nova_sessao()
+    yield s
+    s.close()
@@ -1,26 +1,14 @@
 import pytest
-import requests
-import time
-import csv
+
+from benchmark import LIMIAR_REGRESSAO_RAPIDO, RegistroCSV, executar_cenario, url_endpoint
 
 # ===============================================================
 # CONFIGURAÇÕES GERAIS
 # ===============================================================
-BASE_URL = "http://172.16.40.100:8025/"
-HEADERS = {"accept": "application/json"}
-REPETICOES = 5
+BASE_URL = url_endpoint("/")
 ARQUIVO_CSV = "csv/default/endpoint_raiz_resultados.csv"
 LIMITE_TEMPO_MEDIO = 30  # segundos
-
-# ===============================================================
-# FIXTURE HTTP SESSION
-# ===============================================================
-@pytest.fixture(scope="session")
-def session():
-    s = requests.Session()
-    s.headers.update(HEADERS)
-    yield s
-    s.close()
+LIMIAR_REGRESSAO = LIMIAR_REGRESSAO_RAPIDO
 
 # ===============================================================
 # CENÁRIOS DE TESTE
@@ -30,99 +18,44 @@ cenarios = [
 ]
 
 # ===============================================================
-# CRIA/INICIALIZA O CSV
+# REGISTRO DOS RESULTADOS
 # ===============================================================
-with open(ARQUIVO_CSV, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow([
-        "Cenário",
-        "Parâmetros",
-        "Status Esperado",
-        "Status Real",
-        "Tempo Médio (s)",
-        "Tempo Mínimo (s)",
-        "Tempo Máximo (s)",
-        "Sucesso"
-    ])
+registro = RegistroCSV(ARQUIVO_CSV)
 
 # ===============================================================
-# TESTE PARAMETRIZADO
+# VALIDAÇÃO DA RESPOSTA
 # ===============================================================
-@pytest.mark.parametrize("params, descricao, status_esperado", cenarios, ids=[d for _, d, _ in cenarios])
-def test_endpoint_raiz(session, params, descricao, status_esperado):
-    tempos = []
-    sucesso = True
-    status_real = None
-
-    print(f"\n=== Cenário: {descricao} ===")
-    print(f"Parâmetros: {params}")
-
-    for i in range(REPETICOES):
-        inicio = time.perf_counter()
-        resp = session.get(BASE_URL, params=params)
-        fim = time.perf_counter()
-
-        duracao = fim - inicio
-        tempos.append(duracao)
-        status_real = resp.status_code
+def validar_resposta(resp):
+    data = resp.json()
+    assert isinstance(data, dict), "Resposta deve ser um objeto JSON"
 
-        print(f"➡️ Tentativa {i+1}: {status_real} em {duracao:.3f}s")
+    # Campos obrigatórios
+    for campo in ["service", "version", "status", "docs"]:
+        assert campo in data, f"Campo ausente: {campo}"
 
-        if status_real != status_esperado:
-            sucesso = False
-            print(f"❌ Status inesperado: {status_real}, esperado: {status_esperado}")
-            break
+    # Tipos e valores esperados
+    assert isinstance(data["service"], str), "'service' deve ser string"
+    assert isinstance(data["version"], str), "'version' deve ser string"
+    assert isinstance(data["status"], str), "'status' deve ser string"
+    assert isinstance(data["docs"], str), "'docs' deve ser string"
 
-        # Validação do JSON esperado
-        if status_real == 200:
-            data = resp.json()
-            assert isinstance(data, dict), "Resposta deve ser um objeto JSON"
+    # Conteúdo esperado
+    assert data["service"].startswith("Time Series"), "Campo 'service' inesperado"
+    assert data["version"] == "0.0.1", "Versão incorreta"
+    assert data["status"] in ["Desenvolvimento", "Produção", "Homologação"], "Status fora do padrão"
+    assert data["docs"] == "/docs", "Campo 'docs' deve ser '/docs'"
 
-            # Campos obrigatórios
-            for campo in ["service", "version", "status", "docs"]:
-                assert campo in data, f"Campo ausente: {campo}"
 
-            # Tipos e valores esperados
-            assert isinstance(data["service"], str), "'service' deve ser string"
-            assert isinstance(data["version"], str), "'version' deve ser string"
-            assert isinstance(data["status"], str), "'status' deve ser string"
-            assert isinstance(data["docs"], str), "'docs' deve ser string"
-
-            # Conteúdo esperado
-            assert data["service"].startswith("Time Series"), "Campo 'service' inesperado"
-            assert data["version"] == "0.0.1", "Versão incorreta"
-            assert data["status"] in ["Desenvolvimento", "Produção", "Homologação"], "Status fora do padrão"
-            assert data["docs"] == "/docs", "Campo 'docs' deve ser '/docs'"
-
-    # ===========================================================
-    # Estatísticas de tempo e registro no CSV
-    # ===========================================================
-    media = sum(tempos) / len(tempos)
-    menor = min(tempos)
-    maior = max(tempos)
-
-    print(f"\n📈 Resultados — {descricao}")
-    print(f"  Status Esperado: {status_esperado}")
-    print(f"  Status Real: {status_real}")
-    print(f"  Média: {media:.3f}s | Mínimo: {menor:.3f}s | Máximo: {maior:.3f}s")
-
-    # Registra no CSV
-    with open(ARQUIVO_CSV, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            descricao,
-            str(params),
-            status_esperado,
-            status_real,
-            round(media, 3),
-            round(menor, 3),
-            round(maior, 3),
-            "OK" if sucesso else "FALHA"
-        ])
-
-    # ===============================================================
-    # Verifica tempo médio máximo
-    # ===============================================================
+# ===============================================================
+# TESTE PARAMETRIZADO
+# ===============================================================
+@pytest.mark.parametrize("params, descricao, status_esperado", cenarios, ids=[d for _, d, _ in cenarios])
+def test_endpoint_raiz(session, params, descricao, status_esperado):
+    resultado = executar_cenario(
+        session, BASE_URL, params, descricao, status_esperado, validar=validar_resposta
+    )
+    registro.gravar(resultado)
 
+    # Verifica tempo médio
     if status_esperado == 200:
-        assert media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({media:.2f}s) em {descricao}"
+        assert resultado.media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({resultado.media:.2f}s) em {descricao}"
@@ -1,28 +1,15 @@
 import pytest
-import requests
-import time
-import csv
 from datetime import datetime
 
+from benchmark import RegistroCSV, executar_cenario, url_endpoint
+
 # ===============================================================
 # CONFIGURAÇÕES GERAIS
 # ===============================================================
-BASE_URL = "http://172.16.40.100:8025/analise_energia/anomalias-detectadas"
-HEADERS = {"accept": "application/json"}
-REPETICOES = 5
+BASE_URL = url_endpoint("/analise_energia/anomalias-detectadas")
 ARQUIVO_CSV = "csv/energia/anomalias_detectadas_resultados.csv"
 LIMITE_TEMPO_MEDIO = 30  # segundos
 
-# ===============================================================
-# FIXTURE HTTP SESSION
-# ===============================================================
-@pytest.fixture(scope="session")
-def session():
-    s = requests.Session()
-    s.headers.update(HEADERS)
-    yield s
-    s.close()
-
 # ===============================================================
 # CENÁRIOS DE TESTE
 # ===============================================================
@@ -47,115 +34,60 @@ cenarios = [
 ]
 
 # ===============================================================
-# CRIA/INICIALIZA O CSV
+# REGISTRO DOS RESULTADOS
 # ===============================================================
-with open(ARQUIVO_CSV, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow([
-        "Cenário",
-        "Parâmetros",
-        "Status Esperado",
-        "Status Real",
-        "Tempo Médio (s)",
-        "Tempo Mínimo (s)",
-        "Tempo Máximo (s)",
-        "Sucesso"
-    ])
+registro = RegistroCSV(ARQUIVO_CSV)
+
+# ===============================================================
+# VALIDAÇÃO DA RESPOSTA
+# ===============================================================
+def validar_resposta(resp):
+    data = resp.json()
+    assert isinstance(data, list), "Resposta deve ser uma lista"
+
+    if len(data) > 0:
+        for item in data:
+            # Campos esperados no JSON
+            for campo in [
+                "id",
+                "medidor_descricao",
+                "data",
+                "consumo_kwh",
+                "consumo_zscore",
+                "is_anomalia",
+                "gravidade",
+                "motivo"
+            ]:
+                assert campo in item, f"Campo ausente no JSON: {campo}"
+
+            # Tipagem esperada
+            assert isinstance(item["id"], int), "Campo 'id' deve ser inteiro"
+            assert (item["medidor_descricao"] is None or isinstance(item["medidor_descricao"], str)), \
+                "Campo 'medidor_descricao' deve ser string ou None"
+            assert isinstance(item["data"], str), "Campo 'data' deve ser string (ISO 8601)"
+            assert isinstance(item["consumo_kwh"], (float, int)), "Campo 'consumo_kwh' deve ser numérico"
+            assert isinstance(item["consumo_zscore"], (float, int)), "Campo 'consumo_zscore' deve ser numérico"
+            assert isinstance(item["is_anomalia"], bool), "Campo 'is_anomalia' deve ser booleano"
+            assert isinstance(item["gravidade"], str), "Campo 'gravidade' deve ser string"
+            assert isinstance(item["motivo"], str), "Campo 'motivo' deve ser string"
+
+            # Validação de formato da data
+            try:
+                datetime.fromisoformat(item["data"])
+            except ValueError:
+                pytest.fail(f"Campo 'data' não está em formato ISO válido: {item['data']}")
+
 
 # ===============================================================
 # TESTE PARAMETRIZADO
 # ===============================================================
 @pytest.mark.parametrize("params, descricao, status_esperado", cenarios, ids=[d for _, d, _ in cenarios])
 def test_anomalias_detectadas(session, params, descricao, status_esperado):
-    tempos = []
-    sucesso = True
-    status_real = None
-
-    print(f"\n=== Cenário: {descricao} ===")
-    print(f"Parâmetros: {params}")
-
-    for i in range(REPETICOES):
-        inicio = time.perf_counter()
-        resp = session.get(BASE_URL, params=params)
-        fim = time.perf_counter()
-        duracao = fim - inicio
-        tempos.append(duracao)
-        status_real = resp.status_code
-
-        print(f"➡️ Tentativa {i+1}: {status_real} em {duracao:.3f}s")
-
-        if status_real != status_esperado:
-            sucesso = False
-            print(f"❌ Status inesperado: {status_real}, esperado: {status_esperado}")
-            break
-
-        # Validação do conteúdo JSON quando retorno for 200
-        if status_real == 200:
-            data = resp.json()
-            assert isinstance(data, list), "Resposta deve ser uma lista"
-
-            if len(data) > 0:
-                for item in data:
-                    # Campos esperados no JSON
-                    for campo in [
-                        "id",
-                        "medidor_descricao",
-                        "data",
-                        "consumo_kwh",
-                        "consumo_zscore",
-                        "is_anomalia",
-                        "gravidade",
-                        "motivo"
-                    ]:
-                        assert campo in item, f"Campo ausente no JSON: {campo}"
-
-                    # Tipagem esperada
-                    assert isinstance(item["id"], int), "Campo 'id' deve ser inteiro"
-                    assert (item["medidor_descricao"] is None or isinstance(item["medidor_descricao"], str)), \
-                        "Campo 'medidor_descricao' deve ser string ou None"
-                    assert isinstance(item["data"], str), "Campo 'data' deve ser string (ISO 8601)"
-                    assert isinstance(item["consumo_kwh"], (float, int)), "Campo 'consumo_kwh' deve ser numérico"
-                    assert isinstance(item["consumo_zscore"], (float, int)), "Campo 'consumo_zscore' deve ser numérico"
-                    assert isinstance(item["is_anomalia"], bool), "Campo 'is_anomalia' deve ser booleano"
-                    assert isinstance(item["gravidade"], str), "Campo 'gravidade' deve ser string"
-                    assert isinstance(item["motivo"], str), "Campo 'motivo' deve ser string"
-
-                    # Validação de formato da data
-                    try:
-                        datetime.fromisoformat(item["data"])
-                    except ValueError:
-                        pytest.fail(f"Campo 'data' não está em formato ISO válido: {item['data']}")
-
-    # ===============================================================
-    # Estatísticas de tempo
-    # ===============================================================
-    media = sum(tempos) / len(tempos)
-    menor = min(tempos)
-    maior = max(tempos)
-
-    print(f"\n Resultados — {descricao}")
-    print(f"  Status Esperado: {status_esperado}")
-    print(f"  Status Real: {status_real}")
-    print(f"  Média: {media:.3f}s | Mínimo: {menor:.3f}s | Máximo: {maior:.3f}s")
-
-    # ===============================================================
-    # Grava no CSV
-    # ===============================================================
-    with open(ARQUIVO_CSV, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            descricao,
-            str(params),
-            status_esperado,
-            status_real,
-            round(media, 3),
-            round(menor, 3),
-            round(maior, 3),
-            "OK" if sucesso else "FALHA"
-        ])
-
-    # ===============================================================
-    # Verifica tempo médio máximo
-    # ===============================================================
+    resultado = executar_cenario(
+        session, BASE_URL, params, descricao, status_esperado, validar=validar_resposta
+    )
+    registro.gravar(resultado)
+
+    # Verifica tempo médio
     if status_esperado == 200:
-        assert media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({media:.2f}s) em {descricao}"
\ No newline at end of file
+        assert resultado.media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({resultado.media:.2f}s) em {descricao}"
@@ -1,28 +1,15 @@
 import pytest
-import requests
-import time
-import csv
 from datetime import date, timedelta
 
+from benchmark import RegistroCSV, executar_cenario, url_endpoint
+
 # ===============================================================
 # CONFIGURAÇÕES GERAIS
 # ===============================================================
-BASE_URL = "http://172.16.40.100:8025/analise_energia/top-consumidores"
-HEADERS = {"accept": "application/json"}
-REPETICOES = 5
+BASE_URL = url_endpoint("/analise_energia/top-consumidores")
 ARQUIVO_CSV = "csv/energia/ranking_maiores_consumidores_resultados.csv"
 LIMITE_TEMPO_MEDIO = 30  # segundos
 
-# ===============================================================
-# FIXTURE HTTP SESSION
-# ===============================================================
-@pytest.fixture(scope="session")
-def session():
-    s = requests.Session()
-    s.headers.update(HEADERS)
-    yield s
-    s.close()
-
 # ===============================================================
 # CENÁRIOS DE TESTE
 # ===============================================================
@@ -60,99 +47,50 @@ cenarios = [
 ]
 
 # ===============================================================
-# CRIA/INICIALIZA O CSV
+# REGISTRO DOS RESULTADOS
 # ===============================================================
-with open(ARQUIVO_CSV, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow([
-        "Cenário",
-        "Parâmetros",
-        "Status Esperado",
-        "Status Real",
-        "Tempo Médio (s)",
-        "Tempo Mínimo (s)",
-        "Tempo Máximo (s)",
-        "Sucesso"
-    ])
+registro = RegistroCSV(ARQUIVO_CSV)
+
+# ===============================================================
+# VALIDAÇÃO DA RESPOSTA
+# ===============================================================
+def validar_resposta(resp):
+    data = resp.json()
+    assert isinstance(data, list), "Resposta deve ser uma lista"
+
+    if len(data) > 0:
+        for item in data:
+            for campo in [
+                "posicao",
+                "medidor",
+                "consumo_total_kwh",
+                "custo_total"
+            ]:
+                assert campo in item, f"Campo ausente: {campo}"
+
+            assert isinstance(item["posicao"], int), "'posicao' deve ser int"
+            assert isinstance(item["medidor"], str), "'medidor' deve ser string"
+            assert isinstance(item["consumo_total_kwh"], (int, float)), "'consumo_total_kwh' deve ser numérico"
+            assert isinstance(item["custo_total"], (int, float)), "'custo_total' deve ser numérico"
+
+            assert item["consumo_total_kwh"] >= 0, "'consumo_total_kwh' deve ser >= 0"
+            assert item["custo_total"] >= 0, "'custo_total' deve ser >= 0"
+
+        # Verifica se o ranking está em ordem crescente
+        posicoes = [i["posicao"] for i in data]
+        assert posicoes == sorted(posicoes), "Lista de posições fora de ordem"
+
 
 # ===============================================================
 # TESTE PARAMETRIZADO
 # ===============================================================
 @pytest.mark.parametrize("params, descricao, status_esperado", cenarios, ids=[d for _, d, _ in cenarios])
 def test_ranking_maiores_consumidores(session, params, descricao, status_esperado):
-    tempos = []
-    sucesso = True
-    status_real = None
-
-    print(f"\n=== Cenário: {descricao} ===")
-    print(f"Parâmetros: {params}")
-
-    for i in range(REPETICOES):
-        inicio = time.perf_counter()
-        resp = session.get(BASE_URL, params=params)
-        fim = time.perf_counter()
-        duracao = fim - inicio
-        tempos.append(duracao)
-        status_real = resp.status_code
-
-        print(f"➡️ Tentativa {i+1}: {status_real} em {duracao:.3f}s")
-
-        if status_real != status_esperado:
-            sucesso = False
-            print(f"❌ Status inesperado: {status_real}, esperado: {status_esperado}")
-            break
-
-        # Validação da resposta JSON se for 200
-        if status_real == 200:
-            data = resp.json()
-            assert isinstance(data, list), "Resposta deve ser uma lista"
-
-            if len(data) > 0:
-                for item in data:
-                    for campo in [
-                        "posicao",
-                        "medidor",
-                        "consumo_total_kwh",
-                        "custo_total"
-                    ]:
-                        assert campo in item, f"Campo ausente: {campo}"
-
-                    assert isinstance(item["posicao"], int), "'posicao' deve ser int"
-                    assert isinstance(item["medidor"], str), "'medidor' deve ser string"
-                    assert isinstance(item["consumo_total_kwh"], (int, float)), "'consumo_total_kwh' deve ser numérico"
-                    assert isinstance(item["custo_total"], (int, float)), "'custo_total' deve ser numérico"
-
-                    assert item["consumo_total_kwh"] >= 0, "'consumo_total_kwh' deve ser >= 0"
-                    assert item["custo_total"] >= 0, "'custo_total' deve ser >= 0"
-
-                # Verifica se o ranking está em ordem crescente
-                posicoes = [i["posicao"] for i in data]
-                assert posicoes == sorted(posicoes), "Lista de posições fora de ordem"
-
-    # Estatísticas de tempo
-    media = sum(tempos) / len(tempos)
-    menor = min(tempos)
-    maior = max(tempos)
-
-    print(f"\n Resultados — {descricao}")
-    print(f"  Status Esperado: {status_esperado}")
-    print(f"  Status Real: {status_real}")
-    print(f"  Média: {media:.3f}s | Mínimo: {menor:.3f}s | Máximo: {maior:.3f}s")
-
-    # Salva no CSV
-    with open(ARQUIVO_CSV, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            descricao,
-            str(params),
-            status_esperado,
-            status_real,
-            round(media, 3),
-            round(menor, 3),
-            round(maior, 3),
-            "OK" if sucesso else "FALHA"
-        ])
-
-    # Verifica tempo médio (só se esperado 200)
+    resultado = executar_cenario(
+        session, BASE_URL, params, descricao, status_esperado, validar=validar_resposta
+    )
+    registro.gravar(resultado)
+
+    # Verifica tempo médio
     if status_esperado == 200:
-        assert media < LIMITE_TEMPO_MEDIO, f"⏱ Tempo médio alto ({media:.2f}s) em {descricao}"
\ No newline at end of file
+        assert resultado.media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({resultado.media:.2f}s) em {descricao}"
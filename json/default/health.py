@@ -1,6 +1,13 @@
+import os
+import sys
+
 import requests, json
 
-url = "http://172.16.40.100:8025/health"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from benchmark.configuracao import url_endpoint  # noqa: E402
+
+# Ambiente: BENCH_AMBIENTE=dev|homolog|prod|local ou BENCH_BASE_URL=http://...
+url = url_endpoint("/health")
 resp = requests.get(url, headers={"accept": "application/json"})
 print(resp.status_code)
 print(json.dumps(resp.json(), indent=2, ensure_ascii=False))
@@ -1,28 +1,15 @@
 import pytest
-import requests
-import time
-import csv
 from datetime import datetime, timedelta
 
+from benchmark import RegistroCSV, executar_cenario, url_endpoint
+
 # ===============================================================
 # CONFIGURAÇÕES GERAIS
 # ===============================================================
-BASE_URL = "http://172.16.40.100:8025/analise_medidores_temp_hum/medicoes-enriquecidas"
-HEADERS = {"accept": "application/json"}
-REPETICOES = 5
+BASE_URL = url_endpoint("/analise_medidores_temp_hum/medicoes-enriquecidas")
 ARQUIVO_CSV = "csv/temperatura_e_humidade/medicoes_enriquecidas_resultados.csv"
 LIMITE_TEMPO_MEDIO = 30  # segundos
 
-# ===============================================================
-# FIXTURE HTTP SESSION
-# ===============================================================
-@pytest.fixture(scope="session")
-def session():
-    s = requests.Session()
-    s.headers.update(HEADERS)
-    yield s
-    s.close()
-
 # ===============================================================
 # CENÁRIOS DE TESTE
 # ===============================================================
@@ -86,110 +73,55 @@ cenarios = [
 ]
 
 # ===============================================================
-# CRIA/INICIALIZA O CSV
+# REGISTRO DOS RESULTADOS
 # ===============================================================
-with open(ARQUIVO_CSV, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow([
-        "Cenário",
-        "Parâmetros",
-        "Status Esperado",
-        "Status Real",
-        "Tempo Médio (s)",
-        "Tempo Mínimo (s)",
-        "Tempo Máximo (s)",
-        "Sucesso"
-    ])
+registro = RegistroCSV(ARQUIVO_CSV)
+
+# ===============================================================
+# VALIDAÇÃO DA RESPOSTA
+# ===============================================================
+def validar_resposta(resp):
+    data = resp.json()
+    assert isinstance(data, list), f"Retorno esperado: lista, recebido: {type(data)}"
+
+    if len(data) > 0:
+        item = data[0]
+        assert isinstance(item, dict), "Cada item deve ser um objeto JSON"
+
+        campos_esperados = [
+            "data_leitura",
+            "medidor_id",
+            "temperatura",
+            "umidade",
+            "tipo_medidor",
+            "anomalia_estatistica",
+            "fora_limites_definidos",
+            "anomalia_alvo"
+        ]
+        for campo in campos_esperados:
+            assert campo in item, f"Campo ausente: {campo}"
+
+        # Tipos básicos
+        assert isinstance(item["data_leitura"], str)
+        assert isinstance(item["medidor_id"], int)
+        assert isinstance(item["temperatura"], (int, float))
+        assert isinstance(item["umidade"], (int, float))
+        assert isinstance(item["tipo_medidor"], str)
+        assert isinstance(item["anomalia_estatistica"], (int, float, bool))
+        assert isinstance(item["fora_limites_definidos"], (int, float, bool))
+        assert isinstance(item["anomalia_alvo"], (int, float, bool))
+
 
 # ===============================================================
 # TESTE PARAMETRIZADO
 # ===============================================================
 @pytest.mark.parametrize("params, descricao, status_esperado", cenarios, ids=[d for _, d, _ in cenarios])
 def test_medicoes_enriquecidas(session, params, descricao, status_esperado):
-    tempos = []
-    sucesso = True
-    status_real = None
-
-    print(f"\n=== Cenário: {descricao} ===")
-    print(f"Parâmetros: {params}")
-
-    for i in range(REPETICOES):
-        inicio = time.perf_counter()
-        resp = session.get(BASE_URL, params=params)
-        fim = time.perf_counter()
-        duracao = fim - inicio
-        tempos.append(duracao)
-        status_real = resp.status_code
-
-        print(f"➡️ Tentativa {i+1}: {status_real} em {duracao:.3f}s")
-
-        if status_real != status_esperado:
-            sucesso = False
-            print(f"❌ Status inesperado: {status_real}, esperado: {status_esperado}")
-            break
-
-        # Se retorno for 200, valida estrutura JSON
-        if status_real == 200:
-            data = resp.json()
-            assert isinstance(data, list), f"Retorno esperado: lista, recebido: {type(data)}"
-
-            if len(data) > 0:
-                item = data[0]
-                assert isinstance(item, dict), "Cada item deve ser um objeto JSON"
-
-                campos_esperados = [
-                    "data_leitura",
-                    "medidor_id",
-                    "temperatura",
-                    "umidade",
-                    "tipo_medidor",
-                    "anomalia_estatistica",
-                    "fora_limites_definidos",
-                    "anomalia_alvo"
-                ]
-                for campo in campos_esperados:
-                    assert campo in item, f"Campo ausente: {campo}"
-
-                # Tipos básicos
-                assert isinstance(item["data_leitura"], str)
-                assert isinstance(item["medidor_id"], int)
-                assert isinstance(item["temperatura"], (int, float))
-                assert isinstance(item["umidade"], (int, float))
-                assert isinstance(item["tipo_medidor"], str)
-                assert isinstance(item["anomalia_estatistica"], (int, float, bool))
-                assert isinstance(item["fora_limites_definidos"], (int, float, bool))
-                assert isinstance(item["anomalia_alvo"], (int, float, bool))
-
-    # ===============================================================
-    # Estatísticas de tempo
-    # ===============================================================
-    media = sum(tempos) / len(tempos)
-    menor = min(tempos)
-    maior = max(tempos)
-
-    print(f"\n Resultados — {descricao}")
-    print(f"  Status Esperado: {status_esperado}")
-    print(f"  Status Real: {status_real}")
-    print(f"  Média: {media:.3f}s | Mínimo: {menor:.3f}s | Máximo: {maior:.3f}s")
-
-    # ===============================================================
-    # Salva no CSV
-    # ===============================================================
-    with open(ARQUIVO_CSV, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            descricao,
-            str(params),
-            status_esperado,
-            status_real,
-            round(media, 3),
-            round(menor, 3),
-            round(maior, 3),
-            "OK" if sucesso else "FALHA"
-        ])
-
-    # ===============================================================
+    resultado = executar_cenario(
+        session, BASE_URL, params, descricao, status_esperado, validar=validar_resposta
+    )
+    registro.gravar(resultado)
+
     # Verifica tempo médio
-    # ===============================================================
     if status_esperado == 200:
-        assert media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({media:.2f}s) em {descricao}"
\ No newline at end of file
+        assert resultado.media < LIMITE_TEMPO_MEDIO, f"Tempo médio alto ({resultado.media:.2f}s) em {descricao}"